@@ -46,7 +46,7 @@ class MemoryAnalytics:
             "total_memories": 0,
             "total_searches": 0,
             "memory_creation_rate": [],
-            "search_patterns": defaultdict(int),
+            "search_patterns": Counter(),
             "popular_tags": Counter(),
             "project_distribution": Counter(),
             "importance_distribution": defaultdict(int),
@@ -82,6 +82,9 @@ class MemoryAnalytics:
                 with open(self.analytics_file, 'r') as f:
                     data = json.load(f)
                     self.metrics.update(data.get("metrics", {}))
+                    # JSON round-trips counters as plain dicts
+                    for key in ("search_patterns", "popular_tags", "project_distribution", "memory_types"):
+                        self.metrics[key] = Counter(self.metrics[key])
                     self.insights = data.get("insights", {})
                     self.last_analysis = data.get("last_analysis")
                     
@@ -142,10 +145,7 @@ class MemoryAnalytics:
             
             # Search insights
             if self.metrics["search_patterns"]:
-                insights["popular_searches"] = dict(
-                    sorted(self.metrics["search_patterns"].items(), 
-                           key=lambda x: x[1], reverse=True)[:10]
-                )
+                insights["popular_searches"] = dict(self.metrics["search_patterns"].most_common(10))
             
             # Memory type insights
             if self.metrics["memory_types"]:
@@ -240,10 +240,7 @@ class MemoryAnalytics:
                     "top_tags": dict(self.metrics["popular_tags"].most_common(5)),
                     "top_projects": dict(self.metrics["project_distribution"].most_common(5)),
                     "memory_types": dict(self.metrics["memory_types"]),
-                    "popular_searches": dict(
-                        sorted(self.metrics["search_patterns"].items(), 
-                               key=lambda x: x[1], reverse=True)[:5]
-                    )
+                    "popular_searches": dict(self.metrics["search_patterns"].most_common(5))
                 },
                 "insights": self.insights,
                 "last_analysis": self.last_analysis,
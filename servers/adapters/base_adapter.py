@@ -2,14 +2,63 @@
 Base adapter for all platforms
 """
 
+import re
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Sequence
 from dataclasses import dataclass
 
+# Optional RE2 backend: linear-time DFA matching for the combined trigger alternations
+try:
+    import re2
+    HAS_RE2 = True
+except ImportError:
+    HAS_RE2 = False
+
+# Optional Aho-Corasick backend: all important keywords matched in one pass
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
 from ...src.config.settings import Settings
 from ...src.services.memory_service import MemoryService
 
 
+def compile_trigger_alternation(patterns: List[str]):
+    """Fold trigger patterns into one case-insensitive alternation, using RE2 when available"""
+    combined = "(?i)" + "|".join(f"(?:{pattern})" for pattern in patterns)
+    if HAS_RE2:
+        return re2.compile(combined)
+    return re.compile(combined)
+
+
+def compile_keyword_automaton(keywords: Sequence[str]):
+    """Build an Aho-Corasick automaton over lowercase keywords; None without pyahocorasick"""
+    if not HAS_AHOCORASICK:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+def count_keywords(content: str, keywords: Sequence[str], automaton, stop_at: int) -> int:
+    """Count distinct keywords found in content (case-insensitive), stopping once stop_at are seen"""
+    content_lower = content.lower()
+    found = set()
+    if automaton is not None:
+        matches = (keyword for _, keyword in automaton.iter(content_lower))
+    else:
+        matches = (keyword for keyword in keywords if keyword in content_lower)
+    for keyword in matches:
+        found.add(keyword)
+        if len(found) >= stop_at:
+            break
+    return len(found)
+
+
 @dataclass
 class PlatformContext:
     """Context information for platform-specific operations"""
@@ -5,7 +5,77 @@ Claude Desktop adapter for MCP Memory Server
 import re
 from typing import Dict, Any, List
 
-from .base_adapter import BaseAdapter, PlatformContext
+from .base_adapter import (
+    BaseAdapter, PlatformContext, compile_keyword_automaton, compile_trigger_alternation, count_keywords
+)
+
+
+# Claude-specific triggers
+CLAUDE_TRIGGER_PATTERNS = [
+    # Conversation triggers
+    r"remember\s+that",  # Remember statements
+    r"important\s+note",  # Important notes
+    r"key\s+point",  # Key points
+    r"takeaway",  # Takeaways
+    r"summary",  # Summaries
+
+    # Knowledge triggers
+    r"fact\s+about",  # Facts
+    r"information\s+about",  # Information
+    r"learned\s+that",  # Learning
+    r"discovered\s+that",  # Discoveries
+    r"found\s+out",  # Findings
+
+    # Decision triggers
+    r"decided\s+to",  # Decisions
+    r"chose\s+to",  # Choices
+    r"opted\s+for",  # Options
+    r"selected",  # Selections
+
+    # Problem-solving triggers
+    r"solution\s+to",  # Solutions
+    r"fix\s+for",  # Fixes
+    r"workaround",  # Workarounds
+    r"resolved",  # Resolutions
+
+    # Code and technical triggers
+    r"code\s+example",  # Code examples
+    r"function\s+to",  # Functions
+    r"algorithm",  # Algorithms
+    r"pattern",  # Patterns
+    r"best\s+practice",  # Best practices
+
+    # Error and debugging triggers
+    r"error\s+was",  # Errors
+    r"bug\s+in",  # Bugs
+    r"issue\s+with",  # Issues
+    r"problem\s+was",  # Problems
+    r"debugging",  # Debugging
+]
+
+# All triggers folded into one alternation so a message is scanned only once
+_CLAUDE_TRIGGER_RE = compile_trigger_alternation(CLAUDE_TRIGGER_PATTERNS)
+
+# Keywords that mark content as worth saving; two or more trigger an auto-save
+_IMPORTANT_KEYWORDS = (
+    "error", "warning", "bug", "fix", "solution", "problem",
+    "decision", "choice", "important", "remember", "note",
+    "knowledge", "fact", "information", "learned", "discovered",
+    "function", "class", "method", "api", "endpoint", "database",
+    "config", "setting", "environment", "deployment", "production",
+    "algorithm", "pattern", "best practice", "workaround", "resolution",
+)
+_IMPORTANT_KEYWORD_AUTOMATON = compile_keyword_automaton(_IMPORTANT_KEYWORDS)
+
+# Content analysis patterns, compiled once instead of on every message
+_CODE_RE = re.compile(r"```[\w]*\n|function\s+\w+|def\s+\w+|class\s+\w+")
+_QUESTION_RE = re.compile(r"\?\s*$|\?\s*\n")
+_ANSWER_RE = re.compile(r"here\s+is|this\s+is|the\s+answer|solution\s+is", re.IGNORECASE)
+_EXPLANATION_RE = re.compile(r"explain|describe|how\s+to|what\s+is", re.IGNORECASE)
+_POSITIVE_TONE_RE = re.compile(r"great|excellent|amazing|wonderful", re.IGNORECASE)
+_NEGATIVE_TONE_RE = re.compile(r"error|problem|issue|bug|fail", re.IGNORECASE)
+_CAUTIOUS_TONE_RE = re.compile(r"however|but|although|nevertheless", re.IGNORECASE)
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
 
 
 class ClaudeAdapter(BaseAdapter):
@@ -55,66 +125,12 @@ class ClaudeAdapter(BaseAdapter):
             if not self.platform_config.get("auto_trigger", True):
                 return False
             
-            # Claude-specific triggers
-            claude_triggers = [
-                # Conversation triggers
-                r"remember\s+that",  # Remember statements
-                r"important\s+note",  # Important notes
-                r"key\s+point",  # Key points
-                r"takeaway",  # Takeaways
-                r"summary",  # Summaries
-                
-                # Knowledge triggers
-                r"fact\s+about",  # Facts
-                r"information\s+about",  # Information
-                r"learned\s+that",  # Learning
-                r"discovered\s+that",  # Discoveries
-                r"found\s+out",  # Findings
-                
-                # Decision triggers
-                r"decided\s+to",  # Decisions
-                r"chose\s+to",  # Choices
-                r"opted\s+for",  # Options
-                r"selected",  # Selections
-                
-                # Problem-solving triggers
-                r"solution\s+to",  # Solutions
-                r"fix\s+for",  # Fixes
-                r"workaround",  # Workarounds
-                r"resolved",  # Resolutions
-                
-                # Code and technical triggers
-                r"code\s+example",  # Code examples
-                r"function\s+to",  # Functions
-                r"algorithm",  # Algorithms
-                r"pattern",  # Patterns
-                r"best\s+practice",  # Best practices
-                
-                # Error and debugging triggers
-                r"error\s+was",  # Errors
-                r"bug\s+in",  # Bugs
-                r"issue\s+with",  # Issues
-                r"problem\s+was",  # Problems
-                r"debugging",  # Debugging
-            ]
-            
-            # Check for Claude-specific patterns
-            for pattern in claude_triggers:
-                if re.search(pattern, content, re.IGNORECASE):
-                    return True
-            
-            # Check for important keywords
-            important_keywords = [
-                "error", "warning", "bug", "fix", "solution", "problem",
-                "decision", "choice", "important", "remember", "note",
-                "knowledge", "fact", "information", "learned", "discovered",
-                "function", "class", "method", "api", "endpoint", "database",
-                "config", "setting", "environment", "deployment", "production",
-                "algorithm", "pattern", "best practice", "workaround", "resolution"
-            ]
+            # Check for Claude-specific patterns in a single pass
+            if _CLAUDE_TRIGGER_RE.search(content):
+                return True
             
-            content_lower = content.lower()
-            keyword_matches = sum(1 for keyword in important_keywords if keyword in content_lower)
+            # Check for important keywords in a single pass
+            keyword_matches = count_keywords(content, _IMPORTANT_KEYWORDS, _IMPORTANT_KEYWORD_AUTOMATON, stop_at=2)
             
             # If multiple important keywords, likely worth saving
             if keyword_matches >= 2:
@@ -210,29 +226,29 @@ class ClaudeAdapter(BaseAdapter):
         
         try:
             # Detect content type
-            if re.search(r"```[\w]*\n|function\s+\w+|def\s+\w+|class\s+\w+", content):
+            if _CODE_RE.search(content):
                 analysis["content_type"] = "code_explanation"
                 analysis["has_code"] = True
-            elif re.search(r"\?\s*$|\?\s*\n", content):
+            elif _QUESTION_RE.search(content):
                 analysis["content_type"] = "question"
                 analysis["has_question"] = True
-            elif re.search(r"here\s+is|this\s+is|the\s+answer|solution\s+is", content, re.IGNORECASE):
+            elif _ANSWER_RE.search(content):
                 analysis["content_type"] = "answer"
                 analysis["has_answer"] = True
-            elif re.search(r"explain|describe|how\s+to|what\s+is", content, re.IGNORECASE):
+            elif _EXPLANATION_RE.search(content):
                 analysis["content_type"] = "explanation"
                 analysis["has_explanation"] = True
             
             # Detect tone
-            if re.search(r"great|excellent|amazing|wonderful", content, re.IGNORECASE):
+            if _POSITIVE_TONE_RE.search(content):
                 analysis["tone"] = "positive"
-            elif re.search(r"error|problem|issue|bug|fail", content, re.IGNORECASE):
+            elif _NEGATIVE_TONE_RE.search(content):
                 analysis["tone"] = "negative"
-            elif re.search(r"however|but|although|nevertheless", content, re.IGNORECASE):
+            elif _CAUTIOUS_TONE_RE.search(content):
                 analysis["tone"] = "cautious"
             
             # Assess complexity
-            sentences = re.split(r'[.!?]+', content)
+            sentences = _SENTENCE_SPLIT_RE.split(content)
             avg_sentence_length = sum(len(s.split()) for s in sentences) / len(sentences) if sentences else 0
             
             if avg_sentence_length > 25:
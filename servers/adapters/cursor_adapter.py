@@ -2,11 +2,139 @@
 Cursor IDE adapter for MCP Memory Server
 """
 
+import hashlib
 import re
+from collections import OrderedDict
 from typing import Dict, Any, List
 
 
-from .base_adapter import BaseAdapter, PlatformContext
+from .base_adapter import (
+    BaseAdapter, PlatformContext, compile_keyword_automaton, compile_trigger_alternation, count_keywords
+)
+
+
+# Cursor-specific triggers
+CURSOR_TRIGGER_PATTERNS = [
+    # Code-related triggers
+    r"function\s+\w+\s*\(",  # Function definitions
+    r"class\s+\w+",  # Class definitions
+    r"def\s+\w+\s*\(",  # Python function definitions
+    r"const\s+\w+",  # JavaScript constants
+    r"let\s+\w+",  # JavaScript variables
+    r"var\s+\w+",  # JavaScript variables
+
+    # Error and debugging triggers
+    r"console\.log",  # Console logs
+    r"print\s*\(",  # Print statements
+    r"debugger",  # Debugger statements
+    r"TODO:",  # TODO comments
+    r"FIXME:",  # FIXME comments
+    r"BUG:",  # BUG comments
+
+    # Important patterns
+    r"remember\s+that",  # Remember statements
+    r"important:",  # Important notes
+    r"note:",  # Notes
+    r"warning:",  # Warnings
+    r"error:",  # Errors
+
+    # Code patterns
+    r"import\s+",  # Import statements
+    r"from\s+\w+\s+import",  # From imports
+    r"require\s*\(",  # Require statements
+    r"export\s+",  # Export statements
+]
+
+# All triggers folded into one alternation so a message is scanned only once
+_CURSOR_TRIGGER_RE = compile_trigger_alternation(CURSOR_TRIGGER_PATTERNS)
+
+# Keywords that mark content as worth saving; two or more trigger an auto-save
+_IMPORTANT_KEYWORDS = (
+    "error", "warning", "bug", "fix", "solution", "problem",
+    "decision", "choice", "important", "remember", "note",
+    "knowledge", "fact", "information", "learned", "discovered",
+    "function", "class", "method", "api", "endpoint", "database",
+    "config", "setting", "environment", "deployment", "production",
+)
+_IMPORTANT_KEYWORD_AUTOMATON = compile_keyword_automaton(_IMPORTANT_KEYWORDS)
+
+# Content analysis patterns, compiled once instead of on every message
+_CODE_DEFINITION_RE = re.compile(r"function\s+\w+\s*\(|def\s+\w+\s*\(|class\s+\w+")
+_DEBUG_STATEMENT_RE = re.compile(r"console\.log|print\s*\(|debugger")
+_TODO_RE = re.compile(r"TODO:|FIXME:|BUG:", re.IGNORECASE)
+_COMMENT_RE = re.compile(r"//|#|/\*|\*/")
+_ERROR_RE = re.compile(r"error|warning|exception", re.IGNORECASE)
+
+# Language detection patterns, checked in order
+_PYTHON_RE = re.compile(r"def\s+\w+|import\s+\w+|from\s+\w+")
+_JAVASCRIPT_RE = re.compile(r"function\s+\w+|const\s+\w+|let\s+\w+")
+_JAVA_RE = re.compile(r"public\s+class|private\s+\w+|System\.out")
+_CPP_RE = re.compile(r"#include|int\s+main|std::")
+
+
+_DEFAULT_ANALYSIS = {
+    "content_type": "unknown",
+    "language": "unknown",
+    "has_code": False,
+    "has_comments": False,
+    "has_errors": False,
+    "has_todos": False,
+    "complexity": "low"
+}
+
+# Content analyses kept for recently seen content, keyed by a short digest of it
+_ANALYSIS_CACHE_SIZE = 128
+_analysis_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+
+
+def _analyze_code(content: str) -> Dict[str, Any]:
+    """Content-derived part of the Cursor analysis, memoized so repeated content is scanned once"""
+    key = hashlib.blake2b(content.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    cached = _analysis_cache.get(key)
+    if cached is not None:
+        _analysis_cache.move_to_end(key)
+        return dict(cached)
+    
+    analysis = dict(_DEFAULT_ANALYSIS)
+    
+    # Detect content type
+    if _CODE_DEFINITION_RE.search(content):
+        analysis["content_type"] = "code_definition"
+        analysis["has_code"] = True
+    elif _DEBUG_STATEMENT_RE.search(content):
+        analysis["content_type"] = "debug_statement"
+        analysis["has_code"] = True
+    elif _TODO_RE.search(content):
+        analysis["content_type"] = "todo_comment"
+        analysis["has_todos"] = True
+    elif _COMMENT_RE.search(content):
+        analysis["content_type"] = "comment"
+        analysis["has_comments"] = True
+    elif _ERROR_RE.search(content):
+        analysis["content_type"] = "error_message"
+        analysis["has_errors"] = True
+    
+    # Detect language
+    if _PYTHON_RE.search(content):
+        analysis["language"] = "python"
+    elif _JAVASCRIPT_RE.search(content):
+        analysis["language"] = "javascript"
+    elif _JAVA_RE.search(content):
+        analysis["language"] = "java"
+    elif _CPP_RE.search(content):
+        analysis["language"] = "cpp"
+    
+    # Assess complexity (count lines without materializing them)
+    line_count = content.count('\n') + 1
+    if line_count > 20:
+        analysis["complexity"] = "high"
+    elif line_count > 10:
+        analysis["complexity"] = "medium"
+    
+    _analysis_cache[key] = analysis
+    if len(_analysis_cache) > _ANALYSIS_CACHE_SIZE:
+        _analysis_cache.popitem(last=False)
+    return dict(analysis)
 
 
 class CursorAdapter(BaseAdapter):
@@ -56,54 +184,12 @@ class CursorAdapter(BaseAdapter):
             if not self.platform_config.get("auto_trigger", True):
                 return False
             
-            # Cursor-specific triggers
-            cursor_triggers = [
-                # Code-related triggers
-                r"function\s+\w+\s*\(",  # Function definitions
-                r"class\s+\w+",  # Class definitions
-                r"def\s+\w+\s*\(",  # Python function definitions
-                r"const\s+\w+",  # JavaScript constants
-                r"let\s+\w+",  # JavaScript variables
-                r"var\s+\w+",  # JavaScript variables
-                
-                # Error and debugging triggers
-                r"console\.log",  # Console logs
-                r"print\s*\(",  # Print statements
-                r"debugger",  # Debugger statements
-                r"TODO:",  # TODO comments
-                r"FIXME:",  # FIXME comments
-                r"BUG:",  # BUG comments
-                
-                # Important patterns
-                r"remember\s+that",  # Remember statements
-                r"important:",  # Important notes
-                r"note:",  # Notes
-                r"warning:",  # Warnings
-                r"error:",  # Errors
-                
-                # Code patterns
-                r"import\s+",  # Import statements
-                r"from\s+\w+\s+import",  # From imports
-                r"require\s*\(",  # Require statements
-                r"export\s+",  # Export statements
-            ]
-            
-            # Check for Cursor-specific patterns
-            for pattern in cursor_triggers:
-                if re.search(pattern, content, re.IGNORECASE):
-                    return True
-            
-            # Check for important keywords
-            important_keywords = [
-                "error", "warning", "bug", "fix", "solution", "problem",
-                "decision", "choice", "important", "remember", "note",
-                "knowledge", "fact", "information", "learned", "discovered",
-                "function", "class", "method", "api", "endpoint", "database",
-                "config", "setting", "environment", "deployment", "production"
-            ]
+            # Check for Cursor-specific patterns in a single pass
+            if _CURSOR_TRIGGER_RE.search(content):
+                return True
             
-            content_lower = content.lower()
-            keyword_matches = sum(1 for keyword in important_keywords if keyword in content_lower)
+            # Check for important keywords in a single pass
+            keyword_matches = count_keywords(content, _IMPORTANT_KEYWORDS, _IMPORTANT_KEYWORD_AUTOMATON, stop_at=2)
             
             # If multiple important keywords, likely worth saving
             if keyword_matches >= 2:
@@ -183,50 +269,8 @@ class CursorAdapter(BaseAdapter):
     
     def _analyze_cursor_content(self, content: str, context: PlatformContext) -> Dict[str, Any]:
         """Analyze content for Cursor-specific patterns"""
-        analysis = {
-            "content_type": "unknown",
-            "language": "unknown",
-            "has_code": False,
-            "has_comments": False,
-            "has_errors": False,
-            "has_todos": False,
-            "complexity": "low"
-        }
-        
         try:
-            # Detect content type
-            if re.search(r"function\s+\w+\s*\(|def\s+\w+\s*\(|class\s+\w+", content):
-                analysis["content_type"] = "code_definition"
-                analysis["has_code"] = True
-            elif re.search(r"console\.log|print\s*\(|debugger", content):
-                analysis["content_type"] = "debug_statement"
-                analysis["has_code"] = True
-            elif re.search(r"TODO:|FIXME:|BUG:", content, re.IGNORECASE):
-                analysis["content_type"] = "todo_comment"
-                analysis["has_todos"] = True
-            elif re.search(r"//|#|/\*|\*/", content):
-                analysis["content_type"] = "comment"
-                analysis["has_comments"] = True
-            elif re.search(r"error|warning|exception", content, re.IGNORECASE):
-                analysis["content_type"] = "error_message"
-                analysis["has_errors"] = True
-            
-            # Detect language
-            if re.search(r"def\s+\w+|import\s+\w+|from\s+\w+", content):
-                analysis["language"] = "python"
-            elif re.search(r"function\s+\w+|const\s+\w+|let\s+\w+", content):
-                analysis["language"] = "javascript"
-            elif re.search(r"public\s+class|private\s+\w+|System\.out", content):
-                analysis["language"] = "java"
-            elif re.search(r"#include|int\s+main|std::", content):
-                analysis["language"] = "cpp"
-            
-            # Assess complexity
-            lines = content.split('\n')
-            if len(lines) > 20:
-                analysis["complexity"] = "high"
-            elif len(lines) > 10:
-                analysis["complexity"] = "medium"
+            analysis = _analyze_code(content)
             
             # Add context metadata
             if context.metadata:
@@ -234,7 +278,7 @@ class CursorAdapter(BaseAdapter):
                 analysis["project_name"] = context.metadata.get("project_name")
             
         except Exception as e:
-            analysis["error"] = str(e)
+            analysis = dict(_DEFAULT_ANALYSIS, error=str(e))
         
         return analysis
     
@@ -3,13 +3,19 @@
 Simple HTTP server for testing MCP Memory Server functionality
 """
 
-import asyncio
 import sys
 import os
-from typing import Dict, Any
+import json
+import time
+import asyncio
+from collections import OrderedDict, defaultdict
+from contextlib import asynccontextmanager
+from typing import Dict, Any, List, Literal, Optional, Tuple
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, Field, ValidationError
 import uvicorn
 
 # Add project root to path
@@ -20,32 +26,118 @@ sys.path.insert(0, project_root)
 from src.config.settings import get_settings  # noqa: E402
 from src.services.memory_service import MemoryService  # noqa: E402
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
-# Create FastAPI app
-app = FastAPI(
-    title="MCP Memory Server - HTTP Test",
-    description="HTTP interface for testing MCP Memory Server functionality",
-    version="2.0.0"
-)
 
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+class OrjsonResponse(JSONResponse):
+    """JSONResponse rendered by orjson"""
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
 
-# Global memory service
-memory_service: MemoryService = None
 
+# Worker processes for __main__; more than one is opt-in (see the search response cache in lifespan)
+HTTP_WORKERS = int(os.getenv("MCP_HTTP_WORKERS", "1"))
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize services on startup"""
-    global memory_service
-    
+# Rendered /memory/search responses kept per process, and for how many seconds; writes from
+# other processes are only seen once an entry expires, so the TTL stays short
+SEARCH_RESPONSE_CACHE_SIZE = int(os.getenv("MCP_HTTP_SEARCH_CACHE_SIZE", "256"))
+SEARCH_RESPONSE_CACHE_TTL = float(os.getenv("MCP_HTTP_SEARCH_CACHE_TTL", "5"))
+
+# Endpoints with large payloads return this directly, skipping FastAPI's jsonable_encoder pass
+ResponseClass = OrjsonResponse if HAS_ORJSON else JSONResponse
+
+
+class CreateMemoryRequest(BaseModel):
+    """Body of POST /memory, field names match MemoryService.create_memory"""
+    content: str
+    project: str = "default"
+    importance: float = 0.5
+    tags: List[str] = Field(default_factory=list)
+    metadata: Dict[str, Any] = Field(default_factory=dict)
+    context: Dict[str, Any] = Field(default_factory=dict)
+
+
+class SearchMemoryRequest(BaseModel):
+    """Body of POST /memory/search, field names match MemoryService.search_memories"""
+    query: str
+    project: Optional[str] = None
+    max_results: int = 20
+    similarity_threshold: float = 0.3
+    tags: List[str] = Field(default_factory=list)
+
+
+class AutoSaveRequest(BaseModel):
+    """Body of POST /memory/auto-save, field names match MemoryService.auto_save_memory"""
+    content: str
+    context: Dict[str, Any] = Field(default_factory=dict)
+    project: str = "default"
+
+
+def _search_cache_key(search_data: SearchMemoryRequest) -> Tuple:
+    """Exact-match key of a search request in the response cache"""
+    return (
+        search_data.query,
+        search_data.project,
+        search_data.max_results,
+        search_data.similarity_threshold,
+        tuple(search_data.tags)
+    )
+
+
+class BatchItem(BaseModel):
+    """One operation of POST /batch; payload holds the matching request body"""
+    op: Literal["save", "search"]
+    payload: Dict[str, Any]
+
+
+def _created_memory_payload(memory) -> Dict[str, Any]:
+    """Response fields for a newly created memory"""
+    return {
+        "id": memory.id,
+        "project": memory.project,
+        "content": memory.content,
+        "importance": memory.importance,
+        "tags": memory.tags,
+        "created_at": memory.created_at.isoformat()
+    }
+
+
+def _search_result_item(memory) -> Dict[str, Any]:
+    """Response fields for one search result"""
+    return {
+        "id": memory.id,
+        "project": memory.project,
+        "content": memory.content,
+        "importance": memory.importance,
+        "similarity_score": getattr(memory, 'similarity_score', None),
+        "created_at": memory.created_at.isoformat()
+    }
+
+
+def _search_results_payload(results) -> Dict[str, Any]:
+    """Response body for a list of search results"""
+    return {
+        "success": True,
+        "count": len(results),
+        "memories": [_search_result_item(memory) for memory in results]
+    }
+
+
+def _ndjson_line(obj: Any) -> bytes:
+    """One newline-terminated JSON record"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj) + b"\n"
+    return json.dumps(obj).encode("utf-8") + b"\n"
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize the memory service once and share it through app.state"""
     print("🚀 Starting MCP Memory Server HTTP Test...")
     
     try:
@@ -54,8 +146,14 @@ async def startup_event():
         print(f"✅ Settings loaded: {settings.server.name}")
         
         # Initialize memory service
-        memory_service = MemoryService(settings)
-        await memory_service.initialize()
+        app.state.memory_service = MemoryService(settings)
+        await app.state.memory_service.initialize()
+        
+        # Exact repeats of a search: key -> (service cache generation, timestamp, rendered body)
+        app.state.search_responses = OrderedDict()
+        # The cache is per process and only sees this worker's writes, so it is off with multiple workers
+        app.state.search_response_limit = 0 if HTTP_WORKERS > 1 else SEARCH_RESPONSE_CACHE_SIZE
+        app.state.search_response_ttl = SEARCH_RESPONSE_CACHE_TTL
         
         print("✅ Memory service initialized successfully")
         print("🌐 HTTP server ready at http://localhost:8000")
@@ -63,6 +161,27 @@ async def startup_event():
     except Exception as e:
         print(f"❌ Failed to initialize: {e}")
         raise
+    
+    yield
+
+
+# Create FastAPI app
+app = FastAPI(
+    title="MCP Memory Server - HTTP Test",
+    description="HTTP interface for testing MCP Memory Server functionality",
+    version="2.0.0",
+    lifespan=lifespan,
+    default_response_class=ResponseClass
+)
+
+# Add CORS middleware
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
 
 
 @app.get("/")
@@ -77,61 +196,49 @@ async def root():
             "status": "/status",
             "create_memory": "/memory (POST)",
             "search_memories": "/memory/search (POST)",
+            "search_memories_stream": "/memory/search/stream (POST, NDJSON)",
             "list_memories": "/memory/list (GET)",
             "get_memory": "/memory/{id} (GET)",
-            "auto_save": "/memory/auto-save (POST)"
+            "auto_save": "/memory/auto-save (POST)",
+            "batch": "/batch (POST)"
         }
     }
 
 
 @app.get("/health")
-async def health_check():
+async def health_check(request: Request):
     """Health check endpoint"""
     try:
-        health = await memory_service.health_check()
+        health = await request.app.state.memory_service.health_check()
         return {
             "status": "healthy",
             "memory_service": health,
-            "timestamp": asyncio.get_event_loop().time()
+            "timestamp": time.time()
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Health check failed: {e}")
 
 
 @app.get("/status")
-async def get_status():
+async def get_status(request: Request):
     """Get memory system status"""
     try:
-        status = await memory_service.get_status()
+        status = await request.app.state.memory_service.get_status()
         return status
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get status: {e}")
 
 
 @app.post("/memory")
-async def create_memory(memory_data: Dict[str, Any]):
+async def create_memory(request: Request, memory_data: CreateMemoryRequest):
     """Create a new memory"""
     try:
-        memory = await memory_service.create_memory(
-            content=memory_data["content"],
-            project=memory_data.get("project", "default"),
-            importance=memory_data.get("importance", 0.5),
-            tags=memory_data.get("tags", []),
-            metadata=memory_data.get("metadata", {}),
-            context=memory_data.get("context", {})
-        )
+        memory = await request.app.state.memory_service.create_memory(**memory_data.model_dump())
         
         return {
             "success": True,
             "message": "Memory created successfully",
-            "memory": {
-                "id": memory.id,
-                "project": memory.project,
-                "content": memory.content,
-                "importance": memory.importance,
-                "tags": memory.tags,
-                "created_at": memory.created_at.isoformat()
-            }
+            "memory": _created_memory_payload(memory)
         }
         
     except Exception as e:
@@ -139,52 +246,126 @@ async def create_memory(memory_data: Dict[str, Any]):
 
 
 @app.post("/memory/search")
-async def search_memories(search_data: Dict[str, Any]):
-    """Search memories"""
+async def search_memories(request: Request, search_data: SearchMemoryRequest):
+    """Search memories, answering exact repeats from the response cache"""
+    state = request.app.state
+    cache_key = _search_cache_key(search_data)
+    # Read before searching so a write that lands mid-search leaves the entry stale
+    generation = state.memory_service.search_cache_generation
+    
+    cached = state.search_responses.get(cache_key)
+    if (
+        cached is not None
+        and cached[0] == generation
+        and time.time() - cached[1] < state.search_response_ttl
+    ):
+        state.search_responses.move_to_end(cache_key)
+        return Response(content=cached[2], media_type="application/json", headers={"X-Cache": "HIT"})
+    
     try:
-        results = await memory_service.search_memories(
-            query=search_data["query"],
-            project=search_data.get("project"),
-            max_results=search_data.get("max_results", 20),
-            similarity_threshold=search_data.get("similarity_threshold", 0.3),
-            tags=search_data.get("tags", [])
-        )
-        
-        return {
-            "success": True,
-            "count": len(results),
-            "memories": [
-                {
-                    "id": memory.id,
-                    "project": memory.project,
-                    "content": memory.content,
-                    "importance": memory.importance,
-                    "similarity_score": getattr(memory, 'similarity_score', None),
-                    "created_at": memory.created_at.isoformat()
-                }
-                for memory in results
-            ]
-        }
+        results = await state.memory_service.search_memories(**search_data.model_dump())
+        response = ResponseClass(_search_results_payload(results), headers={"X-Cache": "MISS"})
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to search memories: {e}")
+    
+    if state.search_response_limit > 0:
+        state.search_responses[cache_key] = (generation, time.time(), response.body)
+        state.search_responses.move_to_end(cache_key)
+        if len(state.search_responses) > state.search_response_limit:
+            state.search_responses.popitem(last=False)
+    
+    return response
+
+
+@app.post("/batch")
+async def batch(request: Request, items: List[BatchItem]):
+    """Run several save and search operations in one request"""
+    memory_service = request.app.state.memory_service
+    results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+    
+    # Searches sharing project and tags go through one batched embedding call
+    saves: List[Tuple[int, CreateMemoryRequest]] = []
+    search_groups: Dict[Tuple, List[Tuple[int, SearchMemoryRequest]]] = defaultdict(list)
+    for index, item in enumerate(items):
+        try:
+            if item.op == "save":
+                saves.append((index, CreateMemoryRequest(**item.payload)))
+            else:
+                search = SearchMemoryRequest(**item.payload)
+                search_groups[(search.project, tuple(search.tags))].append((index, search))
+        except ValidationError as e:
+            results[index] = {"success": False, "error": str(e)}
+    
+    # Saves stay one create_memory each so every item reports whether it was stored; a shared
+    # ordered insert_many can persist a prefix and still fail the whole call
+    groups = list(search_groups.items())
+    outcomes = await asyncio.gather(
+        *[memory_service.create_memory(**save.model_dump()) for _, save in saves],
+        *[
+            memory_service.search_memories_batch(
+                queries=[search.query for _, search in group],
+                project=project,
+                max_results=[search.max_results for _, search in group],
+                similarity_thresholds=[search.similarity_threshold for _, search in group],
+                tags=list(tags)
+            )
+            for (project, tags), group in groups
+        ],
+        return_exceptions=True
+    )
+    
+    for (index, _), outcome in zip(saves, outcomes):
+        if isinstance(outcome, Exception):
+            results[index] = {"success": False, "error": f"Failed to create memory: {outcome}"}
+        else:
+            results[index] = {"success": True, "memory": _created_memory_payload(outcome)}
+    
+    for (_, group), outcome in zip(groups, outcomes[len(saves):]):
+        for position, (index, _) in enumerate(group):
+            if isinstance(outcome, Exception):
+                results[index] = {"success": False, "error": f"Failed to search memories: {outcome}"}
+            else:
+                results[index] = _search_results_payload(outcome[position])
+    
+    return ResponseClass({
+        "success": all(result["success"] for result in results),
+        "count": len(results),
+        "results": results
+    })
+
+
+@app.post("/memory/search/stream")
+async def search_memories_stream(request: Request, search_data: SearchMemoryRequest):
+    """Search memories, streaming one NDJSON line per result"""
+    try:
+        results = await request.app.state.memory_service.search_memories(**search_data.model_dump())
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to search memories: {e}")
+    
+    def lines():
+        for memory in results:
+            yield _ndjson_line(_search_result_item(memory))
+    
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
 
 
 @app.get("/memory/list")
 async def list_memories(
+    request: Request,
     project: str = "default",
     limit: int = 50,
     offset: int = 0
 ):
     """List memories for a project"""
     try:
-        memories = await memory_service.list_memories(
+        memories = await request.app.state.memory_service.list_memories(
             project=project,
             limit=limit,
             offset=offset
         )
         
-        return {
+        return ResponseClass({
             "success": True,
             "count": len(memories),
             "memories": [
@@ -197,17 +378,17 @@ async def list_memories(
                 }
                 for memory in memories
             ]
-        }
+        })
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to list memories: {e}")
 
 
 @app.get("/memory/{memory_id}")
-async def get_memory(memory_id: str):
+async def get_memory(request: Request, memory_id: str):
     """Get a specific memory"""
     try:
-        memory = await memory_service.get_memory(memory_id)
+        memory = await request.app.state.memory_service.get_memory(memory_id)
         
         if not memory:
             raise HTTPException(status_code=404, detail="Memory not found")
@@ -233,14 +414,10 @@ async def get_memory(memory_id: str):
 
 
 @app.post("/memory/auto-save")
-async def auto_save_memory(auto_save_data: Dict[str, Any]):
+async def auto_save_memory(request: Request, auto_save_data: AutoSaveRequest):
     """Auto-save memory if content triggers threshold"""
     try:
-        result = await memory_service.auto_save_memory(
-            content=auto_save_data["content"],
-            context=auto_save_data.get("context", {}),
-            project=auto_save_data.get("project", "default")
-        )
+        result = await request.app.state.memory_service.auto_save_memory(**auto_save_data.model_dump())
         
         return {
             "success": True,
@@ -256,10 +433,10 @@ async def auto_save_memory(auto_save_data: Dict[str, Any]):
 
 
 @app.get("/metrics")
-async def get_metrics():
+async def get_metrics(request: Request):
     """Get system metrics"""
     try:
-        metrics = await memory_service.get_metrics()
+        metrics = await request.app.state.memory_service.get_metrics()
         return {
             "success": True,
             "metrics": metrics
@@ -272,10 +449,14 @@ if __name__ == "__main__":
     print("🚀 MCP Memory Server - HTTP Test Server")
     print("=" * 50)
     
-    # Run the server
+    # Run the server; an import string lets uvicorn start one app per worker process.
+    # loop/http "auto" pick uvloop and httptools whenever they are installed.
     uvicorn.run(
-        app,
+        "servers.http_server:app",
         host="0.0.0.0",
         port=8000,
+        loop="auto",
+        http="auto",
+        workers=HTTP_WORKERS,
         log_level="info"
     ) 
\ No newline at end of file
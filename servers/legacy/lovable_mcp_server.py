@@ -5,6 +5,7 @@ Optimized for Lovable AI-powered development platform with design focus
 """
 
 import asyncio
+import heapq
 import os
 import sys
 from pathlib import Path
@@ -437,9 +438,10 @@ class LovableMCPServer(MCPMemoryServer):
             ]
         
         if technology:
+            technology_lower = technology.lower()
             filtered_memories = [
                 memory for memory in filtered_memories
-                if technology.lower() in ' '.join(memory.get('context', {}).get('tags', [])).lower()
+                if technology_lower in ' '.join(memory.get('context', {}).get('tags', [])).lower()
             ]
         
         # Perform search
@@ -465,9 +467,8 @@ class LovableMCPServer(MCPMemoryServer):
                         "score": final_score
                     })
         
-        # Sort by score
-        results.sort(key=lambda x: x['score'], reverse=True)
-        results = results[:5]  # Top 5
+        # Top 5 by score
+        results = heapq.nlargest(5, results, key=lambda x: x['score'])
         
         if not results:
             return [TextContent(type="text", text=f"💙 No design patterns found for query: '{query}'")]
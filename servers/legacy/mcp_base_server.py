@@ -5,9 +5,11 @@ Implements the standard MCP protocol for all integrations
 """
 
 import asyncio
+import heapq
 import os
 import sys
 import time
+from collections import Counter
 from typing import Any, Dict, List
 from pathlib import Path
 
@@ -347,9 +349,8 @@ class MCPMemoryServer:
                         "final_score": final_score
                     })
         
-        # Sort by final score
-        results.sort(key=lambda x: x['final_score'], reverse=True)
-        results = results[:limit]
+        # Top results by final score
+        results = heapq.nlargest(limit, results, key=lambda x: x['final_score'])
         
         self.stats['searches'] += 1
         
@@ -439,14 +440,11 @@ class MCPMemoryServer:
         result += f"   🤖 ML Model loaded: {'✅ Yes' if self.ml_model else '❌ No'}\n\n"
         
         # Category breakdown
-        categories = {}
-        for memory in self.memories.values():
-            cat = memory.get('category', 'general')
-            categories[cat] = categories.get(cat, 0) + 1
+        categories = Counter(memory.get('category', 'general') for memory in self.memories.values())
         
         if categories:
             result += "**Categories:**\n"
-            for cat, count in categories.items():
+            for cat, count in categories.most_common():
                 result += f"   {cat}: {count} memories\n"
         
         return [TextContent(type="text", text=result)]
@@ -466,9 +464,8 @@ class MCPMemoryServer:
         if tag_filter:
             memories = [m for m in memories if tag_filter in m.get('tags', [])]
         
-        # Sort by timestamp (newest first)
-        memories.sort(key=lambda x: x.get('timestamp', 0), reverse=True)
-        memories = memories[:limit]
+        # Newest first
+        memories = heapq.nlargest(limit, memories, key=lambda x: x.get('timestamp', 0))
         
         if not memories:
             return [TextContent(type="text", text="📚 No memories found matching the criteria")]
@@ -20,6 +20,27 @@ try:
 except ImportError:
     pass
 
+# Optional fast JSON codec for the stdio JSON-RPC loop
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def encode_message(message) -> bytes:
+    """Serialize a JSON-RPC message to a newline-terminated UTF-8 line"""
+    if HAS_ORJSON:
+        return orjson.dumps(message) + b"\n"
+    return (json.dumps(message) + "\n").encode("utf-8")
+
+
+def write_message(payload: bytes) -> None:
+    """Write an encoded JSON-RPC message to stdout"""
+    sys.stdout.flush()
+    sys.stdout.buffer.write(payload)
+    sys.stdout.buffer.flush()
+
 # Setup comprehensive logging system
 def setup_logging():
     """Setup professional logging system for MCP Memory Server"""
@@ -70,6 +91,56 @@ logger = setup_logging()
 # Environment-based configuration
 PROJECT_NAME = os.getenv("PROJECT_NAME", "default")
 DATABASE_NAME = os.getenv("DATABASE_NAME", "mcp_memory")
+# Upper bound on requests handled at once, so bursts don't thrash MongoDB and the embedding model
+MAX_CONCURRENT_REQUESTS = int(os.getenv("MAX_CONCURRENT_REQUESTS", "8"))
+# Longest stdin request line accepted; asyncio's 64 KiB default is too small for bulk saves
+STDIN_LINE_LIMIT = int(os.getenv("STDIN_LINE_LIMIT", str(16 * 1024 * 1024)))
+
+
+async def read_request_line(reader: asyncio.StreamReader):
+    """Read one request line; b"" at EOF, None if the line exceeded the limit and was dropped"""
+    try:
+        return await reader.readuntil(b"\n")
+    except asyncio.IncompleteReadError as e:
+        return e.partial
+    except asyncio.LimitOverrunError as e:
+        consumed = e.consumed
+    # Discard the oversized line up to and including its newline
+    while True:
+        await reader.readexactly(consumed)
+        try:
+            await reader.readuntil(b"\n")
+            return None
+        except asyncio.IncompleteReadError:
+            return None
+        except asyncio.LimitOverrunError as e:
+            consumed = e.consumed
+
+
+def read_request_line_blocking(stream):
+    """Blocking read_request_line for stdin the event loop cannot watch"""
+    line = stream.readline(STDIN_LINE_LIMIT + 1)
+    if len(line) <= STDIN_LINE_LIMIT or line.endswith(b"\n"):
+        return line
+    # Discard the oversized line up to and including its newline
+    while line and not line.endswith(b"\n"):
+        line = stream.readline(STDIN_LINE_LIMIT)
+    return None
+
+
+async def open_stdin_lines():
+    """Return a coroutine function reading request lines from stdin, as read_request_line does"""
+    loop = asyncio.get_running_loop()
+    if sys.platform != "win32":
+        reader = asyncio.StreamReader(limit=STDIN_LINE_LIMIT)
+        try:
+            await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+            return lambda: read_request_line(reader)
+        except (ValueError, OSError, NotImplementedError) as e:
+            logger.debug(f"stdin is not a pipe ({e}), reading it on a worker thread")
+    # Regular files and Windows stdio cannot be pipe transports
+    return lambda: loop.run_in_executor(None, read_request_line_blocking, sys.stdin.buffer)
+
 
 def initialize_full_memory_server():
     """Initialize the full memory server with environment variables"""
@@ -114,300 +185,333 @@ async def async_main():
             print(f"Failed to initialize memory service: {e}", file=sys.stderr)
             has_full_server = False
 
-    try:
-        logger.info("📡 Starting MCP message processing loop")
-        for line in sys.stdin:
-            try:
-                request = json.loads(line.strip())
-                method = request.get("method")
-                request_id = request.get("id")
-
-                logger.debug(f"📨 Received MCP request: {method} (ID: {request_id})")
-
-                if method == "initialize":
-                    logger.info("🚀 INITIALIZE request received")
-                    logger.info(f"   Request ID: {request_id}")
-                    logger.info(f"   Full server available: {has_full_server}")
-                    response = {
-                        "jsonrpc": "2.0",
-                        "id": request_id,
-                        "result": {
-                            "protocolVersion": "2024-11-05",
-                            "capabilities": {
-                                "tools": {},
-                                "resources": {},
-                                "prompts": {}
-                            },
-                            "serverInfo": {
-                                "name": "memory-server",
-                                "version": "1.0.0",
-                                "description": "Memory server for Cursor IDE" + (" (Full)" if has_full_server else " (Simple)")
-                            }
+    async def handle_line(raw_line: bytes) -> None:
+        """Parse, dispatch and answer one JSON-RPC line"""
+        try:
+            request = orjson.loads(raw_line) if HAS_ORJSON else json.loads(raw_line)
+            method = request.get("method")
+            request_id = request.get("id")
+
+            logger.debug(f"📨 Received MCP request: {method} (ID: {request_id})")
+
+            if method == "initialize":
+                logger.info("🚀 INITIALIZE request received")
+                logger.info(f"   Request ID: {request_id}")
+                logger.info(f"   Full server available: {has_full_server}")
+                response = {
+                    "jsonrpc": "2.0",
+                    "id": request_id,
+                    "result": {
+                        "protocolVersion": "2024-11-05",
+                        "capabilities": {
+                            "tools": {},
+                            "resources": {},
+                            "prompts": {}
+                        },
+                        "serverInfo": {
+                            "name": "memory-server",
+                            "version": "1.0.0",
+                            "description": "Memory server for Cursor IDE" + (" (Full)" if has_full_server else " (Simple)")
                         }
                     }
-                    
-                elif method == "tools/list":
-                    response = {
-                        "jsonrpc": "2.0",
-                        "id": request_id,
-                        "result": {
-                            "tools": [
-                                {
-                                    "name": "save_memory",
-                                    "description": "Save important information to memory",
-                                    "inputSchema": {
-                                        "type": "object",
-                                        "properties": {
-                                            "content": {
-                                                "type": "string",
-                                                "description": "Information to save"
-                                            },
-                                            "project": {
-                                                "type": "string",
-                                                "description": "Project name",
-                                                "default": "default"
-                                            },
-                                            "importance": {
-                                                "type": "number",
-                                                "description": "Importance (0.0-1.0)",
-                                                "default": 0.7
-                                            }
+                }
+                
+            elif method == "tools/list":
+                response = {
+                    "jsonrpc": "2.0",
+                    "id": request_id,
+                    "result": {
+                        "tools": [
+                            {
+                                "name": "save_memory",
+                                "description": "Save important information to memory",
+                                "inputSchema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "content": {
+                                            "type": "string",
+                                            "description": "Information to save"
                                         },
-                                        "required": ["content"]
-                                    }
-                                },
-                                {
-                                    "name": "search_memories",
-                                    "description": "Search for relevant memories",
-                                    "inputSchema": {
-                                        "type": "object",
-                                        "properties": {
-                                            "query": {
-                                                "type": "string",
-                                                "description": "Search query"
-                                            },
-                                            "max_results": {
-                                                "type": "integer",
-                                                "description": "Max results",
-                                                "default": 5
-                                            }
+                                        "project": {
+                                            "type": "string",
+                                            "description": "Project name",
+                                            "default": "default"
                                         },
-                                        "required": ["query"]
-                                    }
-                                },
-                                {
-                                    "name": "list_memories",
-                                    "description": "List all saved memories",
-                                    "inputSchema": {
-                                        "type": "object",
-                                        "properties": {},
-                                        "additionalProperties": False
-                                    }
-                                },
-                                {
-                                    "name": "memory_status",
-                                    "description": "Check memory system status",
-                                    "inputSchema": {
-                                        "type": "object",
-                                        "properties": {},
-                                        "additionalProperties": False
-                                    }
+                                        "importance": {
+                                            "type": "number",
+                                            "description": "Importance (0.0-1.0)",
+                                            "default": 0.7
+                                        }
+                                    },
+                                    "required": ["content"]
                                 }
-                            ]
-                        }
+                            },
+                            {
+                                "name": "search_memories",
+                                "description": "Search for relevant memories",
+                                "inputSchema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "query": {
+                                            "type": "string",
+                                            "description": "Search query"
+                                        },
+                                        "max_results": {
+                                            "type": "integer",
+                                            "description": "Max results",
+                                            "default": 5
+                                        }
+                                    },
+                                    "required": ["query"]
+                                }
+                            },
+                            {
+                                "name": "list_memories",
+                                "description": "List all saved memories",
+                                "inputSchema": {
+                                    "type": "object",
+                                    "properties": {},
+                                    "additionalProperties": False
+                                }
+                            },
+                            {
+                                "name": "memory_status",
+                                "description": "Check memory system status",
+                                "inputSchema": {
+                                    "type": "object",
+                                    "properties": {},
+                                    "additionalProperties": False
+                                }
+                            }
+                        ]
                     }
-                    
-                elif method == "prompts/list":
-                    response = {
-                        "jsonrpc": "2.0",
-                        "id": request_id,
-                        "result": {
-                            "prompts": []
-                        }
+                }
+                
+            elif method == "prompts/list":
+                response = {
+                    "jsonrpc": "2.0",
+                    "id": request_id,
+                    "result": {
+                        "prompts": []
                     }
+                }
+                
+            elif method == "tools/call":
+                params = request.get("params", {})
+                tool_name = params.get("name")
+                arguments = params.get("arguments", {})
+
+                # Log tool call start
+                logger.info("🔧 MCP TOOL CALL START")
+                logger.info(f"   Tool: {tool_name}")
+                logger.info(f"   Arguments: {json.dumps(arguments, indent=2)}")
+                logger.info(f"   Request ID: {request_id}")
+                logger.info(f"   Full Server Mode: {has_full_server}")
+
+                start_time = datetime.now()
+                
+                if tool_name == "save_memory":
+                    content = arguments.get("content", "")
+                    project = arguments.get("project", PROJECT_NAME)
+                    importance = arguments.get("importance", 0.7)
+
+                    logger.info("💾 SAVE_MEMORY Processing")
+                    logger.info(f"   Content length: {len(content)} chars")
+                    logger.info(f"   Content preview: {content[:100]}{'...' if len(content) > 100 else ''}")
+                    logger.info(f"   Project: {project}")
+                    logger.info(f"   Importance: {importance}")
+
+                    try:
+                        logger.info("   Using FULL SERVER mode")
+                        # Use full server (required)
+                        result = await full_server._handle_save_memory(arguments)
+                        result_text = result[0].text if result else "Memory saved with full server"
+                        logger.info("   ✅ Full server SUCCESS")
+                        logger.info(f"   Result: {result_text[:200]}{'...' if len(result_text) > 200 else ''}")
+                    except Exception as e:
+                        # No fallback - full server is required
+                        logger.error(f"   ❌ Full server FAILED: {str(e)}")
+                        logger.error(f"   Traceback: {traceback.format_exc()}")
+                        result_text = f"❌ Error saving memory: {str(e)}"
                     
-                elif method == "tools/call":
-                    params = request.get("params", {})
-                    tool_name = params.get("name")
-                    arguments = params.get("arguments", {})
-
-                    # Log tool call start
-                    logger.info("🔧 MCP TOOL CALL START")
-                    logger.info(f"   Tool: {tool_name}")
-                    logger.info(f"   Arguments: {json.dumps(arguments, indent=2)}")
-                    logger.info(f"   Request ID: {request_id}")
-                    logger.info(f"   Full Server Mode: {has_full_server}")
-
-                    start_time = datetime.now()
+                elif tool_name == "search_memories":
+                    query = arguments.get("query", "")
+                    max_results = arguments.get("max_results", 5)
+                    similarity_threshold = arguments.get("similarity_threshold", 0.3)
+                    project = arguments.get("project", PROJECT_NAME)
+
+                    logger.info("🔍 SEARCH_MEMORIES Processing")
+                    logger.info(f"   Query: '{query}'")
+                    logger.info(f"   Max results: {max_results}")
+                    logger.info(f"   Similarity threshold: {similarity_threshold}")
+                    logger.info(f"   Project filter: {project}")
+
+                    try:
+                        logger.info("   Using FULL SERVER mode")
+                        # Use full server (required)
+                        result = await full_server._handle_search_memories(arguments)
+                        result_text = result[0].text if result else "Search completed with full server"
+                        logger.info("   ✅ Full server SUCCESS")
+                        logger.info(f"   Result: {result_text[:300]}{'...' if len(result_text) > 300 else ''}")
+                    except Exception as e:
+                        # No fallback - full server is required
+                        logger.error(f"   ❌ Full server FAILED: {str(e)}")
+                        logger.error(f"   Traceback: {traceback.format_exc()}")
+                        result_text = f"❌ Error searching memories: {str(e)}"
                     
-                    if tool_name == "save_memory":
-                        content = arguments.get("content", "")
-                        project = arguments.get("project", PROJECT_NAME)
-                        importance = arguments.get("importance", 0.7)
-
-                        logger.info("💾 SAVE_MEMORY Processing")
-                        logger.info(f"   Content length: {len(content)} chars")
-                        logger.info(f"   Content preview: {content[:100]}{'...' if len(content) > 100 else ''}")
-                        logger.info(f"   Project: {project}")
-                        logger.info(f"   Importance: {importance}")
-
-                        try:
-                            logger.info("   Using FULL SERVER mode")
-                            # Use full server (required)
-                            result = await full_server._handle_save_memory(arguments)
-                            result_text = result[0].text if result else "Memory saved with full server"
-                            logger.info("   ✅ Full server SUCCESS")
-                            logger.info(f"   Result: {result_text[:200]}{'...' if len(result_text) > 200 else ''}")
-                        except Exception as e:
-                            # No fallback - full server is required
-                            logger.error(f"   ❌ Full server FAILED: {str(e)}")
-                            logger.error(f"   Traceback: {traceback.format_exc()}")
-                            result_text = f"❌ Error saving memory: {str(e)}"
-                        
-                    elif tool_name == "search_memories":
-                        query = arguments.get("query", "")
-                        max_results = arguments.get("max_results", 5)
-                        similarity_threshold = arguments.get("similarity_threshold", 0.3)
-                        project = arguments.get("project", PROJECT_NAME)
-
-                        logger.info("🔍 SEARCH_MEMORIES Processing")
-                        logger.info(f"   Query: '{query}'")
-                        logger.info(f"   Max results: {max_results}")
-                        logger.info(f"   Similarity threshold: {similarity_threshold}")
-                        logger.info(f"   Project filter: {project}")
-
-                        try:
-                            logger.info("   Using FULL SERVER mode")
-                            # Use full server (required)
-                            result = await full_server._handle_search_memories(arguments)
-                            result_text = result[0].text if result else "Search completed with full server"
-                            logger.info("   ✅ Full server SUCCESS")
-                            logger.info(f"   Result: {result_text[:300]}{'...' if len(result_text) > 300 else ''}")
-                        except Exception as e:
-                            # No fallback - full server is required
-                            logger.error(f"   ❌ Full server FAILED: {str(e)}")
-                            logger.error(f"   Traceback: {traceback.format_exc()}")
-                            result_text = f"❌ Error searching memories: {str(e)}"
-                        
-                    elif tool_name == "list_memories":
-                        logger.info("📚 LIST_MEMORIES Processing")
-
-                        try:
-                            logger.info("   Using FULL SERVER mode")
-                            # Use full server to list memories
-                            from src.services.database_service import database_service
-
-                            # Get all memories directly from database
-                            memories = await database_service.get_project_memories(
-                                project=PROJECT_NAME,  # Use environment project name
-                                limit=1000  # Increased limit to show all memories
-                            )
-
-                            logger.info(f"   Retrieved {len(memories)} memories from database")
-
-                            if memories:
-                                memories_text = []
-                                embeddings_count = 0
-                                for memory in memories:
-                                    content_preview = memory.content[:100] + "..." if len(memory.content) > 100 else memory.content
-                                    has_embedding = "✅" if memory.embedding else "❌"
-                                    if memory.embedding:
-                                        embeddings_count += 1
-                                    embedding_info = f" (embedding: {has_embedding})"
-                                    memories_text.append(f"- {memory.id}: {content_preview}{embedding_info}")
-                                result_text = f"📚 {len(memories)} memories stored:\n" + "\n".join(memories_text)
-                                logger.info(f"   ✅ Full server SUCCESS: {len(memories)} memories, {embeddings_count} with embeddings")
-                            else:
-                                result_text = "📚 No memories stored yet"
-                                logger.info("   ✅ Full server SUCCESS: No memories found")
-                        except Exception as e:
-                            result_text = f"📚 Error listing memories: {str(e)}"
-                            logger.error(f"   ❌ Full server FAILED: {str(e)}")
-                            logger.error(f"   Traceback: {traceback.format_exc()}")
-                        
-                    elif tool_name == "memory_status":
-                        logger.info("🧠 MEMORY_STATUS Processing")
-                        try:
-                            from src.services.database_service import database_service
-                            memory_count = await database_service.get_memory_count(project=PROJECT_NAME)
-                            result_text = f"🧠 Memory System Status:\n- Mode: Full Server\n- Project: {PROJECT_NAME}\n- Database: {DATABASE_NAME}\n- Memories stored: {memory_count}\n- Working directory: {os.getcwd()}"
-                        except Exception as e:
-                            result_text = f"🧠 Memory System Status:\n- Mode: Full Server\n- Project: {PROJECT_NAME}\n- Database: {DATABASE_NAME}\n- Error getting count: {str(e)}\n- Working directory: {os.getcwd()}"
-                        logger.info("   ✅ Status retrieved successfully")
-
-                    else:
-                        logger.warning(f"❓ UNKNOWN TOOL: {tool_name}")
-                        result_text = f"Unknown tool: {tool_name}"
-
-                    # Calculate execution time
-                    end_time = datetime.now()
-                    execution_time = (end_time - start_time).total_seconds() * 1000  # ms
-
-                    # Log completion
-                    logger.info("🏁 MCP TOOL CALL COMPLETE")
-                    logger.info(f"   Tool: {tool_name}")
-                    logger.info(f"   Execution time: {execution_time:.2f}ms")
-                    logger.info(f"   Response length: {len(result_text)} chars")
-                    logger.info(f"   Response preview: {result_text[:150]}{'...' if len(result_text) > 150 else ''}")
-
-                    response = {
-                        "jsonrpc": "2.0",
-                        "id": request_id,
-                        "result": {
-                            "content": [
-                                {
-                                    "type": "text",
-                                    "text": result_text
-                                }
-                            ]
-                        }
-                    }
+                elif tool_name == "list_memories":
+                    logger.info("📚 LIST_MEMORIES Processing")
+
+                    try:
+                        logger.info("   Using FULL SERVER mode")
+                        # Use full server to list memories
+                        from src.services.database_service import database_service
+
+                        # Get all memories directly from database
+                        memories = await database_service.get_project_memories(
+                            project=PROJECT_NAME,  # Use environment project name
+                            limit=1000  # Increased limit to show all memories
+                        )
+
+                        logger.info(f"   Retrieved {len(memories)} memories from database")
+
+                        if memories:
+                            memories_text = []
+                            embeddings_count = 0
+                            for memory in memories:
+                                content_preview = memory.content[:100] + "..." if len(memory.content) > 100 else memory.content
+                                has_embedding = "✅" if memory.embedding else "❌"
+                                if memory.embedding:
+                                    embeddings_count += 1
+                                embedding_info = f" (embedding: {has_embedding})"
+                                memories_text.append(f"- {memory.id}: {content_preview}{embedding_info}")
+                            result_text = f"📚 {len(memories)} memories stored:\n" + "\n".join(memories_text)
+                            logger.info(f"   ✅ Full server SUCCESS: {len(memories)} memories, {embeddings_count} with embeddings")
+                        else:
+                            result_text = "📚 No memories stored yet"
+                            logger.info("   ✅ Full server SUCCESS: No memories found")
+                    except Exception as e:
+                        result_text = f"📚 Error listing memories: {str(e)}"
+                        logger.error(f"   ❌ Full server FAILED: {str(e)}")
+                        logger.error(f"   Traceback: {traceback.format_exc()}")
                     
-                elif method.startswith("notifications/"):
-                    # Handle notifications (Cursor sends these)
-                    if request_id is not None:
-                        response = {
-                            "jsonrpc": "2.0",
-                            "id": request_id,
-                            "result": {}
-                        }
-                    else:
-                        # Notification without ID - no response needed
-                        response = None
-                        
+                elif tool_name == "memory_status":
+                    logger.info("🧠 MEMORY_STATUS Processing")
+                    try:
+                        from src.services.database_service import database_service
+                        memory_count = await database_service.get_memory_count(project=PROJECT_NAME)
+                        result_text = f"🧠 Memory System Status:\n- Mode: Full Server\n- Project: {PROJECT_NAME}\n- Database: {DATABASE_NAME}\n- Memories stored: {memory_count}\n- Working directory: {os.getcwd()}"
+                    except Exception as e:
+                        result_text = f"🧠 Memory System Status:\n- Mode: Full Server\n- Project: {PROJECT_NAME}\n- Database: {DATABASE_NAME}\n- Error getting count: {str(e)}\n- Working directory: {os.getcwd()}"
+                    logger.info("   ✅ Status retrieved successfully")
+
                 else:
+                    logger.warning(f"❓ UNKNOWN TOOL: {tool_name}")
+                    result_text = f"Unknown tool: {tool_name}"
+
+                # Calculate execution time
+                end_time = datetime.now()
+                execution_time = (end_time - start_time).total_seconds() * 1000  # ms
+
+                # Log completion
+                logger.info("🏁 MCP TOOL CALL COMPLETE")
+                logger.info(f"   Tool: {tool_name}")
+                logger.info(f"   Execution time: {execution_time:.2f}ms")
+                logger.info(f"   Response length: {len(result_text)} chars")
+                logger.info(f"   Response preview: {result_text[:150]}{'...' if len(result_text) > 150 else ''}")
+
+                response = {
+                    "jsonrpc": "2.0",
+                    "id": request_id,
+                    "result": {
+                        "content": [
+                            {
+                                "type": "text",
+                                "text": result_text
+                            }
+                        ]
+                    }
+                }
+                
+            elif method.startswith("notifications/"):
+                # Handle notifications (Cursor sends these)
+                if request_id is not None:
                     response = {
                         "jsonrpc": "2.0",
                         "id": request_id,
-                        "error": {
-                            "code": -32601,
-                            "message": f"Method not found: {method}"
-                        }
+                        "result": {}
                     }
-                
-                # Send response only if we have one
-                if response is not None:
-                    logger.debug(f"📤 Sending response for {method} (ID: {request_id})")
-                    logger.debug(f"   Response size: {len(json.dumps(response))} bytes")
-                    print(json.dumps(response), flush=True)
                 else:
-                    logger.debug(f"📭 No response needed for {method}")
+                    # Notification without ID - no response needed
+                    response = None
                     
-            except Exception as e:
-                logger.error("💥 REQUEST PROCESSING ERROR")
-                logger.error(f"   Error: {str(e)}")
-                logger.error(f"   Request: {request if 'request' in locals() else 'Unknown'}")
-                logger.error(f"   Traceback: {traceback.format_exc()}")
-
-                error_response = {
+            else:
+                response = {
                     "jsonrpc": "2.0",
-                    "id": request.get("id") if 'request' in locals() else None,
+                    "id": request_id,
                     "error": {
-                        "code": -32603,
-                        "message": f"Internal error: {str(e)}"
+                        "code": -32601,
+                        "message": f"Method not found: {method}"
                     }
                 }
-                print(json.dumps(error_response), flush=True)
+            
+            # Send response only if we have one
+            if response is not None:
+                logger.debug(f"📤 Sending response for {method} (ID: {request_id})")
+                payload = encode_message(response)
+                logger.debug(f"   Response size: {len(payload)} bytes")
+                write_message(payload)
+            else:
+                logger.debug(f"📭 No response needed for {method}")
+                
+        except Exception as e:
+            logger.error("💥 REQUEST PROCESSING ERROR")
+            logger.error(f"   Error: {str(e)}")
+            logger.error(f"   Request: {request if 'request' in locals() else 'Unknown'}")
+            logger.error(f"   Traceback: {traceback.format_exc()}")
+
+            error_response = {
+                "jsonrpc": "2.0",
+                "id": request.get("id") if 'request' in locals() else None,
+                "error": {
+                    "code": -32603,
+                    "message": f"Internal error: {str(e)}"
+                }
+            }
+            write_message(encode_message(error_response))
+
+    try:
+        logger.info("📡 Starting MCP message processing loop")
+        # Read stdin without blocking the event loop while waiting for input
+        read_line = await open_stdin_lines()
+        # Each request runs as its own task so slow tool calls overlap; write_message
+        # emits a whole line without awaiting, so responses never interleave
+        pending = set()
+        request_slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        def release_slot(task: asyncio.Task) -> None:
+            pending.discard(task)
+            request_slots.release()
+
+        while True:
+            raw_line = await read_line()
+            if raw_line is None:
+                logger.error(f"❌ Dropped request line longer than {STDIN_LINE_LIMIT} bytes")
+                write_message(encode_message({
+                    "jsonrpc": "2.0",
+                    "id": None,
+                    "error": {"code": -32700, "message": f"Parse error: request exceeds {STDIN_LINE_LIMIT} bytes"}
+                }))
+                continue
+            if not raw_line:
+                break
+            # Stop reading new requests while every slot is busy
+            await request_slots.acquire()
+            task = asyncio.create_task(handle_line(raw_line))
+            pending.add(task)
+            task.add_done_callback(release_slot)
+        if pending:
+            await asyncio.gather(*pending)
 
     except KeyboardInterrupt:
         logger.info("🛑 Server shutdown requested (Ctrl+C)")
@@ -428,7 +532,7 @@ async def async_main():
             "id": None,
             "error": {"code": -32603, "message": f"Fatal error: {str(e)}"}
         }
-        print(json.dumps(error_response), flush=True)
+        write_message(encode_message(error_response))
 
     finally:
         logger.info("🏁 MCP Memory Server shutting down")
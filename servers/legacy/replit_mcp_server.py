@@ -5,6 +5,7 @@ Optimized for Replit cloud development with collaboration features
 """
 
 import asyncio
+import heapq
 import os
 import sys
 from pathlib import Path
@@ -581,9 +582,8 @@ class ReplitMCPServer(MCPMemoryServer):
                         "score": final_score
                     })
         
-        # Sort by score
-        results.sort(key=lambda x: x['score'], reverse=True)
-        results = results[:5]  # Top 5
+        # Top 5 by score
+        results = heapq.nlargest(5, results, key=lambda x: x['score'])
         
         if not results:
             return [TextContent(type="text", text=f"⚡ No Repl history found for query: '{query}'")]
@@ -10,7 +10,7 @@ import logging
 import sys
 import os
 import time
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
 
@@ -39,6 +39,22 @@ import uvicorn  # noqa: E402
 from src.config.settings import get_settings  # noqa: E402
 from src.core.server import MCPServer  # noqa: E402
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _json_loads(data):
+    """Decode JSON from bytes or str, using orjson when available"""
+    return orjson.loads(data) if HAS_ORJSON else json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode JSON to UTF-8 bytes, using orjson when available"""
+    return orjson.dumps(obj) if HAS_ORJSON else json.dumps(obj).encode("utf-8")
+
 
 class ProxyServer:
     """HTTP Proxy Server for auto-trigger message interception"""
@@ -48,8 +64,7 @@ class ProxyServer:
         if config_path is None:
             config_path = Path(project_root) / "config" / "proxy_config.yaml"
         
-        with open(config_path, 'r') as f:
-            self.proxy_config = yaml.safe_load(f)
+        self.proxy_config = yaml.safe_load(Path(config_path).read_bytes())
         
         # Load MCP settings
         self.settings = get_settings()
@@ -232,7 +247,7 @@ class ProxyServer:
         try:
             # Try to call a simple MCP tool
             result = await self.mcp_server._handle_get_memory_stats({})
-            stats = json.loads(result)
+            stats = _json_loads(result)
             
             return {
                 "status": "healthy",
@@ -251,7 +266,7 @@ class ProxyServer:
             # Parse request body
             body = await request.body()
             if body:
-                request_data = json.loads(body)
+                request_data = _json_loads(body)
             else:
                 request_data = {}
             
@@ -346,8 +361,39 @@ class ProxyServer:
                     if isinstance(message, str) and message.strip():
                         return message.strip()
         
+        # Try chat-style message lists (latest user message)
+        messages = request_data.get('messages')
+        if isinstance(messages, list):
+            for entry in reversed(messages):
+                if isinstance(entry, dict) and entry.get('role') == 'user':
+                    message = entry.get('content')
+                    if isinstance(message, str) and message.strip():
+                        return message.strip()
+                    break
+        
         return None
     
+    def _apply_memory_context(self, request_data: Dict[str, Any], memory_context: List[Any]) -> bool:
+        """Add the memory context block after the request content, leaving the prefix untouched"""
+        context_block = "Relevant context from memory:\n" + "".join(
+            f"- {memory['content']}\n"
+            for memory in memory_context[:3]  # Limit to top 3 memories
+            if isinstance(memory, dict) and 'content' in memory
+        )
+        
+        # Chat requests get a trailing message so earlier messages stay byte-identical for prompt caching
+        messages = request_data.get('messages')
+        if isinstance(messages, list) and messages:
+            request_data['messages'] = messages + [{"role": "user", "content": context_block}]
+            return True
+        
+        for field in ['message', 'prompt', 'input', 'text', 'content', 'query']:
+            if isinstance(request_data.get(field), str) and request_data[field].strip():
+                request_data[field] = f"{request_data[field].strip()}\n\n{context_block}"
+                return True
+        
+        return False
+    
     def _should_analyze(self, platform: str) -> bool:
         """Check if we should analyze messages for this platform"""
         auto_trigger_config = self.proxy_config.get('proxy', {}).get('auto_trigger', {})
@@ -380,7 +426,7 @@ class ProxyServer:
             
             # Parse JSON result if it's a string
             if isinstance(result, str):
-                analysis = json.loads(result)
+                analysis = _json_loads(result)
             else:
                 analysis = result
             
@@ -404,23 +450,8 @@ class ProxyServer:
                             memory_context.extend(search_result['memories'])
             
             # Enhance the original message with memory context
-            if memory_context:
-                context_text = "\n\nRelevant context from memory:\n"
-                for memory in memory_context[:3]:  # Limit to top 3 memories
-                    if isinstance(memory, dict) and 'content' in memory:
-                        context_text += f"- {memory['content']}\n"
-                
-                # Enhance the message field
-                original_message = self._extract_message(enhanced_request)
-                if original_message:
-                    enhanced_message = original_message + context_text
-                    # Update the message in the request
-                    for field in ['message', 'prompt', 'input', 'text', 'content', 'query']:
-                        if field in enhanced_request:
-                            enhanced_request[field] = enhanced_message
-                            break
-                    
-                    self.logger.info(f"✅ Enhanced message with {len(memory_context)} memory contexts")
+            if memory_context and self._apply_memory_context(enhanced_request, memory_context):
+                self.logger.info(f"✅ Enhanced message with {len(memory_context)} memory contexts")
             
             # Add analysis metadata
             enhanced_request['_mcp_analysis'] = {
@@ -466,7 +497,7 @@ class ProxyServer:
             
             # Parse JSON result if it's a string
             if isinstance(result, str):
-                analysis = json.loads(result)
+                analysis = _json_loads(result)
             else:
                 analysis = result
             
@@ -490,23 +521,8 @@ class ProxyServer:
                             memory_context.extend(search_result['memories'])
             
             # Enhance the original message with memory context
-            if memory_context:
-                context_text = "\n\nRelevant context from memory:\n"
-                for memory in memory_context[:3]:  # Limit to top 3 memories
-                    if isinstance(memory, dict) and 'content' in memory:
-                        context_text += f"- {memory['content']}\n"
-                
-                # Enhance the message field
-                original_message = self._extract_message(enhanced_request)
-                if original_message:
-                    enhanced_message = original_message + context_text
-                    # Update the message in the request
-                    for field in ['message', 'prompt', 'input', 'text', 'content', 'query']:
-                        if field in enhanced_request:
-                            enhanced_request[field] = enhanced_message
-                            break
-                    
-                    self.logger.info(f"✅ Enhanced message with {len(memory_context)} memory contexts")
+            if memory_context and self._apply_memory_context(enhanced_request, memory_context):
+                self.logger.info(f"✅ Enhanced message with {len(memory_context)} memory contexts")
             
             # Add analysis metadata
             enhanced_request['_mcp_analysis'] = {
@@ -535,6 +551,7 @@ class ProxyServer:
             
             # Prepare headers
             headers = platform_config.get('headers', {}).copy()
+            headers.setdefault('Content-Type', 'application/json')
             
             # Copy relevant headers from original request
             for header_name in ['Authorization', 'X-API-Key', 'User-Agent']:
@@ -549,11 +566,11 @@ class ProxyServer:
             
             async with self.session.post(
                 url,
-                json=request_data,
+                data=_json_dumps(request_data),
                 headers=headers,
                 timeout=aiohttp.ClientTimeout(total=timeout)
             ) as response:
-                response_data = await response.json()
+                response_data = await response.json(loads=_json_loads)
                 
                 self.logger.info(f"✅ Platform response: {response.status}")
                 
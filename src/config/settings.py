@@ -38,6 +38,9 @@ class MemoryConfig(BaseModel):
     max_text_length: int = 10000
     default_project: str = "default"
     retention_days: int = 365
+    search_cache_size: int = 512  # Cached searches kept for repeated queries (0 disables)
+    search_cache_ttl: float = 5.0  # Seconds a cached search is reused; bounds staleness from other processes' writes
+    search_cache_similarity: Optional[float] = None  # Reuse results for near-duplicate queries at this similarity (None: exact repeats only)
 
 
 class DatabaseConfig(BaseModel):
@@ -265,9 +268,9 @@ class Settings:
         config_file = Path("config/settings.yaml")
         if config_file.exists():
             try:
-                with open(config_file, 'r') as f:
-                    config_data = yaml.safe_load(f)
-                    self._update_from_dict(config_data)
+                # One raw read; the YAML loader detects the encoding itself
+                config_data = yaml.safe_load(config_file.read_bytes())
+                self._update_from_dict(config_data)
             except Exception as e:
                 print(f"Warning: Could not load YAML config: {e}")
     
@@ -4,12 +4,29 @@ Auto-Trigger System for MCP Memory Server
 Intelligent automatic triggering of memory tools based on conversation analysis
 """
 
+import bisect
 import re
 import time
-from typing import Dict, List, Any, Tuple
-from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
+from typing import Callable, Dict, List, Any, Iterator, Optional, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 
+# Optional RE2 backend: scans all of a rule's patterns in one linear-time DFA pass
+try:
+    import re2
+    HAS_RE2 = True
+except ImportError:
+    HAS_RE2 = False
+
+# Optional Aho-Corasick automaton: finds every rule keyword in one pass over the text
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
 from ..utils.logging import get_logger, log_performance
 from ..config.settings import get_settings
 from ..services.embedding_service import EmbeddingService
@@ -18,6 +35,66 @@ from ..services.memory_service import MemoryService
 
 logger = get_logger(__name__)
 
+# Keywords that raise the importance of a conversation
+_IMPORTANT_KEYWORDS = frozenset(["importante", "ricorda", "bug", "errore", "soluzione", "decisione"])
+
+# Runs of letters (Unicode aware), used to tokenize content in a single pass
+_WORD_RE = re.compile(r"[^\W\d_]+")
+
+# Sentence boundary used when scanning conversation content
+_SENTENCE_BOUNDARY_RE = re.compile(r"\.")
+
+# Entity patterns: file paths and URLs
+_FILE_PATH_RE = re.compile(r'[\w/]+\.\w+')
+_URL_RE = re.compile(r'https?://[\w\.-]+')
+
+
+@lru_cache(maxsize=256)
+def _compile(pattern: str, flags: int = 0) -> re.Pattern:
+    """Compile a regex once per (pattern, flags); use this for any pattern built at runtime"""
+    return re.compile(pattern, flags)
+
+
+def _build_pattern_set(patterns: List[str]) -> Optional[Any]:
+    """Compile patterns into one case-insensitive RE2 set; None if RE2 can't express them all"""
+    options = re2.Options()
+    options.case_sensitive = False
+    pattern_set = re2.Set.SearchSet(options)
+    try:
+        for pattern in patterns:
+            pattern_set.Add(pattern)
+        pattern_set.Compile()
+    except re2.error:
+        return None
+    return pattern_set
+
+
+def _build_pattern_alternation(patterns: List[str]) -> re.Pattern:
+    """Combine patterns into one alternation, case-insensitive only if some pattern has uppercase"""
+    flags = 0 if all(pattern == pattern.lower() for pattern in patterns) else re.IGNORECASE
+    return _compile("|".join(f"(?:{pattern})" for pattern in patterns), flags)
+
+
+def _build_keyword_automaton(keywords: List[str]) -> Optional[Any]:
+    """Build an Aho-Corasick automaton over lowercased keywords; None if there are none"""
+    if not keywords:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+def _iter_sentences(text: str) -> Iterator[str]:
+    """Yield sentences lazily so callers can stop at the first match"""
+    start = 0
+    for match in _SENTENCE_BOUNDARY_RE.finditer(text):
+        yield text[start:match.start()]
+        start = match.end()
+    if start < len(text):
+        yield text[start:]
+
 
 class TriggerType(Enum):
     """Types of automatic triggers"""
@@ -39,6 +116,15 @@ class TriggerRule:
     priority: int = 1
     cooldown_seconds: int = 30
     enabled: bool = True
+    exclusive: bool = False  # Stop checking lower-priority rules once this one fires
+    # Derived once at load time (see AutoTriggerSystem._compile_patterns)
+    _compiled: List[re.Pattern] = field(default_factory=list, repr=False, compare=False)
+    _keywords_lower: List[str] = field(default_factory=list, repr=False, compare=False)
+    _pattern_set: Optional[Any] = field(default=None, repr=False, compare=False)
+    _combined: Optional[re.Pattern] = field(default=None, repr=False, compare=False)
+    _key: str = field(default="", repr=False, compare=False)
+    _checker: Optional[Callable] = field(default=None, repr=False, compare=False)
+    _keyword_automaton: Optional[Any] = field(default=None, repr=False, compare=False)
 
 
 @dataclass
@@ -54,6 +140,9 @@ class ConversationAnalysis:
     solution_provided: bool
     error_mentioned: bool
     decision_made: bool
+    # Joined message content, built once and shared by every rule check
+    content: str = field(default="", repr=False)
+    content_lower: str = field(default="", repr=False)
 
 
 class AutoTriggerSystem:
@@ -66,16 +155,28 @@ class AutoTriggerSystem:
         self.memory_service = memory_service
         self.embedding_service = embedding_service
         
-        # Trigger rules configuration
+        # Trigger rules configuration, kept in descending priority order
         self.trigger_rules = self._load_trigger_rules()
+        self.trigger_rules.sort(key=lambda x: x.priority, reverse=True)
         
         # State tracking
         self.conversation_buffer = []
         self.last_trigger_times = {}
         self.session_context = {}
         
+        # Checker per trigger type, bound to each rule once it is compiled
+        self._condition_checkers: Dict[TriggerType, Callable] = {
+            TriggerType.KEYWORD_BASED: self._check_keyword_trigger,
+            TriggerType.PATTERN_RECOGNITION: self._check_pattern_trigger,
+            TriggerType.SEMANTIC_SIMILARITY: self._check_semantic_trigger,
+            TriggerType.IMPORTANCE_THRESHOLD: self._check_importance_trigger,
+            TriggerType.CONVERSATION_LENGTH: self._check_length_trigger,
+            TriggerType.CONTEXT_CHANGE: self._check_context_trigger,
+            TriggerType.TIME_BASED: self._check_time_trigger,
+        }
+        
         # Pattern compilation for performance
-        self.compiled_patterns = self._compile_patterns()
+        self._compile_patterns()
         
         logger.info("Auto-trigger system initialized")
     
@@ -95,7 +196,8 @@ class AutoTriggerSystem:
                 },
                 action="save_memory",
                 priority=10,
-                cooldown_seconds=10
+                cooldown_seconds=10,
+                exclusive=True
             ),
             
             # 2. SOLUTION/ERROR PATTERNS
@@ -179,14 +281,35 @@ class AutoTriggerSystem:
             )
         ]
     
-    def _compile_patterns(self) -> Dict[str, re.Pattern]:
-        """Compile regex patterns for performance"""
-        patterns = {}
+    def _compile_patterns(self) -> None:
+        """Pre-compile patterns and pre-lowercase keywords for every rule"""
         for rule in self.trigger_rules:
-            if rule.trigger_type == TriggerType.PATTERN_RECOGNITION:
-                for i, pattern in enumerate(rule.condition.get("patterns", [])):
-                    patterns[f"{rule.trigger_type.value}_{i}"] = re.compile(pattern, re.IGNORECASE)
-        return patterns
+            self._compile_rule(rule)
+    
+    def _compile_rule(self, rule: TriggerRule) -> None:
+        """Pre-compile a rule's patterns and keywords and bind its cooldown key and checker"""
+        rule._key = f"{rule.trigger_type.value}_{rule.action}"
+        rule._checker = self._condition_checkers.get(rule.trigger_type)
+        
+        if rule.trigger_type == TriggerType.PATTERN_RECOGNITION:
+            patterns = rule.condition.get("patterns", [])
+            # Lowercase patterns run case-sensitively against the lowercased content
+            rule._compiled = [
+                _compile(pattern) if pattern == pattern.lower() else _compile(pattern, re.IGNORECASE)
+                for pattern in patterns
+            ]
+            rule._pattern_set = _build_pattern_set(patterns) if HAS_RE2 else None
+            # Without an RE2 set, one alternation scan tells whether any pattern can match
+            rule._combined = _build_pattern_alternation(patterns) if rule._pattern_set is None and patterns else None
+        elif rule.trigger_type == TriggerType.KEYWORD_BASED:
+            rule._keywords_lower = [kw.lower() for kw in rule.condition.get("keywords", [])]
+            rule._keyword_automaton = _build_keyword_automaton(rule._keywords_lower) if HAS_AHOCORASICK else None
+    
+    def add_trigger_rule(self, rule: TriggerRule) -> None:
+        """Add a trigger rule, keeping rules in descending priority order"""
+        self._compile_rule(rule)
+        priorities = [-r.priority for r in self.trigger_rules]
+        self.trigger_rules.insert(bisect.bisect_right(priorities, -rule.priority), rule)
     
     @log_performance("conversation_analysis")
     async def analyze_conversation(self, messages: List[Dict[str, str]]) -> ConversationAnalysis:
@@ -195,16 +318,17 @@ class AutoTriggerSystem:
             return ConversationAnalysis(0.0, [], [], "unknown", "neutral", False, False, False, False, False)
         
         # Combine all message content
-        all_content = " ".join([msg.get("content", "") for msg in messages]).lower()
+        content = " ".join([msg.get("content", "") for msg in messages])
+        all_content = content.lower()
         
         # Extract keywords
-        keywords = self._extract_keywords(all_content)
+        keywords = list(self._extract_keywords(all_content))
         
         # Detect entities (simplified)
         entities = self._extract_entities(all_content)
         
         # Calculate importance score
-        importance = await self._calculate_importance_score(messages, keywords)
+        importance = self._calculate_importance_score(messages, keywords)
         
         # Detect conversation characteristics
         code_content = any(marker in all_content for marker in ["```", "def ", "function", "class ", "import", "const"])
@@ -229,7 +353,9 @@ class AutoTriggerSystem:
             question_asked=question_asked,
             solution_provided=solution_provided,
             error_mentioned=error_mentioned,
-            decision_made=decision_made
+            decision_made=decision_made,
+            content=content,
+            content_lower=all_content
         )
     
     async def check_triggers(
@@ -242,71 +368,54 @@ class AutoTriggerSystem:
         Returns list of (action, parameters) tuples
         """
         triggered_actions = []
+        triggered_action_names = set()
         
         # Analyze conversation
         analysis = await self.analyze_conversation(messages)
         
-        # Check each trigger rule
-        for rule in sorted(self.trigger_rules, key=lambda x: x.priority, reverse=True):
-            if not rule.enabled:
+        # One monotonic clock reading serves every cooldown check in this turn
+        now = time.monotonic()
+        
+        # Check each trigger rule (already in priority order)
+        for rule in self.trigger_rules:
+            # Skip disabled rules and actions a higher-priority rule already triggered
+            if not rule.enabled or rule._checker is None or rule.action in triggered_action_names:
                 continue
             
             # Check cooldown
-            rule_key = f"{rule.trigger_type.value}_{rule.action}"
-            if self._is_in_cooldown(rule_key, rule.cooldown_seconds):
+            if self._is_in_cooldown(rule._key, rule.cooldown_seconds, now):
                 continue
             
-            # Check trigger condition
-            triggered, params = await self._check_trigger_condition(rule, analysis, messages, platform)
+            # Check trigger condition; only semantic rules need to await a search
+            if rule.trigger_type == TriggerType.SEMANTIC_SIMILARITY:
+                triggered, params = await rule._checker(rule, analysis, messages, platform)
+            else:
+                triggered, params = rule._checker(rule, analysis, messages, platform)
             
             if triggered:
                 triggered_actions.append((rule.action, params))
-                self.last_trigger_times[rule_key] = time.time()
+                triggered_action_names.add(rule.action)
+                self.last_trigger_times[rule._key] = now
+                
+                logger.info("Trigger activated: %s -> %s", rule.trigger_type.value, rule.action)
                 
-                logger.info(f"Trigger activated: {rule.trigger_type.value} -> {rule.action}")
+                if rule.exclusive:
+                    break
         
         return triggered_actions
     
-    async def _check_trigger_condition(
-        self, 
-        rule: TriggerRule, 
-        analysis: ConversationAnalysis, 
-        messages: List[Dict], 
-        platform: str
-    ) -> Tuple[bool, Dict[str, Any]]:
-        """Check if a specific trigger rule condition is met"""
-        
-        if rule.trigger_type == TriggerType.KEYWORD_BASED:
-            return self._check_keyword_trigger(rule, analysis, messages)
-        
-        elif rule.trigger_type == TriggerType.PATTERN_RECOGNITION:
-            return self._check_pattern_trigger(rule, analysis, messages)
-        
-        elif rule.trigger_type == TriggerType.SEMANTIC_SIMILARITY:
-            return await self._check_semantic_trigger(rule, analysis, messages)
-        
-        elif rule.trigger_type == TriggerType.IMPORTANCE_THRESHOLD:
-            return self._check_importance_trigger(rule, analysis, messages)
-        
-        elif rule.trigger_type == TriggerType.CONVERSATION_LENGTH:
-            return self._check_length_trigger(rule, analysis, messages)
-        
-        elif rule.trigger_type == TriggerType.CONTEXT_CHANGE:
-            return self._check_context_trigger(rule, analysis, messages, platform)
-        
-        elif rule.trigger_type == TriggerType.TIME_BASED:
-            return self._check_time_trigger(rule, analysis, messages)
-        
-        return False, {}
-    
-    def _check_keyword_trigger(self, rule: TriggerRule, analysis: ConversationAnalysis, messages: List[Dict]) -> Tuple[bool, Dict]:
+    def _check_keyword_trigger(self, rule: TriggerRule, analysis: ConversationAnalysis, messages: List[Dict], platform: str) -> Tuple[bool, Dict]:
         """Check keyword-based trigger"""
         keywords = rule.condition.get("keywords", [])
         threshold = rule.condition.get("threshold", 1)
         
         # Check content for keywords
-        all_content = " ".join([msg.get("content", "") for msg in messages]).lower()
-        found_keywords = [kw for kw in keywords if kw.lower() in all_content]
+        all_content = analysis.content_lower
+        if rule._keyword_automaton is not None:
+            hits = {keyword for _, keyword in rule._keyword_automaton.iter(all_content)}
+        else:
+            hits = {kw_lower for kw_lower in rule._keywords_lower if kw_lower in all_content}
+        found_keywords = [kw for kw, kw_lower in zip(keywords, rule._keywords_lower) if kw_lower in hits]
         
         if len(found_keywords) >= threshold:
             # Extract the relevant content around keywords
@@ -325,20 +434,22 @@ class AutoTriggerSystem:
         
         return False, {}
     
-    def _check_pattern_trigger(self, rule: TriggerRule, analysis: ConversationAnalysis, messages: List[Dict]) -> Tuple[bool, Dict]:
+    def _check_pattern_trigger(self, rule: TriggerRule, analysis: ConversationAnalysis, messages: List[Dict], platform: str) -> Tuple[bool, Dict]:
         """Check pattern recognition trigger"""
-        patterns = rule.condition.get("patterns", [])
         context_required = rule.condition.get("context_required", [])
         
-        all_content = " ".join([msg.get("content", "") for msg in messages])
+        all_content = analysis.content
         
-        # Check if any pattern matches
-        matched_patterns = []
-        for i, pattern in enumerate(patterns):
-            pattern_key = f"pattern_recognition_{i}"
-            if pattern_key in self.compiled_patterns:
-                if self.compiled_patterns[pattern_key].search(all_content):
-                    matched_patterns.append(pattern)
+        # Check if any pattern matches (against the shared lowercased content)
+        if rule._pattern_set is not None:
+            matched_indices = rule._pattern_set.Match(analysis.content_lower) or []
+            matched_patterns = [rule._compiled[i].pattern for i in sorted(matched_indices)]
+        elif rule._combined is not None and not rule._combined.search(analysis.content_lower):
+            matched_patterns = []
+        else:
+            matched_patterns = [
+                compiled.pattern for compiled in rule._compiled if compiled.search(analysis.content_lower)
+            ]
         
         if matched_patterns:
             # Check context requirements
@@ -366,21 +477,22 @@ class AutoTriggerSystem:
         
         return False, {}
     
-    async def _check_semantic_trigger(self, rule: TriggerRule, analysis: ConversationAnalysis, messages: List[Dict]) -> Tuple[bool, Dict]:
+    async def _check_semantic_trigger(self, rule: TriggerRule, analysis: ConversationAnalysis, messages: List[Dict], platform: str) -> Tuple[bool, Dict]:
         """Check semantic similarity trigger"""
         threshold = rule.condition.get("similarity_threshold", 0.8)
         min_length = rule.condition.get("min_content_length", 100)
         
-        current_content = " ".join([msg.get("content", "") for msg in messages])
+        current_content = analysis.content
         
         if len(current_content) < min_length:
             return False, {}
         
         # Search for similar memories
         try:
+            # MemoryService caches repeated searches and shares concurrent ones
             similar_memories = await self.memory_service.search_memories(
                 query=current_content[:500],  # Limit query length
-                limit=3,
+                max_results=3,
                 similarity_threshold=threshold
             )
             
@@ -395,18 +507,18 @@ class AutoTriggerSystem:
                     }
                 }
         except Exception as e:
-            logger.warning(f"Semantic trigger search failed: {e}")
+            logger.warning("Semantic trigger search failed: %s", e)
         
         return False, {}
     
-    def _check_importance_trigger(self, rule: TriggerRule, analysis: ConversationAnalysis, messages: List[Dict]) -> Tuple[bool, Dict]:
+    def _check_importance_trigger(self, rule: TriggerRule, analysis: ConversationAnalysis, messages: List[Dict], platform: str) -> Tuple[bool, Dict]:
         """Check importance threshold trigger"""
         threshold = rule.condition.get("importance_threshold", 0.7)
         indicators = rule.condition.get("content_indicators", [])
         
         if analysis.importance_score >= threshold:
             # Check for content indicators
-            all_content = " ".join([msg.get("content", "") for msg in messages]).lower()
+            all_content = analysis.content_lower
             found_indicators = [ind for ind in indicators if ind in all_content]
             
             if found_indicators or not indicators:  # Trigger if no specific indicators required
@@ -424,7 +536,7 @@ class AutoTriggerSystem:
         
         return False, {}
     
-    def _check_length_trigger(self, rule: TriggerRule, analysis: ConversationAnalysis, messages: List[Dict]) -> Tuple[bool, Dict]:
+    def _check_length_trigger(self, rule: TriggerRule, analysis: ConversationAnalysis, messages: List[Dict], platform: str) -> Tuple[bool, Dict]:
         """Check conversation length trigger"""
         min_messages = rule.condition.get("message_count", 5)
         min_avg_length = rule.condition.get("min_avg_length", 50)
@@ -455,7 +567,7 @@ class AutoTriggerSystem:
         """Check context change trigger"""
         new_project_keywords = rule.condition.get("new_project_keywords", [])
         
-        all_content = " ".join([msg.get("content", "") for msg in messages]).lower()
+        all_content = analysis.content_lower
         
         # Check for project/context change keywords
         context_change_detected = any(keyword in all_content for keyword in new_project_keywords)
@@ -473,16 +585,19 @@ class AutoTriggerSystem:
         
         return False, {}
     
-    def _check_time_trigger(self, rule: TriggerRule, analysis: ConversationAnalysis, messages: List[Dict]) -> Tuple[bool, Dict]:
+    def _check_time_trigger(self, rule: TriggerRule, analysis: ConversationAnalysis, messages: List[Dict], platform: str) -> Tuple[bool, Dict]:
         """Check time-based trigger"""
         interval_minutes = rule.condition.get("interval_minutes", 10)
         min_messages = rule.condition.get("min_messages", 3)
         
         # Check if enough time has passed and conversation is active
-        last_time_trigger = self.last_trigger_times.get("time_based_search_memories", 0)
-        time_since_last = time.time() - last_time_trigger
+        last_time_trigger = self.last_trigger_times.get(rule._key)
+        interval_elapsed = (
+            last_time_trigger is None or
+            time.monotonic() - last_time_trigger >= interval_minutes * 60
+        )
         
-        if time_since_last >= (interval_minutes * 60) and len(messages) >= min_messages:
+        if interval_elapsed and len(messages) >= min_messages:
             # Get recent conversation context
             recent_content = " ".join([msg.get("content", "") for msg in messages[-3:]])
             
@@ -499,14 +614,14 @@ class AutoTriggerSystem:
         return False, {}
     
     # Helper methods
-    def _extract_keywords(self, content: str) -> List[str]:
+    @staticmethod
+    def _extract_keywords(content: str) -> Tuple[str, ...]:
         """Extract relevant keywords from content"""
-        # Simplified keyword extraction
-        important_words = []
-        for word in content.split():
-            if len(word) > 3 and word.isalpha():
-                important_words.append(word.lower())
-        return list(set(important_words))[:20]  # Limit to 20 keywords
+        # Tokenize once; known important keywords go first so the limit never drops them
+        tokens = dict.fromkeys(_WORD_RE.findall(content.lower()))
+        keywords = [word for word in tokens if word in _IMPORTANT_KEYWORDS]
+        keywords.extend(word for word in tokens if len(word) > 3 and word not in _IMPORTANT_KEYWORDS)
+        return tuple(keywords[:20])  # Limit to 20 keywords
     
     def _extract_entities(self, content: str) -> List[str]:
         """Extract entities from content (simplified)"""
@@ -514,17 +629,14 @@ class AutoTriggerSystem:
         entities = []
         
         # File paths
-        import re
-        file_patterns = re.findall(r'[\w/]+\.\w+', content)
-        entities.extend(file_patterns)
+        entities.extend(_FILE_PATH_RE.findall(content))
         
         # URLs
-        url_patterns = re.findall(r'https?://[\w\.-]+', content)
-        entities.extend(url_patterns)
+        entities.extend(_URL_RE.findall(content))
         
         return entities[:10]  # Limit to 10 entities
     
-    async def _calculate_importance_score(self, messages: List[Dict], keywords: List[str]) -> float:
+    def _calculate_importance_score(self, messages: List[Dict], keywords: List[str]) -> float:
         """Calculate importance score for conversation"""
         base_score = 0.5
         
@@ -536,8 +648,7 @@ class AutoTriggerSystem:
             base_score += 0.1
         
         # Factor in keyword importance
-        important_keywords = ["importante", "ricorda", "bug", "errore", "soluzione", "decisione"]
-        keyword_boost = sum(0.05 for kw in keywords if kw in important_keywords)
+        keyword_boost = 0.05 * len(_IMPORTANT_KEYWORDS.intersection(keywords))
         base_score += min(0.3, keyword_boost)
         
         return min(1.0, base_score)
@@ -564,22 +675,23 @@ class AutoTriggerSystem:
         else:
             return "neutral"
     
-    def _is_in_cooldown(self, rule_key: str, cooldown_seconds: int) -> bool:
-        """Check if trigger is in cooldown period"""
-        last_time = self.last_trigger_times.get(rule_key, 0)
-        return (time.time() - last_time) < cooldown_seconds
+    def _is_in_cooldown(self, rule_key: str, cooldown_seconds: int, now: float) -> bool:
+        """Check if trigger is in cooldown period (times from time.monotonic)"""
+        last_time = self.last_trigger_times.get(rule_key)
+        return last_time is not None and (now - last_time) < cooldown_seconds
     
     def _extract_relevant_content_around_keywords(self, messages: List[Dict], keywords: List[str]) -> str:
         """Extract content around found keywords"""
         relevant_parts = []
+        keywords_lower = [keyword.lower() for keyword in keywords]
         for msg in messages:
             content = msg.get("content", "")
-            for keyword in keywords:
-                if keyword.lower() in content.lower():
+            content_lower = content.lower()
+            for keyword_lower in keywords_lower:
+                if keyword_lower in content_lower:
                     # Find sentence containing the keyword
-                    sentences = content.split('.')
-                    for sentence in sentences:
-                        if keyword.lower() in sentence.lower():
+                    for sentence in _iter_sentences(content):
+                        if keyword_lower in sentence.lower():
                             relevant_parts.append(sentence.strip())
                             break
         
@@ -601,11 +713,9 @@ class AutoTriggerSystem:
         # Simple summarization - take key sentences
         all_content = " ".join([msg.get("content", "") for msg in messages])
         
-        # Split into sentences and take the longer, more meaningful ones
-        sentences = [s.strip() for s in all_content.split('.') if len(s.strip()) > 20]
-        
-        # Take up to 3 most meaningful sentences
-        summary_sentences = sentences[:3] if len(sentences) >= 3 else sentences
+        # Take up to 3 of the longer, more meaningful sentences
+        sentences = (sentence for sentence in map(str.strip, _iter_sentences(all_content)) if len(sentence) > 20)
+        summary_sentences = list(islice(sentences, 3))
         
         return ". ".join(summary_sentences) + "."
 
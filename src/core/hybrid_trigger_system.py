@@ -4,7 +4,9 @@ Hybrid Auto-Trigger System
 Combines deterministic rules with ML predictions for optimal performance
 """
 
+import asyncio
 import json
+from collections import deque
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
@@ -20,6 +22,12 @@ from ..services.memory_service import MemoryService
 
 logger = get_logger(__name__)
 
+# Threshold optimization looks at this many of the most recent feedback entries
+THRESHOLD_WINDOW = 100
+
+# Candidate ML confidence thresholds evaluated by optimize_thresholds
+CONFIDENCE_LEVELS = (0.5, 0.6, 0.7, 0.8, 0.9)
+
 
 class TriggerMode(Enum):
     """Operating modes for trigger system"""
@@ -69,10 +77,16 @@ class HybridAutoTriggerSystem:
         }
         
         # Learning and adaptation
-        self.adaptation_history = []
+        self.adaptation_history: deque = deque(maxlen=1000)  # Recent feedback only
+        self.total_adaptations = 0  # All feedback ever recorded, beyond the history window
         self.confidence_calibration = {}
         
-        logger.info(f"Hybrid auto-trigger system initialized in {self.mode.value} mode")
+        # Rolling per-threshold (total, correct) counts over the last THRESHOLD_WINDOW feedback entries
+        self._threshold_window: deque = deque(maxlen=THRESHOLD_WINDOW)
+        self._threshold_totals = [0] * len(CONFIDENCE_LEVELS)
+        self._threshold_correct = [0] * len(CONFIDENCE_LEVELS)
+        
+        logger.info("Hybrid auto-trigger system initialized in %s mode", self.mode.value)
     
     async def initialize(self):
         """Initialize both systems"""
@@ -98,10 +112,18 @@ class HybridAutoTriggerSystem:
         
         try:
             # Get predictions from both systems based on mode
-            if self.mode in [TriggerMode.DETERMINISTIC, TriggerMode.HYBRID, TriggerMode.LEARNING]:
-                deterministic_result = await self._get_deterministic_prediction(messages, platform, context)
+            use_deterministic = self.mode in [TriggerMode.DETERMINISTIC, TriggerMode.HYBRID, TriggerMode.LEARNING]
+            use_ml = self.mode in [TriggerMode.ML_ONLY, TriggerMode.HYBRID, TriggerMode.LEARNING]
             
-            if self.mode in [TriggerMode.ML_ONLY, TriggerMode.HYBRID, TriggerMode.LEARNING]:
+            if use_deterministic and use_ml:
+                # The two systems are independent, so overlap their I/O
+                deterministic_result, ml_result = await asyncio.gather(
+                    self._get_deterministic_prediction(messages, platform, context),
+                    self._get_ml_prediction(current_message, messages, platform, user_id)
+                )
+            elif use_deterministic:
+                deterministic_result = await self._get_deterministic_prediction(messages, platform, context)
+            elif use_ml:
                 ml_result = await self._get_ml_prediction(current_message, messages, platform, user_id)
             
             # Decide final action based on mode
@@ -116,7 +138,7 @@ class HybridAutoTriggerSystem:
             return final_prediction
             
         except Exception as e:
-            logger.error(f"Hybrid analysis failed: {e}")
+            logger.error("Hybrid analysis failed: %s", e)
             return HybridPrediction(
                 final_action=ActionType.NO_ACTION,
                 confidence=0.0,
@@ -161,7 +183,7 @@ class HybridAutoTriggerSystem:
             }
             
         except Exception as e:
-            logger.error(f"Deterministic prediction failed: {e}")
+            logger.error("Deterministic prediction failed: %s", e)
             return {
                 'action': ActionType.NO_ACTION,
                 'confidence': 0.0,
@@ -185,7 +207,7 @@ class HybridAutoTriggerSystem:
                 user_id=user_id
             )
         except Exception as e:
-            logger.error(f"ML prediction failed: {e}")
+            logger.error("ML prediction failed: %s", e)
             return MLPrediction(
                 action=ActionType.NO_ACTION,
                 confidence=0.0,
@@ -387,10 +409,10 @@ class HybridAutoTriggerSystem:
                 
                 self.performance_metrics['learning_samples'] += 1
                 
-                logger.debug(f"ML system learned from deterministic: {ground_truth.value}")
+                logger.debug("ML system learned from deterministic: %s", ground_truth.value)
         
         except Exception as e:
-            logger.error(f"Learning from deterministic failed: {e}")
+            logger.error("Learning from deterministic failed: %s", e)
     
     async def record_user_feedback(
         self,
@@ -431,11 +453,35 @@ class HybridAutoTriggerSystem:
                 'confidence': prediction.confidence,
                 'feedback': feedback
             })
+            self.total_adaptations += 1
+            
+            self._update_threshold_window(
+                prediction.method_used.startswith('hybrid_ml'),
+                prediction.confidence,
+                prediction.final_action == actual_action
+            )
             
-            logger.info(f"User feedback recorded: predicted {prediction.final_action.value}, actual {actual_action.value}")
+            logger.info("User feedback recorded: predicted %s, actual %s", prediction.final_action.value, actual_action.value)
             
         except Exception as e:
-            logger.error(f"Recording user feedback failed: {e}")
+            logger.error("Recording user feedback failed: %s", e)
+    
+    def _update_threshold_window(self, is_hybrid_ml: bool, confidence: float, correct: bool):
+        """Slide the threshold window by one entry, keeping the per-threshold counts in step"""
+        if len(self._threshold_window) == THRESHOLD_WINDOW:
+            self._apply_threshold_counts(*self._threshold_window[0], sign=-1)
+        self._threshold_window.append((is_hybrid_ml, confidence, correct))
+        self._apply_threshold_counts(is_hybrid_ml, confidence, correct, sign=1)
+    
+    def _apply_threshold_counts(self, is_hybrid_ml: bool, confidence: float, correct: bool, sign: int):
+        """Add (sign=1) or remove (sign=-1) one entry from the per-threshold counts"""
+        if not is_hybrid_ml:
+            return
+        for i, threshold in enumerate(CONFIDENCE_LEVELS):
+            if confidence >= threshold:
+                self._threshold_totals[i] += sign
+                if correct:
+                    self._threshold_correct[i] += sign
     
     def switch_mode(self, new_mode: TriggerMode):
         """Switch operating mode"""
@@ -443,7 +489,7 @@ class HybridAutoTriggerSystem:
         self.mode = new_mode
         self.performance_metrics['mode_switches'] += 1
         
-        logger.info(f"Switched trigger mode from {old_mode.value} to {new_mode.value}")
+        logger.info("Switched trigger mode from %s to %s", old_mode.value, new_mode.value)
     
     def get_performance_metrics(self) -> Dict[str, Any]:
         """Get comprehensive performance metrics"""
@@ -453,7 +499,7 @@ class HybridAutoTriggerSystem:
             'hybrid_metrics': self.performance_metrics,
             'ml_metrics': ml_metrics,
             'current_mode': self.mode.value,
-            'total_adaptations': len(self.adaptation_history),
+            'total_adaptations': self.total_adaptations,
             'ml_confidence_threshold': self.ml_confidence_threshold
         }
     
@@ -464,25 +510,13 @@ class HybridAutoTriggerSystem:
             return
         
         try:
-            # Analyze recent performance
-            recent_feedback = self.adaptation_history[-100:]  # Last 100 examples
-            
-            # Calculate accuracy for different confidence levels
-            confidence_levels = [0.5, 0.6, 0.7, 0.8, 0.9]
+            # Accuracy per confidence level over the recent window, kept up to date as feedback arrives
             best_threshold = self.ml_confidence_threshold
             best_accuracy = 0.0
             
-            for threshold in confidence_levels:
-                correct = 0
-                total = 0
-                
-                for feedback in recent_feedback:
-                    if (feedback['method_used'].startswith('hybrid_ml') and 
-                        feedback['confidence'] >= threshold):
-                        total += 1
-                        if feedback['predicted_action'] == feedback['actual_action']:
-                            correct += 1
-                
+            for threshold, total, correct in zip(
+                CONFIDENCE_LEVELS, self._threshold_totals, self._threshold_correct
+            ):
                 if total > 10:  # Minimum samples
                     accuracy = correct / total
                     if accuracy > best_accuracy:
@@ -494,17 +528,17 @@ class HybridAutoTriggerSystem:
                 old_threshold = self.ml_confidence_threshold
                 self.ml_confidence_threshold = best_threshold
                 
-                logger.info(f"Optimized ML confidence threshold: {old_threshold:.2f} → {best_threshold:.2f} (accuracy: {best_accuracy:.2f})")
+                logger.info("Optimized ML confidence threshold: %.2f → %.2f (accuracy: %.2f)", old_threshold, best_threshold, best_accuracy)
         
         except Exception as e:
-            logger.error(f"Threshold optimization failed: {e}")
+            logger.error("Threshold optimization failed: %s", e)
     
     async def export_analysis_data(self, file_path: str):
         """Export data for analysis and debugging"""
         
         analysis_data = {
             'performance_metrics': self.get_performance_metrics(),
-            'adaptation_history': self.adaptation_history,
+            'adaptation_history': list(self.adaptation_history),
             'current_mode': self.mode.value,
             'ml_confidence_threshold': self.ml_confidence_threshold,
             'export_timestamp': datetime.now().isoformat()
@@ -513,7 +547,7 @@ class HybridAutoTriggerSystem:
         with open(file_path, 'w') as f:
             json.dump(analysis_data, f, indent=2)
         
-        logger.info(f"Analysis data exported to {file_path}")
+        logger.info("Analysis data exported to %s", file_path)
 
 
 def create_hybrid_auto_trigger_system(
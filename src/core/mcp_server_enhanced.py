@@ -7,7 +7,7 @@ Adds intelligent auto-triggering capabilities to the standard MCP server
 import asyncio
 import json
 import time
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from datetime import datetime, timezone
 
 from mcp.server import Server, NotificationOptions
@@ -229,7 +229,7 @@ class EnhancedMCPServer:
                 raise ValueError("Content is required")
             
             # Add auto-trigger metadata if this was triggered automatically
-            if metadata.get("auto_triggered"):
+            if metadata.get("auto_triggered") and "trigger_timestamp" not in metadata:
                 metadata["trigger_timestamp"] = datetime.now(timezone.utc).isoformat()
             
             result = await self.memory_service.create_memory(
@@ -331,6 +331,9 @@ class EnhancedMCPServer:
             platform = arguments.get("platform", "unknown")
             arguments.get("context", {})
             
+            # One timestamp for the whole turn, shared by every action it triggers
+            turn_timestamp = datetime.now(timezone.utc).isoformat()
+            
             # Store conversation in buffer
             self.conversation_buffer[platform] = messages
             self.last_interaction_time[platform] = time.time()
@@ -340,21 +343,12 @@ class EnhancedMCPServer:
             if platform in self.auto_trigger_platforms and self.auto_trigger_system:
                 triggered_actions = await self.auto_trigger_system.check_triggers(messages, platform)
             
-            # Execute triggered actions
-            execution_results = []
-            for action, params in triggered_actions:
-                try:
-                    if action == "save_memory":
-                        result = await self._handle_save_memory(params)
-                        execution_results.append({"action": action, "result": "success", "details": result})
-                    elif action == "search_memories":
-                        result = await self._handle_search_memories(params)
-                        execution_results.append({"action": action, "result": "success", "details": result})
-                    elif action == "get_memory_context":
-                        result = await self._handle_get_memory_context(params)
-                        execution_results.append({"action": action, "result": "success", "details": result})
-                except Exception as e:
-                    execution_results.append({"action": action, "result": "error", "error": str(e)})
+            # Execute triggered actions concurrently; they are independent of each other
+            results = await asyncio.gather(*(
+                self._execute_triggered_action(action, params, turn_timestamp)
+                for action, params in triggered_actions
+            ))
+            execution_results = [result for result in results if result is not None]
             
             return [types.TextContent(
                 type="text",
@@ -364,7 +358,7 @@ class EnhancedMCPServer:
                     "messages_registered": len(messages),
                     "triggered_actions": len(triggered_actions),
                     "execution_results": execution_results,
-                    "timestamp": datetime.now(timezone.utc).isoformat()
+                    "timestamp": turn_timestamp
                 })
             )]
             
@@ -372,6 +366,23 @@ class EnhancedMCPServer:
             logger.error(f"Register conversation failed: {e}")
             raise
     
+    async def _execute_triggered_action(self, action: str, params: Dict[str, Any], turn_timestamp: str) -> Optional[Dict[str, Any]]:
+        """Execute one auto-triggered action and describe its outcome"""
+        try:
+            if action == "save_memory":
+                params.setdefault("metadata", {}).setdefault("trigger_timestamp", turn_timestamp)
+                result = await self._handle_save_memory(params)
+            elif action == "search_memories":
+                result = await self._handle_search_memories(params)
+            elif action == "get_memory_context":
+                result = await self._handle_get_memory_context(params)
+            else:
+                return None
+            return {"action": action, "result": "success", "details": result}
+        except Exception as e:
+            logger.error(f"Auto-triggered {action} failed: {e}")
+            return {"action": action, "result": "error", "error": str(e)}
+    
     async def _handle_trigger_auto_analysis(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Handle manual trigger of auto-analysis"""
         try:
@@ -4,9 +4,11 @@ ML-Based Auto-Trigger System for MCP Memory Server
 Intelligent triggering using machine learning instead of deterministic rules
 """
 
+import asyncio
 import json
 import numpy as np
 import pickle
+from collections import OrderedDict, deque
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
@@ -38,6 +40,12 @@ from ..services.memory_service import MemoryService
 
 logger = get_logger(__name__)
 
+# Messages shorter than this (acknowledgements like "ok, thanks") can't form a useful memory query
+MIN_SIMILARITY_QUERY_LENGTH = 10
+
+# Per-user behavior contexts kept in LRU order; the least recently seen user is dropped beyond this
+MAX_TRACKED_USERS = 1024
+
 
 class ActionType(Enum):
     """Types of memory actions"""
@@ -148,11 +156,30 @@ class FeatureExtractor:
         sentence_count = len([s for s in sentences if s.strip()])
         avg_word_length = sum(len(w) for w in words) / max(word_count, 1)
         
+        # Embed the message and recent context in one batch; every semantic feature below reuses them
+        recent_context = self._recent_context(conversation_history)
+        try:
+            texts = [message, recent_context] if recent_context.strip() else [message]
+            embeddings = await self.embedding_service.generate_embeddings_batch(texts)
+            message_embedding = embeddings[0]
+            context_embedding = embeddings[1] if len(embeddings) > 1 else None
+        except Exception:
+            message_embedding = context_embedding = None
+        
+        # The memory search and the other embedding-backed features are independent; run them concurrently
+        semantic_density, similarity_to_existing, topic_coherence = await asyncio.gather(
+            self._calculate_semantic_density(message, message_embedding),
+            self._calculate_similarity_to_existing(message, message_embedding),
+            self._calculate_topic_coherence(
+                message, conversation_history, message_embedding, context_embedding
+            )
+        )
+        
         # Semantic features
-        semantic_density = await self._calculate_semantic_density(message)
-        technical_content_score = self._calculate_technical_score(message)
-        question_score = self._calculate_question_score(message)
-        solution_score = self._calculate_solution_score(message)
+        message_lower = message.lower()
+        technical_content_score = self._calculate_technical_score(message_lower)
+        question_score = self._calculate_question_score(message_lower)
+        solution_score = self._calculate_solution_score(message_lower)
         
         # Context features
         conversation_position = len(conversation_history)
@@ -160,9 +187,8 @@ class FeatureExtractor:
         user_engagement_score = self._calculate_engagement_score(conversation_history)
         
         # Memory-related features
-        similarity_to_existing = await self._calculate_similarity_to_existing(message)
         novelty_score = 1.0 - similarity_to_existing  # Inverse of similarity
-        importance_indicators = self._count_importance_indicators(message)
+        importance_indicators = self._count_importance_indicators(message_lower)
         
         # Platform features
         session_length = len(conversation_history)
@@ -170,7 +196,6 @@ class FeatureExtractor:
         # Behavioral features
         user_save_frequency = user_context.get('save_frequency', 0.0)
         user_search_frequency = user_context.get('search_frequency', 0.0)
-        topic_coherence = await self._calculate_topic_coherence(message, conversation_history)
         
         return MLFeatures(
             text_length=text_length,
@@ -194,11 +219,12 @@ class FeatureExtractor:
             topic_coherence=topic_coherence
         )
     
-    async def _calculate_semantic_density(self, text: str) -> float:
+    async def _calculate_semantic_density(self, text: str, embedding: Optional[List[float]] = None) -> float:
         """Calculate how information-dense the text is"""
         try:
             # Use embedding to measure information density
-            embedding = await self.embedding_service.generate_embedding(text)
+            if embedding is None:
+                embedding = await self.embedding_service.generate_embedding(text)
             
             # Calculate variance of embedding dimensions as density proxy
             embedding_array = np.array(embedding)
@@ -212,24 +238,21 @@ class FeatureExtractor:
             total_words = len(text.split())
             return len(words) / max(total_words, 1)
     
-    def _calculate_technical_score(self, text: str) -> float:
-        """Calculate how technical the content is"""
-        text_lower = text.lower()
+    def _calculate_technical_score(self, text_lower: str) -> float:
+        """Calculate how technical the (lowercased) content is"""
         technical_count = sum(1 for keyword in self.technical_keywords 
                             if keyword in text_lower)
         return min(technical_count / 5.0, 1.0)  # Normalize to 0-1
     
-    def _calculate_question_score(self, text: str) -> float:
-        """Calculate how much the text is asking questions"""
-        text_lower = text.lower()
-        question_count = text.count('?')
+    def _calculate_question_score(self, text_lower: str) -> float:
+        """Calculate how much the (lowercased) text is asking questions"""
+        question_count = text_lower.count('?')
         pattern_count = sum(1 for pattern in self.question_patterns 
                           if pattern in text_lower)
         return min((question_count + pattern_count) / 3.0, 1.0)
     
-    def _calculate_solution_score(self, text: str) -> float:
-        """Calculate how much the text provides solutions"""
-        text_lower = text.lower()
+    def _calculate_solution_score(self, text_lower: str) -> float:
+        """Calculate how much the (lowercased) text provides solutions"""
         solution_count = sum(1 for pattern in self.solution_patterns 
                            if pattern in text_lower)
         return min(solution_count / 3.0, 1.0)
@@ -264,17 +287,22 @@ class FeatureExtractor:
         engagement = min(avg_length / 100.0, 1.0)
         return engagement
     
-    async def _calculate_similarity_to_existing(self, text: str) -> float:
+    async def _calculate_similarity_to_existing(self, text: str, embedding: Optional[List[float]] = None) -> float:
         """Calculate similarity to existing memories"""
         try:
             if not self.memory_service:
                 return 0.0
+            
+            # Skip the search round-trip entirely for trivially short messages
+            if len(text.strip()) < MIN_SIMILARITY_QUERY_LENGTH:
+                return 0.0
                 
             # Search for similar content in existing memories
             memories = await self.memory_service.search_memories(
                 query=text,
                 max_results=1,
-                similarity_threshold=0.0
+                similarity_threshold=0.0,
+                query_embedding=embedding
             )
             
             if memories:
@@ -287,32 +315,44 @@ class FeatureExtractor:
                     return 0.0
             return 0.0
         except Exception as e:
-            logger.debug(f"Error calculating similarity to existing: {e}")
+            logger.debug("Error calculating similarity to existing: %s", e)
             return 0.0
     
-    def _count_importance_indicators(self, text: str) -> int:
-        """Count indicators of important content"""
-        text_lower = text.lower()
+    def _count_importance_indicators(self, text_lower: str) -> int:
+        """Count indicators of important (lowercased) content"""
         return sum(1 for indicator in self.importance_indicators 
                   if indicator in text_lower)
     
-    async def _calculate_topic_coherence(self, text: str, history: List[Dict]) -> float:
+    def _recent_context(self, history: List[Dict]) -> str:
+        """Join the last few conversation messages into one context string"""
+        return " ".join([
+            msg.get('content', '') for msg in history[-3:]
+        ])
+    
+    async def _calculate_topic_coherence(
+        self,
+        text: str,
+        history: List[Dict],
+        embedding: Optional[List[float]] = None,
+        context_embedding: Optional[List[float]] = None
+    ) -> float:
         """Calculate how coherent the current message is with conversation topic"""
         if not history:
             return 1.0
         
         try:
             # Get recent conversation context
-            recent_context = " ".join([
-                msg.get('content', '') for msg in history[-3:]
-            ])
+            recent_context = self._recent_context(history)
             
             if not recent_context.strip():
                 return 1.0
             
             # Calculate semantic similarity between current message and recent context
-            current_embedding = await self.embedding_service.generate_embedding(text)
-            context_embedding = await self.embedding_service.generate_embedding(recent_context)
+            current_embedding = embedding
+            if current_embedding is None:
+                current_embedding = await self.embedding_service.generate_embedding(text)
+            if context_embedding is None:
+                context_embedding = await self.embedding_service.generate_embedding(recent_context)
             
             # Calculate cosine similarity
             similarity = cosine_similarity(
@@ -339,7 +379,7 @@ class HuggingFaceMLTriggerModel:
         self.label_mapping = {0: "SAVE_MEMORY", 1: "SEARCH_MEMORY", 2: "NO_ACTION"}
         self.confidence_threshold = 0.7  # Minimum confidence for prediction
         
-        logger.info(f"Initializing HuggingFace ML model: {model_name}")
+        logger.info("Initializing HuggingFace ML model: %s", model_name)
         
     def load_model(self) -> bool:
         """Load the trained model from Hugging Face Hub"""
@@ -348,7 +388,7 @@ class HuggingFaceMLTriggerModel:
                 logger.error("PyTorch not available for HuggingFace model")
                 return False
                 
-            logger.info(f"Loading model from HuggingFace Hub: {self.model_name}")
+            logger.info("Loading model from HuggingFace Hub: %s", self.model_name)
             
             # Load using pipeline for easy inference
             device = -1  # Default to CPU
@@ -372,7 +412,7 @@ class HuggingFaceMLTriggerModel:
             return True
             
         except Exception as e:
-            logger.error(f"Failed to load HuggingFace model: {e}")
+            logger.error("Failed to load HuggingFace model: %s", e)
             return False
     
     def predict(self, text: str, features: MLFeatures = None) -> Tuple[ActionType, float]:
@@ -409,12 +449,12 @@ class HuggingFaceMLTriggerModel:
             # Map to ActionType
             action = self.class_mapping.get(predicted_label, ActionType.NO_ACTION)
             
-            logger.debug(f"HF Prediction: {predicted_label} (confidence: {confidence:.3f})")
+            logger.debug("HF Prediction: %s (confidence: %.3f)", predicted_label, confidence)
             
             return action, confidence
             
         except Exception as e:
-            logger.error(f"Prediction error: {e}")
+            logger.error("Prediction error: %s", e)
             return ActionType.NO_ACTION, 0.0
     
     def update_model(self, features: MLFeatures, action: ActionType, user_feedback: Optional[Dict[str, Any]] = None) -> bool:
@@ -432,13 +472,13 @@ class HuggingFaceMLTriggerModel:
             }
             
             # Log for future retraining
-            logger.info(f"Feedback logged for model improvement: {feedback_data}")
+            logger.info("Feedback logged for model improvement: %s", feedback_data)
             
             # TODO: Implement periodic retraining pipeline
             return True
             
         except Exception as e:
-            logger.error(f"Error logging feedback: {e}")
+            logger.error("Error logging feedback: %s", e)
             return False
     
     def get_feature_importance(self) -> Dict[str, float]:
@@ -570,7 +610,7 @@ class MLTriggerModel:
             )
             
         except Exception as e:
-            logger.error(f"ML prediction failed: {e}")
+            logger.error("ML prediction failed: %s", e)
             return self._fallback_prediction(features)
     
     def _fallback_prediction(self, features: MLFeatures) -> MLPrediction:
@@ -707,10 +747,10 @@ class MLTriggerModel:
             # Save models
             await self._save_models()
             
-            logger.info(f"Models retrained with {len(self.training_data)} examples")
+            logger.info("Models retrained with %s examples", len(self.training_data))
             
         except Exception as e:
-            logger.error(f"Model retraining failed: {e}")
+            logger.error("Model retraining failed: %s", e)
     
     async def _save_models(self):
         """Save trained models to disk"""
@@ -728,10 +768,10 @@ class MLTriggerModel:
             with open(model_file, 'wb') as f:
                 pickle.dump(model_data, f)
             
-            logger.info(f"Models saved to {model_file}")
+            logger.info("Models saved to %s", model_file)
             
         except Exception as e:
-            logger.error(f"Model saving failed: {e}")
+            logger.error("Model saving failed: %s", e)
     
     async def load_models(self):
         """Load trained models from disk"""
@@ -747,11 +787,11 @@ class MLTriggerModel:
                 self.training_data = model_data.get('training_data', [])
                 self.model_version = model_data.get('model_version', '1.0.0')
                 
-                logger.info(f"Models loaded from {model_file}")
+                logger.info("Models loaded from %s", model_file)
                 return True
             
         except Exception as e:
-            logger.error(f"Model loading failed: {e}")
+            logger.error("Model loading failed: %s", e)
         
         return False
 
@@ -774,16 +814,16 @@ class MLAutoTriggerSystem:
             self.ml_model = HuggingFaceMLTriggerModel(
                 model_name=self.config.ml_triggers.huggingface_model_name
             )
-            logger.info(f"Using HuggingFace model: {self.config.ml_triggers.huggingface_model_name}")
+            logger.info("Using HuggingFace model: %s", self.config.ml_triggers.huggingface_model_name)
         else:
             # Fallback to sklearn model
             model_dir = Path(self.config.embedding.model_cache_dir)
             self.ml_model = MLTriggerModel(model_dir)
-            logger.info(f"Using sklearn model: {self.config.ml_triggers.model_type}")
+            logger.info("Using sklearn model: %s", self.config.ml_triggers.model_type)
         
-        # User behavior tracking
-        self.user_contexts = {}
-        self.action_history = []
+        # User behavior tracking (bounded LRU, most recently active user last)
+        self.user_contexts: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.action_history: deque = deque(maxlen=1000)  # Recent actions only
         
         # Performance metrics
         self.metrics = {
@@ -867,11 +907,11 @@ class MLAutoTriggerSystem:
             # Update user context
             self._update_user_context(user_id, features, prediction)
             
-            logger.info(f"ML prediction: {prediction.action.value} (confidence: {prediction.confidence:.2f})")
+            logger.info("ML prediction: %s (confidence: %.2f)", prediction.action.value, prediction.confidence)
             return prediction
             
         except Exception as e:
-            logger.error(f"ML analysis failed: {e}")
+            logger.error("ML analysis failed: %s", e)
             # Fallback to simple heuristics
             return MLPrediction(
                 action=ActionType.NO_ACTION,
@@ -921,7 +961,7 @@ class MLAutoTriggerSystem:
         
         self.metrics['actions_taken'] += 1
         
-        logger.info(f"Learned from action: {action_taken.value} for user {user_id}")
+        logger.info("Learned from action: %s for user %s", action_taken.value, user_id)
     
     def _update_user_context(self, user_id: str, features: MLFeatures, prediction: MLPrediction):
         """Update user context based on interaction"""
@@ -932,6 +972,10 @@ class MLAutoTriggerSystem:
                 'total_interactions': 0,
                 'preferences': {}
             }
+            if len(self.user_contexts) > MAX_TRACKED_USERS:
+                self.user_contexts.popitem(last=False)
+        else:
+            self.user_contexts.move_to_end(user_id)
         
         context = self.user_contexts[user_id]
         context['total_interactions'] += 1
@@ -964,7 +1008,7 @@ class MLAutoTriggerSystem:
     async def export_training_data(self, file_path: Path):
         """Export training data for analysis"""
         data = {
-            'action_history': self.action_history,
+            'action_history': list(self.action_history),
             'user_contexts': self.user_contexts,
             'metrics': self.metrics,
             'export_timestamp': datetime.now().isoformat()
@@ -973,7 +1017,7 @@ class MLAutoTriggerSystem:
         with open(file_path, 'w') as f:
             json.dump(data, f, indent=2)
         
-        logger.info(f"Training data exported to {file_path}")
+        logger.info("Training data exported to %s", file_path)
 
 
 def create_ml_auto_trigger_system(
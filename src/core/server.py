@@ -16,6 +16,45 @@ from ..services.database_service import DatabaseService
 from ..utils.exceptions import MCPMemoryError
 from .ml_trigger_system import ActionType, create_ml_auto_trigger_system
 
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+# Keyword categories for the deterministic analyze_message fallback
+_FALLBACK_KEYWORDS = {
+    "trigger": ["remember", "save", "important", "note", "recall", "ricorda", "nota", "importante", "salva", "memorizza"],
+    "solution": ["solved", "fixed", "bug fix", "solution", "tutorial", "how to", "risolto", "come fare"],
+}
+
+
+def _build_fallback_automaton() -> "ahocorasick.Automaton":
+    """Build one Aho-Corasick automaton mapping every fallback keyword to its category"""
+    automaton = ahocorasick.Automaton()
+    for category, keywords in _FALLBACK_KEYWORDS.items():
+        for keyword in keywords:
+            automaton.add_word(keyword, category)
+    automaton.make_automaton()
+    return automaton
+
+
+_FALLBACK_AUTOMATON = _build_fallback_automaton() if HAS_AHOCORASICK else None
+
+# Messages shorter than this with no trigger keyword ("ok", "thanks") skip ML analysis
+_TRIVIAL_MESSAGE_LENGTH = 8
+
+
+def _match_fallback_categories(message: str) -> set:
+    """Return the fallback keyword categories found in message, in a single pass when possible"""
+    message_lower = message.lower()
+    if _FALLBACK_AUTOMATON is not None:
+        return {category for _, category in _FALLBACK_AUTOMATON.iter(message_lower)}
+    return {
+        category for category, keywords in _FALLBACK_KEYWORDS.items()
+        if any(keyword in message_lower for keyword in keywords)
+    }
+
 
 class MCPServer:
     """Unified MCP Server for all platforms"""
@@ -77,6 +116,32 @@ class MCPServer:
                         "required": ["content"]
                     }
                 ),
+                types.Tool(
+                    name="save_memories",
+                    description="Save several memories in one call",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "items": {
+                                "type": "array",
+                                "description": "Memories to save; each takes the same fields as save_memory",
+                                "items": {
+                                    "type": "object",
+                                    "properties": {
+                                        "content": {"type": "string", "description": "Memory content"},
+                                        "project": {"type": "string", "description": "Project name", "default": "default"},
+                                        "importance": {"type": "number", "minimum": 0, "maximum": 1, "default": 0.5},
+                                        "tags": {"type": "array", "items": {"type": "string"}, "default": []},
+                                        "metadata": {"type": "object", "default": {}},
+                                        "context": {"type": "object", "default": {}}
+                                    },
+                                    "required": ["content"]
+                                }
+                            }
+                        },
+                        "required": ["items"]
+                    }
+                ),
                 types.Tool(
                     name="search_memories",
                     description="Search memories using semantic similarity",
@@ -92,6 +157,21 @@ class MCPServer:
                         "required": ["query"]
                     }
                 ),
+                types.Tool(
+                    name="search_memories_batch",
+                    description="Search memories for several queries at once, with per-query limits and thresholds",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "queries": {"type": "array", "items": {"type": "string"}, "minItems": 1},
+                            "project": {"type": "string", "description": "Project to search in"},
+                            "limits": {"type": "array", "items": {"type": "integer", "minimum": 1, "maximum": 100}},
+                            "thresholds": {"type": "array", "items": {"type": "number", "minimum": 0, "maximum": 1}},
+                            "tags": {"type": "array", "items": {"type": "string"}, "default": []}
+                        },
+                        "required": ["queries"]
+                    }
+                ),
                 types.Tool(
                     name="list_memories",
                     description="List all memories for a project",
@@ -181,28 +261,28 @@ class MCPServer:
                 )
             ]
         
+        # Tool name -> bound handler, built once instead of walking an if/elif chain per call
+        tool_handlers = {
+            "save_memory": self._handle_save_memory,
+            "save_memories": self._handle_save_memories,
+            "search_memories": self._handle_search_memories,
+            "search_memories_batch": self._handle_search_memories_batch,
+            "search_memory": self._handle_search_memory,
+            "list_memories": self._handle_list_memories,
+            "memory_status": self._handle_memory_status,
+            "auto_save_memory": self._handle_auto_save_memory,
+            "analyze_message": self._handle_analyze_message,
+            "get_memory_stats": self._handle_get_memory_stats,
+        }
+        
         @self.server.call_tool()
         async def handle_call_tool(name: str, arguments: dict) -> list[types.TextContent]:
             """Handle tool calls"""
             try:
-                if name == "save_memory":
-                    result = await self._handle_save_memory(arguments)
-                elif name == "search_memories":
-                    result = await self._handle_search_memories(arguments)
-                elif name == "search_memory":
-                    result = await self._handle_search_memory(arguments)
-                elif name == "list_memories":
-                    result = await self._handle_list_memories(arguments)
-                elif name == "memory_status":
-                    result = await self._handle_memory_status(arguments)
-                elif name == "auto_save_memory":
-                    result = await self._handle_auto_save_memory(arguments)
-                elif name == "analyze_message":
-                    result = await self._handle_analyze_message(arguments)
-                elif name == "get_memory_stats":
-                    result = await self._handle_get_memory_stats(arguments)
-                else:
+                handler = tool_handlers.get(name)
+                if handler is None:
                     raise MCPMemoryError(f"Unknown tool: {name}")
+                result = await handler(arguments)
                 
                 return [types.TextContent(type="text", text=result)]
                 
@@ -210,37 +290,39 @@ class MCPServer:
                 self.logger.error(f"Error handling tool {name}: {e}")
                 raise MCPMemoryError(f"Tool execution failed: {e}")
     
+    @staticmethod
+    def _memory_fields(arguments: dict) -> dict:
+        """create_memory fields from a save_memory item, with SAM-compatible context defaults"""
+        content = arguments.get("content", "")
+        if not content:
+            raise ValueError("Content is required")
+        
+        importance = arguments.get("importance", 0.5)
+        tags = arguments.get("tags", [])
+        
+        # Add platform context for SAM compatibility
+        context = dict(arguments.get("context") or {})
+        context.setdefault("category", "conversation")
+        context.setdefault("importance", importance)
+        context.setdefault("tags", tags)
+        
+        return {
+            "content": content,
+            "project": arguments.get("project", "default"),
+            "importance": importance,
+            "tags": tags,
+            "metadata": arguments.get("metadata", {}),
+            "context": context
+        }
+    
     async def _handle_save_memory(self, arguments: dict) -> str:
         """Handle save_memory tool"""
         try:
-            content = arguments.get("content", "")
-            if not content:
-                raise ValueError("Content is required")
-            
-            # Extract SAM-compatible parameters
-            context = arguments.get("context", {})
-            project = arguments.get("project", "default")
-            importance = arguments.get("importance", 0.5)
-            tags = arguments.get("tags", [])
-            metadata = arguments.get("metadata", {})
-            
-            # Add platform context for SAM compatibility
-            if "category" not in context:
-                context["category"] = "conversation"
-            if "importance" not in context:
-                context["importance"] = importance
-            if "tags" not in context:
-                context["tags"] = tags
+            fields = self._memory_fields(arguments)
+            content = fields["content"]
             
             # Create memory using the service
-            memory = await self.memory_service.create_memory(
-                content=content,
-                project=project,
-                importance=importance,
-                tags=tags,
-                metadata=metadata,
-                context=context
-            )
+            memory = await self.memory_service.create_memory(**fields)
             
             # Return SAM-compatible response
             response = {
@@ -264,6 +346,79 @@ class MCPServer:
             }
             return json.dumps(error_response)
     
+    async def _handle_save_memories(self, arguments: dict) -> str:
+        """Handle save_memories tool"""
+        try:
+            items = arguments.get("items", [])
+            if not items:
+                raise ValueError("At least one item is required")
+            
+            memories = await self.memory_service.create_memories([self._memory_fields(item) for item in items])
+            
+            response = {
+                "success": True,
+                "memory_ids": [memory.id for memory in memories],
+                "count": len(memories),
+                "message": f"{len(memories)} memories saved successfully"
+            }
+            
+            return json.dumps(response)
+            
+        except Exception as e:
+            self.logger.error(f"Failed to save memories: {e}")
+            error_response = {
+                "success": False,
+                "error": str(e),
+                "message": "Failed to save memories"
+            }
+            return json.dumps(error_response)
+    
+    async def _handle_search_memories_batch(self, arguments: dict) -> str:
+        """Handle search_memories_batch tool"""
+        try:
+            queries = arguments.get("queries", [])
+            if not queries:
+                raise ValueError("At least one query is required")
+            
+            default_threshold = self.settings.ml_triggers.similarity_threshold
+            limits = arguments.get("limits") or [20] * len(queries)
+            thresholds = arguments.get("thresholds") or [default_threshold] * len(queries)
+            if len(limits) != len(queries) or len(thresholds) != len(queries):
+                raise ValueError("limits and thresholds must match the number of queries")
+            
+            results_per_query = await self.memory_service.search_memories_batch(
+                queries=queries,
+                project=arguments.get("project"),
+                max_results=limits,
+                similarity_thresholds=thresholds,
+                tags=arguments.get("tags", [])
+            )
+            
+            response = {
+                "success": True,
+                "results": [
+                    {
+                        "query": query,
+                        "memories": [
+                            {
+                                "id": memory.id,
+                                "project": memory.project,
+                                "content": memory.content,
+                                "similarity_score": memory.similarity_score
+                            }
+                            for memory in results
+                        ]
+                    }
+                    for query, results in zip(queries, results_per_query)
+                ]
+            }
+            
+            return json.dumps(response)
+            
+        except Exception as e:
+            self.logger.error(f"Failed to search memories in batch: {e}")
+            raise MCPMemoryError(f"Failed to search memories in batch: {e}")
+    
     async def _handle_search_memories(self, arguments: dict) -> str:
         """Handle search_memories tool"""
         try:
@@ -281,12 +436,14 @@ class MCPServer:
             if not results:
                 return "🔍 No memories found matching your query."
             
-            response = f"🔍 Found {len(results)} memories:\n\n"
-            for i, memory in enumerate(results, 1):
-                response += f"{i}. **{memory.project}** - {memory.content[:100]}...\n"
-                response += f"   Similarity: {memory.similarity_score:.2f}\n\n"
+            lines = [f"🔍 Found {len(results)} memories:\n\n"]
+            lines.extend(
+                f"{i}. **{memory.project}** - {memory.content[:100]}...\n"
+                f"   Similarity: {memory.similarity_score:.2f}\n\n"
+                for i, memory in enumerate(results, 1)
+            )
             
-            return response
+            return "".join(lines)
             
         except Exception as e:
             self.logger.error(f"Failed to search memories: {e}")
@@ -304,12 +461,14 @@ class MCPServer:
             if not memories:
                 return f"📝 No memories found for project: {arguments.get('project', 'default')}"
             
-            response = f"📝 Found {len(memories)} memories:\n\n"
-            for i, memory in enumerate(memories, 1):
-                response += f"{i}. **{memory.project}** - {memory.content[:100]}...\n"
-                response += f"   Created: {memory.created_at.strftime('%Y-%m-%d %H:%M')}\n\n"
+            lines = [f"📝 Found {len(memories)} memories:\n\n"]
+            lines.extend(
+                f"{i}. **{memory.project}** - {memory.content[:100]}...\n"
+                f"   Created: {memory.created_at:%Y-%m-%d %H:%M}\n\n"
+                for i, memory in enumerate(memories, 1)
+            )
             
-            return response
+            return "".join(lines)
             
         except Exception as e:
             self.logger.error(f"Failed to list memories: {e}")
@@ -320,15 +479,15 @@ class MCPServer:
         try:
             status = await self.memory_service.get_status()
             
-            response = "📊 **Memory System Status**\n\n"
-            response += f"• **Total Memories**: {status['total_memories']}\n"
-            response += f"• **Projects**: {status['total_projects']}\n"
-            response += f"• **Storage**: {status['storage_type']}\n"
-            response += f"• **Auto-save**: {'✅ Enabled' if status['auto_save_enabled'] else '❌ Disabled'}\n"
-            response += f"• **ML Triggers**: {'✅ Enabled' if status['ml_triggers_enabled'] else '❌ Disabled'}\n"
-            response += f"• **Last Activity**: {status['last_activity']}\n"
-            
-            return response
+            return "".join([
+                "📊 **Memory System Status**\n\n",
+                f"• **Total Memories**: {status['total_memories']}\n",
+                f"• **Projects**: {status['total_projects']}\n",
+                f"• **Storage**: {status['storage_type']}\n",
+                f"• **Auto-save**: {'✅ Enabled' if status['auto_save_enabled'] else '❌ Disabled'}\n",
+                f"• **ML Triggers**: {'✅ Enabled' if status['ml_triggers_enabled'] else '❌ Disabled'}\n",
+                f"• **Last Activity**: {status['last_activity']}\n",
+            ])
             
         except Exception as e:
             self.logger.error(f"Failed to get memory status: {e}")
@@ -357,9 +516,11 @@ class MCPServer:
         try:
             self.logger.info("🚀 Initializing MCP Memory Server...")
             
-            # Initialize services
-            await self.database_service.initialize()
-            await self.embedding_service.initialize()
+            # Database connection and model loading are independent; overlap them
+            await asyncio.gather(
+                self.database_service.initialize(),
+                self.embedding_service.initialize()
+            )
             await self.memory_service.initialize()
             
             # Initialize ML trigger system
@@ -441,9 +602,11 @@ class MCPServer:
             
             # Use ML configuration from settings
             ml_config = self.settings.ml_triggers
+            matched = _match_fallback_categories(message)
+            is_trivial = len(message.strip()) < _TRIVIAL_MESSAGE_LENGTH and not matched
             
-            # If ML trigger system is available, use it
-            if self.ml_trigger_system:
+            # If ML trigger system is available, use it (short interjections go straight to the fallback)
+            if self.ml_trigger_system and not is_trivial:
                 try:
                     # Create conversation history format expected by ML system
                     conversation_history = []
@@ -566,19 +729,16 @@ class MCPServer:
                 }
             }
             
-            trigger_keywords = ["remember", "save", "important", "note", "recall", "ricorda", "nota", "importante", "salva", "memorizza"]
-            solution_patterns = ["solved", "fixed", "bug fix", "solution", "tutorial", "how to", "risolto", "come fare"]
-            
             confidence = 0.0
             triggers = []
             
             # Check for memory triggers
-            if any(keyword in message.lower() for keyword in trigger_keywords):
+            if "trigger" in matched:
                 confidence += 0.6
                 triggers.append("save_memory")
             
             # Check for solution patterns (higher importance)
-            if any(pattern in message.lower() for pattern in solution_patterns):
+            if "solution" in matched:
                 confidence += 0.4
                 if "save_memory" not in triggers:
                     triggers.append("save_memory")
@@ -5,10 +5,12 @@ Funziona in memoria senza database esterno
 """
 
 import asyncio
+import heapq
 import sys
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, List
 import time
+from dataclasses import dataclass, asdict
 from datetime import datetime
 
 # MCP imports
@@ -26,11 +28,16 @@ if src_path.exists():
 MEMORY_STORE = []
 EMBEDDING_CACHE = {}
 
+def _iso(timestamp: float) -> str:
+    """Format an epoch timestamp as ISO 8601 local time"""
+    return datetime.fromtimestamp(timestamp).isoformat()
+
 class InMemoryDatabase:
     """Simple in-memory database for testing"""
     
     def __init__(self):
         self.memories = []
+        self._contents_lower = []  # Lowercased content, parallel to self.memories
         self.next_id = 1
     
     async def save_memory(self, content: str, importance: float = 0.5, 
@@ -45,39 +52,52 @@ class InMemoryDatabase:
             'importance': importance,
             'memory_type': memory_type,
             'metadata': metadata or {},
-            'timestamp': datetime.now().isoformat(),
-            'created_at': time.time()
+            'created_at': time.time()  # Formatted only when a response shows it
         }
         
         self.memories.append(memory)
+        self._contents_lower.append(content.lower())
         return memory
     
     async def search_memories(self, query: str, limit: int = 5) -> List[Dict]:
         """Simple text-based search"""
         query_lower = query.lower()
-        results = []
+        # Simulate similarity score
+        similarity = min(0.5 + (query_lower.count(' ') * 0.1), 1.0)
         
-        for memory in self.memories:
-            if query_lower in memory['content'].lower():
-                # Simulate similarity score
-                similarity = 0.5 + (query_lower.count(' ') * 0.1)
-                memory_result = memory.copy()
-                memory_result['similarity'] = min(similarity, 1.0)
-                results.append(memory_result)
+        results = [
+            {**memory, 'similarity': similarity}
+            for memory, content_lower in zip(self.memories, self._contents_lower)
+            if query_lower in content_lower
+        ]
         
-        # Sort by similarity and return top results
-        results.sort(key=lambda x: x['similarity'], reverse=True)
-        return results[:limit]
+        # Top results by similarity without sorting the whole match list
+        return heapq.nlargest(limit, results, key=lambda x: x['similarity'])
+
+@dataclass
+class TriggerMatch:
+    """Auto-trigger match (slotted: one is built per detected trigger)"""
+    __slots__ = ('type', 'trigger', 'confidence', 'reason')
+    type: str
+    trigger: str
+    confidence: float
+    reason: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON/metadata boundaries"""
+        return asdict(self)
 
 class AutoTriggerProcessor:
     """Simple auto-trigger system"""
     
+    # Shared, immutable trigger tables built once at import
+    keywords = ('ricorda', 'nota', 'importante', 'salva', 'memorizza', 'remember', 'save', 'note')
+    patterns = ('risolto', 'solved', 'fixed', 'bug fix', 'solution', 'tutorial')
+    
     def __init__(self, db):
         self.db = db
-        self.keywords = ['ricorda', 'nota', 'importante', 'salva', 'memorizza', 'remember', 'save', 'note']
-        self.patterns = ['risolto', 'solved', 'fixed', 'bug fix', 'solution', 'tutorial']
     
-    def analyze_for_auto_trigger(self, content: str) -> List[Dict]:
+    def analyze_for_auto_trigger(self, content: str) -> List[TriggerMatch]:
         """Analyze content for auto-trigger patterns"""
         actions = []
         content_lower = content.lower()
@@ -85,23 +105,23 @@ class AutoTriggerProcessor:
         # Check for save keywords
         for keyword in self.keywords:
             if keyword in content_lower:
-                actions.append({
-                    'type': 'save_memory',
-                    'trigger': 'keyword',
-                    'confidence': 0.8,
-                    'reason': f'Keyword detected: {keyword}'
-                })
+                actions.append(TriggerMatch(
+                    type='save_memory',
+                    trigger='keyword',
+                    confidence=0.8,
+                    reason=f'Keyword detected: {keyword}'
+                ))
                 break
         
         # Check for solution patterns
         for pattern in self.patterns:
             if pattern in content_lower:
-                actions.append({
-                    'type': 'save_memory',
-                    'trigger': 'pattern',
-                    'confidence': 0.7,
-                    'reason': f'Solution pattern detected: {pattern}'
-                })
+                actions.append(TriggerMatch(
+                    type='save_memory',
+                    trigger='pattern',
+                    confidence=0.7,
+                    reason=f'Solution pattern detected: {pattern}'
+                ))
                 break
         
         return actions
@@ -227,7 +247,7 @@ class SimpleCursorMCPServer:
                     triggers = self.auto_trigger.analyze_for_auto_trigger(content)
                     if triggers:
                         metadata["auto_triggered"] = True
-                        metadata["triggers"] = triggers
+                        metadata["triggers"] = [trigger.to_dict() for trigger in triggers]
                         importance = max(importance, 0.7)  # Boost importance for auto-triggered
                     
                     # Save memory
@@ -259,13 +279,15 @@ class SimpleCursorMCPServer:
                             text=f"🔍 No memories found for query: '{query}'"
                         )]
                     
-                    result_text = f"🔍 Found {len(memories)} memories for '{query}':\n\n"
-                    for i, memory in enumerate(memories, 1):
-                        result_text += f"{i}. *{memory['id']}* (similarity: {memory['similarity']:.2f})\n"
-                        result_text += f"   📝 {memory['content'][:100]}{'...' if len(memory['content']) > 100 else ''}\n"
-                        result_text += f"   📅 {memory['timestamp']}\n\n"
+                    lines = [f"🔍 Found {len(memories)} memories for '{query}':\n\n"]
+                    lines.extend(
+                        f"{i}. *{memory['id']}* (similarity: {memory['similarity']:.2f})\n"
+                        f"   📝 {memory['content'][:100]}{'...' if len(memory['content']) > 100 else ''}\n"
+                        f"   📅 {_iso(memory['created_at'])}\n\n"
+                        for i, memory in enumerate(memories, 1)
+                    )
                     
-                    return [types.TextContent(type="text", text=result_text)]
+                    return [types.TextContent(type="text", text="".join(lines))]
                 
                 elif name == "analyze_auto_trigger":
                     text = arguments.get("text", "")
@@ -277,13 +299,15 @@ class SimpleCursorMCPServer:
                             text=f"🔍 No auto-trigger patterns detected in: '{text[:100]}{'...' if len(text) > 100 else ''}'"
                         )]
                     
-                    result_text = f"⚡ Detected {len(triggers)} auto-trigger pattern(s):\n\n"
-                    for trigger in triggers:
-                        result_text += f"• *{trigger['type']}* ({trigger['trigger']})\n"
-                        result_text += f"  Confidence: {trigger['confidence']:.1%}\n"
-                        result_text += f"  Reason: {trigger['reason']}\n\n"
+                    lines = [f"⚡ Detected {len(triggers)} auto-trigger pattern(s):\n\n"]
+                    lines.extend(
+                        f"• *{trigger.type}* ({trigger.trigger})\n"
+                        f"  Confidence: {trigger.confidence:.1%}\n"
+                        f"  Reason: {trigger.reason}\n\n"
+                        for trigger in triggers
+                    )
                     
-                    return [types.TextContent(type="text", text=result_text)]
+                    return [types.TextContent(type="text", text="".join(lines))]
                 
                 elif name == "list_memories":
                     limit = arguments.get("limit", 10)
@@ -295,13 +319,15 @@ class SimpleCursorMCPServer:
                             text="📝 No memories saved yet."
                         )]
                     
-                    result_text = f"📚 Latest {len(all_memories)} memories:\n\n"
-                    for memory in reversed(all_memories):  # Show newest first
-                        result_text += f"*{memory['id']}* ({memory['memory_type']})\n"
-                        result_text += f"📝 {memory['content'][:80]}{'...' if len(memory['content']) > 80 else ''}\n"
-                        result_text += f"⭐ Importance: {memory['importance']:.1f} | 📅 {memory['timestamp']}\n\n"
+                    lines = [f"📚 Latest {len(all_memories)} memories:\n\n"]
+                    lines.extend(
+                        f"*{memory['id']}* ({memory['memory_type']})\n"
+                        f"📝 {memory['content'][:80]}{'...' if len(memory['content']) > 80 else ''}\n"
+                        f"⭐ Importance: {memory['importance']:.1f} | 📅 {_iso(memory['created_at'])}\n\n"
+                        for memory in reversed(all_memories)  # Show newest first
+                    )
                     
-                    return [types.TextContent(type="text", text=result_text)]
+                    return [types.TextContent(type="text", text="".join(lines))]
                 
                 else:
                     return [types.TextContent(
@@ -3,11 +3,13 @@ Backup service for MCP Memory Server
 """
 
 import asyncio
+import functools
 import logging
 import json
+import os
 import shutil
 from datetime import datetime, timedelta
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 import threading
 import tarfile
@@ -24,6 +26,47 @@ except ImportError:
 from ..config.settings import Settings
 from ..utils.exceptions import BackupServiceError
 
+# Backup listings are reused for this long unless the service itself changes the backup directory
+BACKUP_LIST_CACHE_TTL_SECONDS = 30
+
+
+def _tree_size(path: Path) -> int:
+    """Total size of the files under path, using one directory scan per level"""
+    total_size = 0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                total_size += _tree_size(entry.path)
+            elif entry.is_file():
+                total_size += entry.stat().st_size
+    return total_size
+
+
+def _compress_directory(path: Path, archive_path: Path) -> None:
+    """Write path into a tar.gz archive and remove the directory"""
+    with tarfile.open(archive_path, "w:gz") as tar:
+        tar.add(path, arcname=path.name)
+    shutil.rmtree(path)
+
+
+def _extract_archive(archive_path: Path, target: Path) -> None:
+    """Extract a tar.gz archive into target"""
+    with tarfile.open(archive_path, "r:gz") as tar:
+        tar.extractall(target)
+
+
+def _replace_tree(source: Path, target: Path) -> None:
+    """Replace target with a copy of source"""
+    if target.exists():
+        shutil.rmtree(target)
+    shutil.copytree(source, target)
+
+
+async def _run_blocking(func, *args):
+    """Run blocking filesystem work on the default executor"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args))
+
 
 class BackupService:
     """Backup service for automatic data backup"""
@@ -35,6 +78,9 @@ class BackupService:
         self._scheduler_thread = None
         self._stop_scheduler = False
         
+        # (monotonic timestamp, backups) from the last directory scan
+        self._backup_list_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+        
         self.logger = logging.getLogger(__name__)
     
     async def initialize(self) -> None:
@@ -143,6 +189,7 @@ class BackupService:
             
             # Cleanup old backups
             await self._cleanup_old_backups()
+            self._invalidate_backup_list_cache()
             
             self.logger.info(f"Backup created successfully: {backup_name}")
             
@@ -155,6 +202,7 @@ class BackupService:
             }
             
         except Exception as e:
+            self._invalidate_backup_list_cache()
             self.logger.error(f"Failed to create backup: {e}")
             raise BackupServiceError(f"Backup creation failed: {e}")
     
@@ -165,7 +213,7 @@ class BackupService:
             if data_dir.exists():
                 # Copy data directory
                 backup_data_dir = backup_path / "data"
-                shutil.copytree(data_dir, backup_data_dir)
+                await _run_blocking(shutil.copytree, data_dir, backup_data_dir)
                 
                 self.logger.debug(f"Backed up data directory: {data_dir}")
             
@@ -180,7 +228,7 @@ class BackupService:
             if config_dir.exists():
                 # Copy config directory
                 backup_config_dir = backup_path / "config"
-                shutil.copytree(config_dir, backup_config_dir)
+                await _run_blocking(shutil.copytree, config_dir, backup_config_dir)
                 
                 self.logger.debug(f"Backed up config directory: {config_dir}")
             
@@ -191,14 +239,9 @@ class BackupService:
     async def _compress_backup(self, backup_path: Path) -> None:
         """Compress backup directory"""
         try:
-            # Create tar.gz archive
+            # Create tar.gz archive and remove the uncompressed directory
             archive_path = backup_path.parent / f"{backup_path.name}.tar.gz"
-            
-            with tarfile.open(archive_path, "w:gz") as tar:
-                tar.add(backup_path, arcname=backup_path.name)
-            
-            # Remove uncompressed directory
-            shutil.rmtree(backup_path)
+            await _run_blocking(_compress_directory, backup_path, archive_path)
             
             self.logger.debug(f"Compressed backup: {archive_path}")
             
@@ -212,27 +255,23 @@ class BackupService:
             retention_days = self.settings.backup.retention_days
             cutoff_date = datetime.utcnow() - timedelta(days=retention_days)
             
-            # Find old backups
+            # Find old backups (one directory scan; entry types come from the listing itself)
             old_backups = []
-            for backup_file in self.backup_dir.glob("*"):
-                if backup_file.is_file() or backup_file.is_dir():
-                    # Try to get creation time
+            with os.scandir(self.backup_dir) as entries:
+                for entry in entries:
                     try:
-                        if backup_file.is_file():
-                            stat = backup_file.stat()
-                        else:
-                            stat = backup_file.stat()
-                        
-                        creation_time = datetime.fromtimestamp(stat.st_ctime)
+                        if not (entry.is_file() or entry.is_dir()):
+                            continue
+                        creation_time = datetime.fromtimestamp(entry.stat().st_ctime)
                         if creation_time < cutoff_date:
-                            old_backups.append(backup_file)
+                            old_backups.append((Path(entry.path), entry.is_file()))
                     except Exception:
                         continue
             
             # Remove old backups
-            for old_backup in old_backups:
+            for old_backup, is_file in old_backups:
                 try:
-                    if old_backup.is_file():
+                    if is_file:
                         old_backup.unlink()
                     else:
                         shutil.rmtree(old_backup)
@@ -252,12 +291,7 @@ class BackupService:
         try:
             if backup_path.is_file():
                 return backup_path.stat().st_size
-            else:
-                total_size = 0
-                for file_path in backup_path.rglob("*"):
-                    if file_path.is_file():
-                        total_size += file_path.stat().st_size
-                return total_size
+            return await _run_blocking(_tree_size, backup_path)
         except Exception:
             return 0
     
@@ -271,41 +305,51 @@ class BackupService:
             "storage_type": self.settings.backup.storage["type"]
         }
     
+    def _invalidate_backup_list_cache(self) -> None:
+        """Drop the cached backup listing after the backup directory changes"""
+        self._backup_list_cache = None
+    
     async def list_backups(self) -> List[Dict[str, Any]]:
         """List all backups"""
         try:
-            backups = []
-            
-            for backup_file in self.backup_dir.glob("*"):
-                if backup_file.is_file() or backup_file.is_dir():
-                    try:
-                        if backup_file.is_file():
-                            stat = backup_file.stat()
-                        else:
-                            stat = backup_file.stat()
-                        
-                        creation_time = datetime.fromtimestamp(stat.st_ctime)
-                        size = await self._get_backup_size(backup_file)
-                        
-                        backups.append({
-                            "name": backup_file.name,
-                            "path": str(backup_file),
-                            "size": size,
-                            "created_at": creation_time.isoformat(),
-                            "type": "compressed" if backup_file.suffix == ".gz" else "directory"
-                        })
-                    except Exception as e:
-                        self.logger.warning(f"Failed to get backup info for {backup_file}: {e}")
-            
-            # Sort by creation time (newest first)
-            backups.sort(key=lambda x: x["created_at"], reverse=True)
-            
-            return backups
-            
+            now = time.monotonic()
+            cached = self._backup_list_cache
+            if cached is None or now - cached[0] >= BACKUP_LIST_CACHE_TTL_SECONDS:
+                cached = self._backup_list_cache = (now, await _run_blocking(self._scan_backups))
+            return [dict(backup) for backup in cached[1]]
         except Exception as e:
             self.logger.error(f"Failed to list backups: {e}")
             return []
     
+    def _scan_backups(self) -> List[Dict[str, Any]]:
+        """Collect backup info from the backup directory, newest first"""
+        backups = []
+        
+        with os.scandir(self.backup_dir) as entries:
+            for entry in entries:
+                if not (entry.is_file() or entry.is_dir()):
+                    continue
+                backup_file = Path(entry.path)
+                try:
+                    stat = entry.stat()
+                    creation_time = datetime.fromtimestamp(stat.st_ctime)
+                    size = stat.st_size if entry.is_file() else _tree_size(backup_file)
+                    
+                    backups.append({
+                        "name": entry.name,
+                        "path": entry.path,
+                        "size": size,
+                        "created_at": creation_time.isoformat(),
+                        "type": "compressed" if backup_file.suffix == ".gz" else "directory"
+                    })
+                except Exception as e:
+                    self.logger.warning(f"Failed to get backup info for {backup_file}: {e}")
+        
+        # Sort by creation time (newest first)
+        backups.sort(key=lambda x: x["created_at"], reverse=True)
+        
+        return backups
+    
     async def restore_backup(self, backup_name: str) -> Dict[str, Any]:
         """Restore from backup"""
         try:
@@ -318,16 +362,15 @@ class BackupService:
             if backup_path.suffix == ".gz":
                 # Extract compressed backup
                 extracted_path = backup_path.parent / backup_path.stem
-                with tarfile.open(backup_path, "r:gz") as tar:
-                    tar.extractall(backup_path.parent)
+                await _run_blocking(_extract_archive, backup_path, backup_path.parent)
+                self._invalidate_backup_list_cache()
                 backup_path = extracted_path
             
             # Read metadata
             metadata_file = backup_path / "metadata.json"
-            if metadata_file.exists():
-                with open(metadata_file, 'r') as f:
-                    metadata = json.load(f)
-            else:
+            try:
+                metadata = json.loads(metadata_file.read_bytes())
+            except FileNotFoundError:
                 metadata = {}
             
             # Restore data files
@@ -356,12 +399,8 @@ class BackupService:
             if backup_data_dir.exists():
                 data_dir = Path(self.settings.paths.data_dir)
                 
-                # Remove existing data directory
-                if data_dir.exists():
-                    shutil.rmtree(data_dir)
-                
-                # Restore data directory
-                shutil.copytree(backup_data_dir, data_dir)
+                # Replace the existing data directory
+                await _run_blocking(_replace_tree, backup_data_dir, data_dir)
                 
                 self.logger.debug(f"Restored data directory: {data_dir}")
             
@@ -376,12 +415,8 @@ class BackupService:
             if backup_config_dir.exists():
                 config_dir = Path("config")
                 
-                # Remove existing config directory
-                if config_dir.exists():
-                    shutil.rmtree(config_dir)
-                
-                # Restore config directory
-                shutil.copytree(backup_config_dir, config_dir)
+                # Replace the existing config directory
+                await _run_blocking(_replace_tree, backup_config_dir, config_dir)
                 
                 self.logger.debug(f"Restored config directory: {config_dir}")
             
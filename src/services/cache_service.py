@@ -18,6 +18,14 @@ except ImportError:
     redis = None
     REDIS_AVAILABLE = False
 
+# Optional orjson import - faster (de)serialization of Redis values
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 from ..config.settings import Settings
 from ..utils.exceptions import CacheServiceError
 
@@ -167,7 +175,7 @@ class CacheService:
                     value = await self.redis_client.get(key)
                     if value is not None:
                         # Parse JSON value
-                        parsed_value = json.loads(value)
+                        parsed_value = orjson.loads(value) if ORJSON_AVAILABLE else json.loads(value)
                         
                         # Store in local cache for faster access
                         await self.set_local(key, parsed_value, ttl=300)  # 5 minutes local cache
@@ -191,7 +199,8 @@ class CacheService:
             # Set in Redis cache
             if self.redis_client:
                 try:
-                    json_value = json.dumps(value)
+                    # OPT_NON_STR_KEYS stringifies int keys the way json.dumps does
+                    json_value = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS) if ORJSON_AVAILABLE else json.dumps(value)
                     if ttl:
                         await self.redis_client.setex(key, ttl, json_value)
                     else:
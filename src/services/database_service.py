@@ -99,20 +99,7 @@ class DatabaseService:
         
         try:
             # Convert to document
-            doc = {
-                "project": memory_create.project,
-                "content": memory_create.content,
-                "memory_type": memory_create.memory_type.value,
-                "importance": memory_create.importance,
-                "tags": memory_create.tags,
-                "metadata": memory_create.metadata,
-                "context": memory_create.context,
-                "embedding": memory_create.embedding,
-                "created_at": datetime.utcnow(),
-                "updated_at": datetime.utcnow(),
-                "access_count": 0,
-                "last_accessed": None
-            }
+            doc = self._memory_create_to_doc(memory_create, datetime.utcnow())
             
             result = await self.collection.insert_one(doc)
             
@@ -140,6 +127,45 @@ class DatabaseService:
             logger.error(f"Failed to create memory: {e}")
             raise DatabaseServiceError(f"Failed to create memory: {e}")
     
+    async def create_memories(self, memory_creates: List[MemoryCreate]) -> List[Memory]:
+        """Create several memories with a single insert round-trip"""
+        await self._ensure_initialized()
+        
+        if not memory_creates:
+            return []
+        
+        try:
+            now = datetime.utcnow()
+            docs = [self._memory_create_to_doc(memory_create, now) for memory_create in memory_creates]
+            
+            result = await self.collection.insert_many(docs)
+            for doc, inserted_id in zip(docs, result.inserted_ids):
+                doc["_id"] = inserted_id
+            
+            logger.debug(f"Created {len(docs)} memories")
+            return [self._doc_to_memory(doc) for doc in docs]
+            
+        except Exception as e:
+            logger.error(f"Failed to create memories: {e}")
+            raise DatabaseServiceError(f"Failed to create memories: {e}")
+    
+    def _memory_create_to_doc(self, memory_create: MemoryCreate, timestamp: datetime) -> Dict[str, Any]:
+        """Convert a MemoryCreate to a database document"""
+        return {
+            "project": memory_create.project,
+            "content": memory_create.content,
+            "memory_type": memory_create.memory_type.value,
+            "importance": memory_create.importance,
+            "tags": memory_create.tags,
+            "metadata": memory_create.metadata,
+            "context": memory_create.context,
+            "embedding": memory_create.embedding,
+            "created_at": timestamp,
+            "updated_at": timestamp,
+            "access_count": 0,
+            "last_accessed": None
+        }
+    
     async def get_memory(self, memory_id: str) -> Optional[Memory]:
         """Get a memory by ID"""
         await self._ensure_initialized()
@@ -227,9 +253,14 @@ class DatabaseService:
             
             if text_query:
                 query["$text"] = {"$search": text_query}
+                # Let the text index rank matches so the limit keeps the best candidates
+                text_score = {"score": {"$meta": "textScore"}}
+                cursor = self.collection.find(query, text_score).sort([("score", {"$meta": "textScore"})])
+            else:
+                cursor = self.collection.find(query)
             
             # Execute query
-            cursor = self.collection.find(query).limit(limit)
+            cursor = cursor.limit(limit)
             docs = await cursor.to_list(length=limit)
             
             # Convert to memory objects
@@ -11,11 +11,59 @@ from sentence_transformers import SentenceTransformer
 from transformers import AutoTokenizer, AutoModel
 import torch
 
+try:
+    import simsimd
+    HAS_SIMSIMD = True
+except ImportError:
+    HAS_SIMSIMD = False
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 from ..config.settings import EmbeddingConfig
 from ..utils.exceptions import EmbeddingServiceError
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of text embeddings kept in memory (least recently used evicted first)
+EMBEDDING_CACHE_SIZE = 4096
+
+
+if HAS_NUMBA:
+    @njit(parallel=True, cache=True)
+    def _cosine_scores(queries, matrix):
+        """Cosine similarity of each query row against each matrix row (float32 2D inputs)"""
+        n_queries, dim = queries.shape
+        n_rows = matrix.shape[0]
+        
+        query_norms = np.empty(n_queries, dtype=np.float32)
+        for i in range(n_queries):
+            total = np.float32(0.0)
+            for k in range(dim):
+                total += queries[i, k] * queries[i, k]
+            query_norms[i] = np.sqrt(total)
+        
+        scores = np.zeros((n_queries, n_rows), dtype=np.float32)
+        for j in prange(n_rows):
+            row_total = np.float32(0.0)
+            for k in range(dim):
+                row_total += matrix[j, k] * matrix[j, k]
+            row_norm = np.sqrt(row_total)
+            
+            for i in range(n_queries):
+                norm = query_norms[i] * row_norm
+                if norm == 0:
+                    continue  # Zero vectors score 0
+                dot = np.float32(0.0)
+                for k in range(dim):
+                    dot += queries[i, k] * matrix[j, k]
+                scores[i, j] = dot / norm
+        
+        return scores
+
 
 class EmbeddingService:
     """Embedding service for text vectorization"""
@@ -31,6 +79,11 @@ class EmbeddingService:
         self._embedding_count = 0
         self._total_embedding_time = 0.0
         self._error_count = 0
+        
+        # Embedding cache keyed by text, kept in recency order
+        self.cache: Dict[str, List[float]] = {}
+        self._cache_hits = 0
+        self._cache_misses = 0
     
     async def initialize(self) -> None:
         """Initialize embedding service"""
@@ -50,6 +103,10 @@ class EmbeddingService:
             else:
                 raise EmbeddingServiceError(f"Unsupported embedding provider: {self.settings.provider}")
             
+            # Compile the similarity kernel now rather than on the first search
+            if HAS_NUMBA and not HAS_SIMSIMD:
+                _cosine_scores(np.ones((1, 1), dtype=np.float32), np.ones((1, 1), dtype=np.float32))
+            
             self._initialized = True
             logger.info(f"Embedding service initialized with {self.settings.provider}")
             
@@ -113,6 +170,39 @@ class EmbeddingService:
         else:
             self._error_count += 1
     
+    async def _get_cached_embedding(self, text: str) -> Optional[List[float]]:
+        """Get cached embedding for text, refreshing its recency"""
+        embedding = self.cache.pop(text, None)
+        if embedding is None:
+            self._cache_misses += 1
+            return None
+        
+        self.cache[text] = embedding
+        self._cache_hits += 1
+        return embedding
+    
+    async def _cache_embedding(self, text: str, embedding: List[float]) -> None:
+        """Cache embedding for text, evicting the least recently used entry when full"""
+        self.cache.pop(text, None)
+        self.cache[text] = embedding
+        if len(self.cache) > EMBEDDING_CACHE_SIZE:
+            del self.cache[next(iter(self.cache))]
+    
+    async def clear_cache(self) -> None:
+        """Clear the embedding cache"""
+        self.cache.clear()
+    
+    async def get_cache_stats(self) -> Dict[str, Any]:
+        """Get embedding cache statistics"""
+        lookups = self._cache_hits + self._cache_misses
+        return {
+            "cache_size": len(self.cache),
+            "max_cache_size": EMBEDDING_CACHE_SIZE,
+            "cache_hits": self._cache_hits,
+            "cache_misses": self._cache_misses,
+            "hit_rate": self._cache_hits / lookups if lookups > 0 else 0.0
+        }
+    
     async def generate_embedding(self, text: str) -> List[float]:
         """Generate embedding for text"""
         await self._ensure_initialized()
@@ -125,6 +215,11 @@ class EmbeddingService:
             if len(text) > self.settings.max_text_length:
                 text = text[:self.settings.max_text_length]
             
+            # Previously seen text skips the model entirely
+            cached = await self._get_cached_embedding(text)
+            if cached is not None:
+                return cached
+            
             # Generate embedding based on provider
             if self.settings.provider == "sentence_transformers":
                 embedding = self.model.encode(
@@ -143,6 +238,8 @@ class EmbeddingService:
             if isinstance(embedding, np.ndarray):
                 embedding = embedding.tolist()
             
+            await self._cache_embedding(text, embedding)
+            
             logger.debug(f"Generated embedding in {duration:.3f}s")
             return embedding
             
@@ -151,6 +248,50 @@ class EmbeddingService:
             logger.error(f"Failed to generate embedding: {e}")
             raise EmbeddingServiceError(f"Failed to generate embedding: {e}")
     
+    async def generate_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        """Generate embeddings for many texts with a single model call"""
+        if not texts:
+            return []
+        
+        await self._ensure_initialized()
+        
+        try:
+            import time
+            start_time = time.time()
+            
+            texts = [text[:self.settings.max_text_length] for text in texts]
+            embeddings: List[Optional[List[float]]] = [await self._get_cached_embedding(text) for text in texts]
+            missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+            
+            if missing:
+                missing_texts = [texts[i] for i in missing]
+                if self.settings.provider == "sentence_transformers":
+                    generated = self.model.encode(
+                        missing_texts,
+                        normalize_embeddings=self.settings.normalize_embeddings
+                    )
+                elif self.settings.provider == "huggingface":
+                    generated = [await self._generate_huggingface_embedding(text) for text in missing_texts]
+                else:
+                    raise EmbeddingServiceError(f"Unsupported provider: {self.settings.provider}")
+                
+                for i, embedding in zip(missing, generated):
+                    if isinstance(embedding, np.ndarray):
+                        embedding = embedding.tolist()
+                    embeddings[i] = embedding
+                    await self._cache_embedding(texts[i], embedding)
+            
+            duration = time.time() - start_time
+            self._update_metrics(success=True, duration=duration)
+            
+            logger.debug(f"Generated {len(missing)} of {len(texts)} embeddings in {duration:.3f}s")
+            return embeddings
+            
+        except Exception as e:
+            self._update_metrics(success=False)
+            logger.error(f"Failed to generate batch embeddings: {e}")
+            raise EmbeddingServiceError(f"Failed to generate batch embeddings: {e}")
+    
     async def _generate_huggingface_embedding(self, text: str) -> np.ndarray:
         """Generate embedding using HuggingFace model"""
         try:
@@ -206,6 +347,31 @@ class EmbeddingService:
             logger.error(f"Failed to calculate similarity: {e}")
             return 0.0
     
+    def calculate_similarities(self, query_embedding: List[float], embeddings: List[List[float]]) -> np.ndarray:
+        """Calculate cosine similarity between a query and many embeddings in one matrix product"""
+        return self.calculate_similarity_matrix([query_embedding], embeddings)[0]
+    
+    def calculate_similarity_matrix(self, query_embeddings: List[List[float]], embeddings: List[List[float]]) -> np.ndarray:
+        """Calculate cosine similarity between every query and every embedding in one matrix product"""
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        queries = np.asarray(query_embeddings, dtype=np.float32)
+        
+        if HAS_SIMSIMD:
+            # SIMD cosine distances; a zero query against a zero row comes back at distance 0,
+            # so zero vectors are masked to score 0 as in the other backends
+            similarities = 1.0 - np.asarray(simsimd.cdist(queries, matrix, metric="cosine"), dtype=np.float32)
+            similarities[~queries.any(axis=1)] = 0.0
+            similarities[:, ~matrix.any(axis=1)] = 0.0
+            return similarities
+        
+        if HAS_NUMBA:
+            return _cosine_scores(np.ascontiguousarray(queries), np.ascontiguousarray(matrix))
+        
+        norms = np.outer(np.linalg.norm(queries, axis=1), np.linalg.norm(matrix, axis=1))
+        norms[norms == 0] = 1.0  # Zero vectors score 0 instead of NaN
+        
+        return (queries @ matrix.T) / norms
+    
     async def should_trigger_memory_save(self, content: str, context: Optional[Dict[str, Any]] = None) -> bool:
         """Determine if content should trigger memory save"""
         try:
@@ -300,7 +466,8 @@ class EmbeddingService:
                 "error_count": self._error_count,
                 "device": self.settings.device,
                 "max_text_length": self.settings.max_text_length,
-                "normalize_embeddings": self.settings.normalize_embeddings
+                "normalize_embeddings": self.settings.normalize_embeddings,
+                "cache_info": await self.get_cache_stats()
             }
             
         except Exception as e:
@@ -5,6 +5,7 @@ Export service for MCP Memory Server
 import logging
 import json
 import gzip
+import os
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 from pathlib import Path
@@ -341,15 +342,18 @@ class ExportService:
         try:
             exports = []
             
-            for export_file in self.export_dir.glob("*"):
-                if export_file.is_file():
+            with os.scandir(self.export_dir) as entries:
+                for entry in entries:
+                    if not entry.is_file():
+                        continue
+                    export_file = Path(entry.path)
                     try:
-                        stat = export_file.stat()
+                        stat = entry.stat()
                         creation_time = datetime.fromtimestamp(stat.st_ctime)
                         
                         exports.append({
-                            "name": export_file.name,
-                            "path": str(export_file),
+                            "name": entry.name,
+                            "path": entry.path,
                             "size": stat.st_size,
                             "created_at": creation_time.isoformat(),
                             "format": export_file.suffix.lstrip('.'),
@@ -5,6 +5,7 @@ Health monitoring service for MCP Memory Server
 import asyncio
 import logging
 import time
+from collections import deque
 from typing import Dict, Any, List
 
 from ..config import get_config
@@ -22,8 +23,8 @@ class HealthService:
     def __init__(self):
         self.config = get_config()
         self.start_time = time.time()
-        self._health_history: List[Dict[str, Any]] = []
         self._max_history = 100
+        self._health_history: deque = deque(maxlen=self._max_history)
     
     async def check_all(self) -> bool:
         """Check health of all services"""
@@ -39,10 +40,12 @@ class HealthService:
         try:
             time.time()
             
-            # Check individual services
-            db_health = await database_service.health_check()
-            embedding_health = await embedding_service.health_check()
-            memory_health = await memory_service.health_check()
+            # Check individual services concurrently
+            db_health, embedding_health, memory_health = await asyncio.gather(
+                database_service.health_check(),
+                embedding_service.health_check(),
+                memory_service.health_check()
+            )
             
             # Determine overall status
             all_services_healthy = all(
@@ -100,15 +103,11 @@ class HealthService:
             "memory_service_status": health.memory_service_status
         }
         
-        self._health_history.append(record)
-        
-        # Keep only recent records
-        if len(self._health_history) > self._max_history:
-            self._health_history = self._health_history[-self._max_history:]
+        self._health_history.append(record)  # Oldest records fall off automatically
     
     def get_health_history(self) -> List[Dict[str, Any]]:
         """Get health check history"""
-        return self._health_history.copy()
+        return list(self._health_history)
     
     async def run_periodic_checks(self, interval: int = 30) -> None:
         """Run periodic health checks"""
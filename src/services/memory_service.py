@@ -2,10 +2,14 @@
 Production memory service with auto-triggers and advanced features
 """
 
+import asyncio
 import logging
 import time
+from dataclasses import replace
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+
+import numpy as np
 
 from ..config.settings import Settings
 from ..models.memory import (
@@ -18,6 +22,12 @@ from .embedding_service import EmbeddingService
 logger = logging.getLogger(__name__)
 
 
+def _quantize_int8(vector: np.ndarray) -> Tuple[np.ndarray, float]:
+    """Quantize a vector to int8 with a per-vector absmax scale"""
+    scale = float(np.abs(vector).max()) / 127.0 or 1.0
+    return np.round(vector / scale).astype(np.int8), scale
+
+
 class MemoryService:
     """Production memory service with intelligent triggers and management"""
     
@@ -33,6 +43,24 @@ class MemoryService:
         self._auto_save_count = 0
         self._total_search_time = 0.0
         self._error_count = 0
+        
+        # Search cache: a ring buffer of results keyed on (query, search params), plus the int8
+        # query codes used to match near-duplicate queries when search_cache_similarity is set
+        self._search_cache_size = settings.memory.search_cache_size
+        self._search_cache_similarity = settings.memory.search_cache_similarity
+        self._search_cache_entries: List[Optional[Tuple[Tuple, List[Memory]]]] = [None] * self._search_cache_size
+        self._search_cache_slots: Dict[Tuple, int] = {}
+        self._search_cache_times = np.full(self._search_cache_size, -np.inf)
+        self._search_cache_params = np.zeros(self._search_cache_size, dtype=np.int64)
+        self._search_cache_scales = np.zeros(self._search_cache_size, dtype=np.float32)
+        self._search_cache_codes: Optional[np.ndarray] = None  # allocated once the embedding size is known
+        self._search_cache_next = 0
+        self._search_cache_hits = 0
+        # Bumped on every invalidation so callers can tell whether their cached results are stale
+        self.search_cache_generation = 0
+        
+        # Searches currently running, so identical concurrent requests share one lookup
+        self._pending_searches: Dict[Tuple, asyncio.Future] = {}
     
     async def initialize(self) -> None:
         """Initialize memory service"""
@@ -69,6 +97,77 @@ class MemoryService:
         if not success:
             self._error_count += 1
     
+    def _invalidate_search_cache(self) -> None:
+        """Drop cached search results after the stored memories change"""
+        self._search_cache_entries = [None] * self._search_cache_size
+        self._search_cache_slots.clear()
+        self._search_cache_times.fill(-np.inf)
+        self.search_cache_generation += 1
+    
+    def _lookup_search_cache(self, key: Tuple) -> Optional[List[Memory]]:
+        """Return cached results for an exact repeat of a search"""
+        slot = self._search_cache_slots.get(key)
+        if slot is None or time.time() - self._search_cache_times[slot] >= self.settings.memory.search_cache_ttl:
+            return None
+        return list(self._search_cache_entries[slot][1])
+    
+    def _lookup_similar_search(self, query_vector: np.ndarray, params: Tuple) -> Optional[List[Memory]]:
+        """Return cached results for a near-duplicate query with the same parameters"""
+        codes = self._search_cache_codes
+        if codes is None or codes.shape[1] != query_vector.shape[0]:
+            return None
+        
+        fresh = time.time() - self._search_cache_times < self.settings.memory.search_cache_ttl
+        live = np.flatnonzero(fresh & (self._search_cache_params == hash(params)))
+        if not live.size:
+            return None
+        
+        # One int32 matrix-vector product over the int8 codes, rescaled to cosine similarity
+        query_codes, query_scale = _quantize_int8(query_vector)
+        similarities = (codes[live].astype(np.int32) @ query_codes.astype(np.int32)) * (
+            self._search_cache_scales[live] * query_scale
+        )
+        
+        best = int(np.argmax(similarities))
+        key, results = self._search_cache_entries[live[best]]
+        if similarities[best] >= self._search_cache_similarity and key[1] == params:
+            return list(results)
+        return None
+    
+    def _store_search_cache(self, key: Tuple, query_vector: Optional[np.ndarray], results: List[Memory]) -> None:
+        """Remember search results, overwriting the oldest slot once the cache is full"""
+        slot = self._search_cache_slots.get(key)
+        if slot is None:
+            slot = self._search_cache_next
+            self._search_cache_next = (slot + 1) % self._search_cache_size
+            evicted = self._search_cache_entries[slot]
+            if evicted is not None:
+                del self._search_cache_slots[evicted[0]]
+            self._search_cache_slots[key] = slot
+        
+        self._search_cache_entries[slot] = (key, list(results))
+        self._search_cache_times[slot] = time.time()
+        
+        if query_vector is not None:
+            if self._search_cache_codes is None or self._search_cache_codes.shape[1] != query_vector.shape[0]:
+                self._search_cache_codes = np.zeros((self._search_cache_size, query_vector.shape[0]), dtype=np.int8)
+            self._search_cache_codes[slot], self._search_cache_scales[slot] = _quantize_int8(query_vector)
+            self._search_cache_params[slot] = hash(key[1])
+    
+    @staticmethod
+    def _memory_create(item: Dict[str, Any], embedding: List[float]) -> MemoryCreate:
+        """Build the MemoryCreate for one item with create_memory's fields and defaults"""
+        return MemoryCreate(
+            project=item.get("project", "default"),
+            content=item["content"],
+            memory_type=MemoryType.CONVERSATION,
+            importance=item.get("importance", 0.5),
+            tags=item.get("tags") or [],
+            metadata=item.get("metadata") or {},
+            context=item.get("context") or {},
+            embedding=embedding
+        )
+    
     async def create_memory(
         self, 
         content: str,
@@ -88,19 +187,21 @@ class MemoryService:
             embedding = await self.embedding_service.generate_embedding(content)
             
             # Create memory object
-            memory_create = MemoryCreate(
-                project=project,
-                content=content,
-                memory_type=MemoryType.CONVERSATION,
-                importance=importance,
-                tags=tags or [],
-                metadata=metadata or {},
-                context=context or {},
-                embedding=embedding
+            memory_create = self._memory_create(
+                {
+                    "content": content,
+                    "project": project,
+                    "importance": importance,
+                    "tags": tags,
+                    "metadata": metadata,
+                    "context": context
+                },
+                embedding
             )
             
             # Create memory in database
             memory = await self.database_service.create_memory(memory_create)
+            self._invalidate_search_cache()
             
             duration = time.time() - start_time
             self._update_metrics("create", success=True, duration=duration)
@@ -113,6 +214,37 @@ class MemoryService:
             logger.error(f"Failed to create memory: {e}")
             raise MemoryServiceError(f"Memory creation failed: {e}")
     
+    async def create_memories(self, items: List[Dict[str, Any]]) -> List[Memory]:
+        """Create several memories at once; items take the same fields as create_memory"""
+        await self._ensure_initialized()
+        
+        try:
+            start_time = time.time()
+            
+            # Embed all items in one model call, then store them in one database round-trip
+            embeddings = await self.embedding_service.generate_embeddings_batch(
+                [item["content"] for item in items]
+            )
+            
+            memory_creates = [self._memory_create(item, embedding) for item, embedding in zip(items, embeddings)]
+            
+            try:
+                memories = await self.database_service.create_memories(memory_creates)
+            finally:
+                # A failed ordered insert may still have stored the documents before the failure
+                self._invalidate_search_cache()
+            
+            duration = time.time() - start_time
+            self._update_metrics("create", success=True, duration=duration)
+            
+            logger.debug(f"Created {len(memories)} memories in {duration:.3f}s")
+            return memories
+            
+        except Exception as e:
+            self._update_metrics("create", success=False)
+            logger.error(f"Failed to create memories: {e}")
+            raise MemoryServiceError(f"Memory creation failed: {e}")
+    
     async def auto_save_memory(
         self, 
         content: str, 
@@ -144,15 +276,16 @@ class MemoryService:
             trigger_type = "ml_trigger"
             
             if context:
+                content_lower = content.lower()
                 if context.get("type") == "function_result":
                     trigger_type = "function_result"
                 elif context.get("level") == "error":
                     trigger_type = "error"
                 elif context.get("level") == "warning":
                     trigger_type = "warning"
-                elif "decision" in content.lower():
+                elif "decision" in content_lower:
                     trigger_type = "decision"
-                elif any(keyword in content.lower() for keyword in ["knowledge", "fact", "information"]):
+                elif any(keyword in content_lower for keyword in ["knowledge", "fact", "information"]):
                     trigger_type = "knowledge"
             
             # Create memory
@@ -189,16 +322,66 @@ class MemoryService:
         project: Optional[str] = None,
         max_results: int = 20,
         similarity_threshold: float = 0.3,
-        tags: List[str] = None
+        tags: List[str] = None,
+        query_embedding: Optional[List[float]] = None
     ) -> List[Memory]:
-        """Search memories with semantic similarity"""
+        """Search memories with semantic similarity, reusing query_embedding if already computed"""
         await self._ensure_initialized()
         
+        # Join an identical search that is already running instead of repeating it, unless a write
+        # landed since it started (read-your-writes)
+        search_key = (
+            query, project, max_results, similarity_threshold, tuple(tags or []), self.search_cache_generation
+        )
+        pending = self._pending_searches.get(search_key)
+        if pending is not None:
+            return list(await asyncio.shield(pending))
+        
+        search = asyncio.ensure_future(self._search_memories(
+            query, project, max_results, similarity_threshold, tags, query_embedding
+        ))
+        self._pending_searches[search_key] = search
+        try:
+            return list(await asyncio.shield(search))
+        finally:
+            self._pending_searches.pop(search_key, None)
+    
+    async def _search_memories(
+        self,
+        query: str,
+        project: Optional[str],
+        max_results: int,
+        similarity_threshold: float,
+        tags: Optional[List[str]],
+        query_embedding: Optional[List[float]]
+    ) -> List[Memory]:
+        """Run a memory search, consulting the search cache first"""
         try:
             start_time = time.time()
             
-            # Generate embedding for search query
-            query_embedding = await self.embedding_service.generate_embedding(query)
+            # Results computed before a concurrent write must not be cached after it
+            generation = self.search_cache_generation
+            use_cache = self._search_cache_size > 0
+            cache_key = (query, (project, max_results, similarity_threshold, tuple(tags or [])))
+            cached = self._lookup_search_cache(cache_key) if use_cache else None
+            
+            query_vector = None
+            if cached is None:
+                # Generate embedding for search query unless the caller already has it
+                if query_embedding is None:
+                    query_embedding = await self.embedding_service.generate_embedding(query)
+                
+                # Near-duplicate queries reuse results only when explicitly enabled
+                if use_cache and self._search_cache_similarity is not None:
+                    query_vector = np.asarray(query_embedding, dtype=np.float32)
+                    query_vector = query_vector / (np.linalg.norm(query_vector) or 1.0)
+                    cached = self._lookup_similar_search(query_vector, cache_key[1])
+            
+            if cached is not None:
+                self._search_cache_hits += 1
+                self._update_metrics("search", success=True, duration=time.time() - start_time)
+                logger.debug(f"Search served from cache: {len(cached)} results")
+                return cached
             
             # Get candidate memories from database
             candidates = await self.database_service.search_memories(
@@ -208,20 +391,25 @@ class MemoryService:
                 tags=tags or []
             )
             
-            # Calculate similarity scores
-            scored_memories = []
-            for memory in candidates:
-                if memory.embedding:
-                    similarity = self.embedding_service.calculate_similarity(
-                        query_embedding, memory.embedding
-                    )
-                    if similarity >= similarity_threshold:
-                        memory.similarity_score = similarity
-                        scored_memories.append(memory)
+            # Score all candidates against the query in one matrix product
+            embedded = [memory for memory in candidates if memory.embedding]
+            final_memories = []
+            if embedded:
+                similarities = self.embedding_service.calculate_similarities(
+                    query_embedding, [memory.embedding for memory in embedded]
+                )
+                
+                # Walk candidates by descending similarity until the threshold or limit is reached
+                for index in np.argsort(-similarities, kind="stable"):
+                    similarity = float(similarities[index])
+                    if similarity < similarity_threshold or len(final_memories) >= max_results:
+                        break
+                    memory = embedded[index]
+                    memory.similarity_score = similarity
+                    final_memories.append(memory)
             
-            # Sort by similarity and limit results
-            scored_memories.sort(key=lambda m: m.similarity_score or 0, reverse=True)
-            final_memories = scored_memories[:max_results]
+            if use_cache and generation == self.search_cache_generation:
+                self._store_search_cache(cache_key, query_vector, final_memories)
             
             search_time = time.time() - start_time
             self._update_metrics("search", success=True, duration=search_time)
@@ -234,6 +422,86 @@ class MemoryService:
             logger.error(f"Memory search failed: {e}")
             raise MemoryServiceError(f"Memory search failed: {e}")
     
+    async def search_memories_batch(
+        self,
+        queries: List[str],
+        project: Optional[str] = None,
+        max_results: Optional[List[int]] = None,
+        similarity_thresholds: Optional[List[float]] = None,
+        tags: List[str] = None
+    ) -> List[List[Memory]]:
+        """Search memories for several queries with one embedding call and one similarity product"""
+        await self._ensure_initialized()
+        
+        if not queries:
+            return []
+        
+        try:
+            start_time = time.time()
+            limits = max_results or [20] * len(queries)
+            thresholds = similarity_thresholds or [0.3] * len(queries)
+            
+            # Repeated queries share one embedding and one database lookup sized for the largest limit
+            unique_limits: Dict[str, int] = {}
+            for query, limit in zip(queries, limits):
+                unique_limits[query] = max(limit, unique_limits.get(query, 0))
+            unique_queries = list(unique_limits)
+            slots = {query: slot for slot, query in enumerate(unique_queries)}
+            
+            query_embeddings = await self.embedding_service.generate_embeddings_batch(unique_queries)
+            candidate_lists = await asyncio.gather(*[
+                self.database_service.search_memories(
+                    project=project,
+                    limit=limit * 2,
+                    text_query=query,
+                    tags=tags or []
+                )
+                for query, limit in unique_limits.items()
+            ])
+            
+            # Score the union of candidates against every query at once
+            columns: Dict[str, int] = {}
+            embedded: List[Memory] = []
+            for candidates in candidate_lists:
+                for memory in candidates:
+                    if memory.embedding and memory.id not in columns:
+                        columns[memory.id] = len(embedded)
+                        embedded.append(memory)
+            
+            results: List[List[Memory]] = [[] for _ in queries]
+            if embedded:
+                similarities = self.embedding_service.calculate_similarity_matrix(
+                    query_embeddings, [memory.embedding for memory in embedded]
+                )
+                
+                # Each query only ranks the candidates its own database lookup returned
+                for row, query in enumerate(queries):
+                    slot = slots[query]
+                    indices = np.fromiter(
+                        dict.fromkeys(columns[m.id] for m in candidate_lists[slot] if m.id in columns),
+                        dtype=np.intp
+                    )
+                    if not indices.size:
+                        continue
+                    scores = similarities[slot, indices]
+                    for position in np.argsort(-scores, kind="stable"):
+                        similarity = float(scores[position])
+                        if similarity < thresholds[row] or len(results[row]) >= limits[row]:
+                            break
+                        memory = embedded[indices[position]]
+                        results[row].append(replace(memory, similarity_score=similarity))
+            
+            search_time = time.time() - start_time
+            self._update_metrics("search", success=True, duration=search_time)
+            
+            logger.debug(f"Batch search completed: {len(queries)} queries in {search_time:.3f}s")
+            return results
+            
+        except Exception as e:
+            self._update_metrics("search", success=False)
+            logger.error(f"Batch memory search failed: {e}")
+            raise MemoryServiceError(f"Batch memory search failed: {e}")
+    
     async def list_memories(
         self,
         project: str = "default",
@@ -273,7 +541,11 @@ class MemoryService:
                 embedding = await self.embedding_service.generate_embedding(updates.content)
                 updates.embedding = embedding
             
-            return await self.database_service.update_memory(memory_id, updates)
+            try:
+                return await self.database_service.update_memory(memory_id, updates)
+            finally:
+                # Only after the write, so searches overlapping it are never cached as current
+                self._invalidate_search_cache()
         except Exception as e:
             logger.error(f"Failed to update memory {memory_id}: {e}")
             raise MemoryServiceError(f"Failed to update memory: {e}")
@@ -283,7 +555,10 @@ class MemoryService:
         await self._ensure_initialized()
         
         try:
-            return await self.database_service.delete_memory(memory_id)
+            try:
+                return await self.database_service.delete_memory(memory_id)
+            finally:
+                self._invalidate_search_cache()
         except Exception as e:
             logger.error(f"Failed to delete memory {memory_id}: {e}")
             raise MemoryServiceError(f"Failed to delete memory: {e}")
@@ -330,8 +605,10 @@ class MemoryService:
     async def get_metrics(self) -> Dict[str, Any]:
         """Get memory service metrics"""
         try:
-            db_metrics = await self.database_service.get_metrics()
-            embedding_metrics = await self.embedding_service.get_metrics()
+            db_metrics, embedding_metrics = await asyncio.gather(
+                self.database_service.get_metrics(),
+                self.embedding_service.get_metrics()
+            )
             
             avg_search_time = (
                 self._total_search_time / self._search_count 
@@ -344,6 +621,8 @@ class MemoryService:
                 "auto_save_count": self._auto_save_count,
                 "avg_search_time_ms": avg_search_time * 1000,
                 "error_count": self._error_count,
+                "search_cache_size": len(self._search_cache_slots),
+                "search_cache_hits": self._search_cache_hits,
                 "database_metrics": db_metrics,
                 "embedding_metrics": embedding_metrics
             }
@@ -363,9 +642,11 @@ class MemoryService:
             if not self._initialized:
                 return {"status": "not_initialized"}
             
-            # Check dependencies
-            db_health = await self.database_service.health_check()
-            embedding_health = await self.embedding_service.health_check()
+            # Check dependencies concurrently
+            db_health, embedding_health = await asyncio.gather(
+                self.database_service.health_check(),
+                self.embedding_service.health_check()
+            )
             
             overall_status = "healthy" if (
                 db_health.get("status") == "healthy" and 
@@ -25,7 +25,7 @@ class MetricsService:
         # Metrics storage
         self._metrics_history: deque = deque(maxlen=1000)
         self._operation_counts = defaultdict(int)
-        self._operation_times = defaultdict(list)
+        self._operation_times = defaultdict(lambda: deque(maxlen=100))  # Last 100 times per operation
         self._error_counts = defaultdict(int)
         
         # Performance tracking
@@ -38,10 +38,6 @@ class MetricsService:
         self._operation_counts[operation] += 1
         self._operation_times[operation].append(duration)
         
-        # Keep only recent times (last 100)
-        if len(self._operation_times[operation]) > 100:
-            self._operation_times[operation] = self._operation_times[operation][-100:]
-        
         if not success:
             self._error_counts[operation] += 1
         
@@ -7,7 +7,7 @@ import logging
 import smtplib
 import aiohttp
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from dataclasses import dataclass
@@ -40,9 +40,16 @@ class NotificationService:
         self._initialized = False
         self._notification_queue = asyncio.Queue()
         self._worker_task = None
+        self._http_session: Optional[aiohttp.ClientSession] = None
         
         self.logger = logging.getLogger(__name__)
     
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use"""
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession()
+        return self._http_session
+    
     async def initialize(self) -> None:
         """Initialize notification service"""
         if self._initialized:
@@ -143,14 +150,14 @@ class NotificationService:
             }
             
             # Send webhook
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    webhook_config["url"],
-                    json=payload,
-                    headers=headers
-                ) as response:
-                    if response.status >= 400:
-                        raise NotificationServiceError(f"Webhook failed with status {response.status}")
+            session = self._get_http_session()
+            async with session.post(
+                webhook_config["url"],
+                json=payload,
+                headers=headers
+            ) as response:
+                if response.status >= 400:
+                    raise NotificationServiceError(f"Webhook failed with status {response.status}")
             
             self.logger.debug(f"Webhook notification sent to {webhook_config['url']}")
             
@@ -392,9 +399,9 @@ class NotificationService:
                 try:
                     # Test webhook connection
                     webhook_config = self.settings.notifications.providers["webhook"]
-                    async with aiohttp.ClientSession() as session:
-                        async with session.get(webhook_config["url"]) as response:
-                            webhook_ok = response.status < 500
+                    session = self._get_http_session()
+                    async with session.get(webhook_config["url"]) as response:
+                        webhook_ok = response.status < 500
                 except Exception:
                     webhook_ok = False
             
@@ -424,6 +431,10 @@ class NotificationService:
                 except asyncio.CancelledError:
                     pass
             
+            if self._http_session is not None:
+                await self._http_session.close()
+                self._http_session = None
+            
             self._initialized = False
             self.logger.info("Notification service stopped")
             
@@ -14,10 +14,19 @@ from datetime import datetime, timedelta
 import logging
 from dataclasses import dataclass
 
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Below this length per-phrase substring checks beat a single automaton scan
+AUTOMATON_MIN_MESSAGE_LENGTH = 256
+
 
 @dataclass
 class WatchdogConfig:
@@ -55,14 +64,27 @@ class KeywordDetector:
             'emergency restart', 'force restart', 'restart now',
             'riavvio di emergenza', 'riavvio forzato', 'riavvia subito'
         ]
+        
+        # One automaton over urgent patterns and keywords so a message is scanned once
+        self._automaton = None
+        if HAS_AHOCORASICK:
+            self._automaton = ahocorasick.Automaton()
+            for phrase in self.urgent_patterns + self.restart_keywords:
+                self._automaton.add_word(phrase, phrase)
+            self._automaton.make_automaton()
     
     def should_restart(self, message: str) -> Dict[str, any]:
         """Check if message contains restart triggers"""
         message_lower = message.lower().strip()
         
+        # Membership is tested against the set of phrases found, or the message text itself
+        haystack = message_lower
+        if self._automaton is not None and len(message_lower) >= AUTOMATON_MIN_MESSAGE_LENGTH:
+            haystack = {phrase for _, phrase in self._automaton.iter(message_lower)}
+        
         # Check for urgent patterns first
         for pattern in self.urgent_patterns:
-            if pattern in message_lower:
+            if pattern in haystack:
                 return {
                     "should_restart": True,
                     "reason": f"urgent_pattern: {pattern}",
@@ -73,7 +95,7 @@ class KeywordDetector:
         # Check for regular restart keywords
         triggered_keywords = []
         for keyword in self.restart_keywords:
-            if keyword in message_lower:
+            if keyword in haystack:
                 triggered_keywords.append(keyword)
         
         if triggered_keywords:
@@ -293,10 +315,10 @@ class WatchdogService:
         """Monitor stdin for restart keywords"""
         logger.info("👂 Monitoring stdin for restart keywords...")
         
+        loop = asyncio.get_running_loop()
         while self.running:
             try:
                 # Use a thread to read stdin without blocking
-                loop = asyncio.get_event_loop()
                 line = await loop.run_in_executor(None, sys.stdin.readline)
                 
                 if line:
@@ -5,6 +5,7 @@ Builds 100K+ training examples from multiple sources
 """
 
 import asyncio
+import hashlib
 import pandas as pd
 from typing import Dict, List, Any
 from dataclasses import dataclass
@@ -695,13 +696,18 @@ class ComprehensiveDatasetBuilder:
     def _process_final_dataset(self, all_examples: List[Dict], target_size: int) -> DatasetDict:
         """Process final dataset and create splits"""
         
-        # Convert to DataFrame for processing
-        df = pd.DataFrame(all_examples)
+        # Remove duplicates, keyed on a 16-byte digest so the seen set never holds the texts
+        seen = set()
+        unique_examples = []
+        for example in all_examples:
+            digest = hashlib.blake2b(example['text'].encode('utf-8'), digest_size=16).digest()
+            if digest not in seen:
+                seen.add(digest)
+                unique_examples.append(example)
+        logger.info(f"Removed {len(all_examples) - len(unique_examples)} duplicate examples")
         
-        # Remove duplicates
-        initial_size = len(df)
-        df = df.drop_duplicates(subset=['text'])
-        logger.info(f"Removed {initial_size - len(df)} duplicate examples")
+        # Convert to DataFrame for processing
+        df = pd.DataFrame(unique_examples)
         
         # Balance classes
         df = self._balance_classes(df, target_size)
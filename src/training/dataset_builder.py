@@ -5,16 +5,23 @@ Generates comprehensive training data from multiple sources
 """
 
 import random
+import re
 import json
+import hashlib
+import numpy as np
 import pandas as pd
+from collections import Counter
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass, asdict
 from datetime import datetime
+from functools import lru_cache
 
 # ML imports
 try:
-    from datasets import Dataset, DatasetDict, load_dataset
+    from datasets import Dataset, DatasetDict, IterableDataset, IterableDatasetDict, load_dataset, load_from_disk
+    import pyarrow.compute as pc
 
     from sklearn.model_selection import train_test_split
     HAS_DATASETS = True
@@ -26,6 +33,27 @@ from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Columns summarized in the saved dataset statistics
+STAT_COLUMNS = ('label_name', 'language', 'source')
+
+# Examples generated per step when streaming synthetic splits
+STREAM_BATCH_SIZE = 1000
+
+_PLACEHOLDER_RE = re.compile(r'\{(\w+)\}')
+
+
+def _text_length_stats(lengths: np.ndarray) -> Dict[str, Optional[float]]:
+    """Mean/min/max of text lengths"""
+    if not lengths.size:
+        return {'mean': None, 'min': None, 'max': None}
+    return {'mean': float(lengths.mean()), 'min': int(lengths.min()), 'max': int(lengths.max())}
+
+
+@lru_cache(maxsize=256)
+def _template_placeholders(template: str) -> Tuple[str, ...]:
+    """Placeholder names in a template, parsed once per distinct template"""
+    return tuple(_PLACEHOLDER_RE.findall(template))
+
 
 @dataclass
 class DatasetConfig:
@@ -48,6 +76,9 @@ class DatasetConfig:
     save_memory_ratio: float = 0.4
     search_memory_ratio: float = 0.35
     no_action_ratio: float = 0.25
+    
+    # Yield synthetic examples lazily instead of materializing the dataset
+    streaming: bool = False
 
 
 class SyntheticDataGenerator:
@@ -64,6 +95,14 @@ class SyntheticDataGenerator:
         # Initialize templates and vocabularies
         self._load_templates()
         self._load_vocabularies()
+        
+        # Resolve every template's placeholder tokens and vocabulary lists once
+        self._template_slots = {
+            template: self._compile_template(template)
+            for class_templates in self.templates.values()
+            for language_templates in class_templates.values()
+            for template in language_templates
+        }
     
     def _load_templates(self):
         """Load text generation templates"""
@@ -267,6 +306,14 @@ class SyntheticDataGenerator:
     def generate_examples(self, num_samples: int, language: str = 'en') -> List[Dict[str, Any]]:
         """Generate synthetic training examples"""
         
+        examples = self.generate_mixed_batch(num_samples, language)
+        
+        logger.info(f"Generated {len(examples)} synthetic examples in {language}")
+        return examples
+    
+    def generate_mixed_batch(self, num_samples: int, language: str) -> List[Dict[str, Any]]:
+        """Generate a shuffled batch following the configured class ratios"""
+        
         examples = []
         
         # Calculate samples per class
@@ -281,51 +328,56 @@ class SyntheticDataGenerator:
         }
         
         for class_name, sample_count in class_samples.items():
-            for _ in range(sample_count):
-                example = self._generate_single_example(class_name, language)
-                examples.append(example)
+            examples.extend(self.generate_batch(class_name, language, sample_count))
         
         # Shuffle examples
         random.shuffle(examples)
-        
-        logger.info(f"Generated {len(examples)} synthetic examples in {language}")
         return examples
     
+    def generate_batch(self, class_name: str, language: str, count: int) -> List[Dict[str, Any]]:
+        """Generate count training examples for one class and language"""
+        
+        # Draw every template up front; label fields are shared by the whole batch
+        templates = random.choices(self.templates[class_name][language], k=count)
+        label = self.label_mapping[class_name]
+        
+        return [
+            {
+                'text': self._add_variations(self._fill_template(template), class_name),
+                'label': label,
+                'label_name': class_name,
+                'language': language,
+                'source': 'synthetic',
+                'template': template
+            }
+            for template in templates
+        ]
+    
     def _generate_single_example(self, class_name: str, language: str) -> Dict[str, Any]:
         """Generate a single training example"""
-        
-        template = random.choice(self.templates[class_name][language])
-        
-        # Fill template with vocabulary
-        filled_text = self._fill_template(template)
-        
-        # Add variations
-        varied_text = self._add_variations(filled_text, class_name)
-        
-        return {
-            'text': varied_text,
-            'label': self.label_mapping[class_name],
-            'label_name': class_name,
-            'language': language,
-            'source': 'synthetic',
-            'template': template
-        }
+        return self.generate_batch(class_name, language, 1)[0]
     
     def _fill_template(self, template: str) -> str:
         """Fill template with random vocabulary"""
         
-        # Find all placeholders in template
-        import re
-        placeholders = re.findall(r'\{(\w+)\}', template)
+        slots = self._template_slots.get(template)
+        if slots is None:
+            slots = self._compile_template(template)
         
         filled_template = template
-        for placeholder in placeholders:
-            if placeholder in self.vocabularies:
-                replacement = random.choice(self.vocabularies[placeholder])
-                filled_template = filled_template.replace(f'{{{placeholder}}}', replacement)
+        for token, choices in slots:
+            filled_template = filled_template.replace(token, random.choice(choices))
         
         return filled_template
     
+    def _compile_template(self, template: str) -> Tuple[Tuple[str, List[str]], ...]:
+        """(placeholder token, vocabulary) pairs for the placeholders this generator can fill"""
+        return tuple(
+            (f'{{{placeholder}}}', self.vocabularies[placeholder])
+            for placeholder in _template_placeholders(template)
+            if placeholder in self.vocabularies
+        )
+    
     def _add_variations(self, text: str, class_name: str) -> str:
         """Add variations to make text more natural"""
         
@@ -401,7 +453,8 @@ class ExistingDatasetAdapter:
             
             for split in ['train', 'validation']:
                 if split in dataset:
-                    for example in dataset[split]:
+                    # Pull the split in one Arrow read instead of formatting row by row
+                    for example in dataset[split].to_list():
                         adapted_example = self._adapt_snips_example(example)
                         if adapted_example:
                             adapted_examples.append(adapted_example)
@@ -469,7 +522,7 @@ class ExistingDatasetAdapter:
             
             for split in ['train', 'test']:
                 if split in dataset:
-                    for example in dataset[split]:
+                    for example in dataset[split].to_list():
                         adapted_example = self._adapt_banking_example(example, banking_mappings)
                         if adapted_example:
                             adapted_examples.append(adapted_example)
@@ -519,9 +572,37 @@ class AutoTriggerDatasetBuilder:
         self.synthetic_generator = SyntheticDataGenerator(self.config)
         self.existing_adapter = ExistingDatasetAdapter()
     
-    def build_comprehensive_dataset(self):
+    def build_comprehensive_dataset(self, cache_dir: Optional[Path] = None):
         """Build comprehensive training dataset from all sources"""
         
+        if self.config.streaming:
+            if HAS_DATASETS:
+                return self._build_streaming_dataset()
+            logger.warning("datasets library not available, building dataset in memory")
+        
+        cache_path = None
+        if cache_dir is not None and HAS_DATASETS:
+            cache_path = Path(cache_dir) / self._config_hash()
+            if cache_path.exists():
+                logger.info(f"Loading cached dataset from {cache_path}")
+                return load_from_disk(str(cache_path))
+        
+        dataset_dict = self._build_dataset()
+        
+        if cache_path is not None:
+            dataset_dict.save_to_disk(str(cache_path))
+            logger.info(f"Dataset cached to {cache_path}")
+        
+        return dataset_dict
+    
+    def _config_hash(self) -> str:
+        """Short stable digest of the config, used as the dataset cache key"""
+        config_json = json.dumps(asdict(self.config), sort_keys=True)
+        return hashlib.sha1(config_json.encode()).hexdigest()[:12]
+    
+    def _build_dataset(self):
+        """Generate, balance and split the examples from all sources"""
+        
         logger.info("Building comprehensive auto-trigger dataset...")
         
         all_examples = []
@@ -579,6 +660,41 @@ class AutoTriggerDatasetBuilder:
         
         return dataset_dict
     
+    def _build_streaming_dataset(self):
+        """Build iterable splits that generate synthetic examples on demand"""
+        
+        logger.info("Building streaming auto-trigger dataset (synthetic source only)...")
+        
+        train_samples = int(self.config.total_samples * self.config.train_split)
+        val_samples = int(self.config.total_samples * self.config.val_split)
+        test_samples = self.config.total_samples - train_samples - val_samples
+        
+        return IterableDatasetDict({
+            split_name: IterableDataset.from_generator(
+                self._yield_examples, gen_kwargs={'num_samples': split_samples}
+            )
+            for split_name, split_samples in (
+                ('train', train_samples),
+                ('validation', val_samples),
+                ('test', test_samples)
+            )
+        })
+    
+    def _yield_examples(self, num_samples: int):
+        """Yield synthetic examples, holding at most one batch in memory"""
+        
+        remaining = num_samples
+        while remaining > 0:
+            batch_size = min(STREAM_BATCH_SIZE, remaining)
+            en_samples = int(batch_size * self.config.english_ratio)
+            
+            batch = self.synthetic_generator.generate_mixed_batch(en_samples, 'en')
+            batch.extend(self.synthetic_generator.generate_mixed_batch(batch_size - en_samples, 'it'))
+            random.shuffle(batch)
+            
+            yield from batch
+            remaining -= batch_size
+    
     def _balance_classes(self, df: pd.DataFrame) -> pd.DataFrame:
         """Balance classes to desired ratios"""
         
@@ -660,6 +776,14 @@ class AutoTriggerDatasetBuilder:
             # Save as HuggingFace dataset
             dataset.save_to_disk(str(output_dir))
             logger.info(f"Dataset saved to {output_dir}")
+        elif HAS_DATASETS and isinstance(dataset, IterableDatasetDict):
+            # Stream each split to JSON lines without materializing it
+            for split_name, split_data in dataset.items():
+                split_file = output_dir / f"{split_name}.jsonl"
+                with open(split_file, 'w', encoding='utf-8') as f:
+                    for example in split_data:
+                        f.write(json.dumps(example, ensure_ascii=False) + '\n')
+                logger.info(f"Split '{split_name}' streamed to {split_file}")
         else:
             # Save as JSON files
             for split_name, split_data in dataset.items():
@@ -691,37 +815,66 @@ class AutoTriggerDatasetBuilder:
         }
         
         for split_name, split_data in dataset.items():
-            if HAS_DATASETS and hasattr(split_data, '__len__'):
-                split_size = len(split_data)
-                if hasattr(split_data, 'to_pandas'):
-                    split_df = split_data.to_pandas()
-                    class_dist = split_df['label_name'].value_counts().to_dict()
-                    lang_dist = split_df['language'].value_counts().to_dict()
-                    source_dist = split_df['source'].value_counts().to_dict()
-                else:
-                    class_dist = {}
-                    lang_dist = {}
-                    source_dist = {}
+            if HAS_DATASETS and isinstance(split_data, IterableDataset):
+                # Every pass regenerates the examples, so there is nothing fixed to count
+                stats['splits'][split_name] = {'streaming': True}
+            elif hasattr(split_data, 'with_format'):
+                stats['splits'][split_name] = self._arrow_split_stats(split_data)
             else:
-                split_size = len(split_data)
-                class_dist = {}
-                lang_dist = {}
-                source_dist = {}
-            
-            stats['splits'][split_name] = {
-                'size': split_size,
-                'class_distribution': class_dist,
-                'language_distribution': lang_dist,
-                'source_distribution': source_dist
-            }
+                stats['splits'][split_name] = self._records_split_stats(split_data)
         
         return stats
+    
+    def _arrow_split_stats(self, split_data) -> Dict[str, Any]:
+        """Split statistics computed on the Arrow columns without a pandas round-trip"""
+        
+        table = split_data.select_columns(list(STAT_COLUMNS) + ['text']).with_format('arrow')[:]
+        text_lengths = pc.utf8_length(table.column('text'))
+        
+        def distribution(column: str) -> Dict[str, int]:
+            counts = pc.value_counts(table.column(column))
+            pairs = zip(counts.field('values').to_pylist(), counts.field('counts').to_pylist())
+            return dict(sorted(pairs, key=lambda pair: pair[1], reverse=True))
+        
+        return {
+            'size': table.num_rows,
+            'class_distribution': distribution('label_name'),
+            'language_distribution': distribution('language'),
+            'source_distribution': distribution('source'),
+            'text_length': {
+                'mean': pc.mean(text_lengths).as_py(),
+                'min': pc.min(text_lengths).as_py(),
+                'max': pc.max(text_lengths).as_py()
+            }
+        }
+    
+    def _records_split_stats(self, split_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Split statistics for the dict-records fallback format"""
+        
+        # Records come from DataFrame.to_dict('records'), so every column is present
+        def distribution(column: str) -> Dict[str, int]:
+            return dict(Counter(map(itemgetter(column), split_data)).most_common())
+        
+        text_lengths = np.fromiter(
+            map(len, map(itemgetter('text'), split_data)),
+            dtype=np.int64,
+            count=len(split_data)
+        )
+        
+        return {
+            'size': len(split_data),
+            'class_distribution': distribution('label_name'),
+            'language_distribution': distribution('language'),
+            'source_distribution': distribution('source'),
+            'text_length': _text_length_stats(text_lengths)
+        }
 
 
 def build_auto_trigger_dataset(
     total_samples: int = 10000,
     output_dir: str = "./data/auto_trigger_dataset",
-    config: DatasetConfig = None
+    config: DatasetConfig = None,
+    cache_dir: Optional[str] = None
 ):
     """Convenience function to build auto-trigger dataset"""
     
@@ -729,7 +882,7 @@ def build_auto_trigger_dataset(
         config = DatasetConfig(total_samples=total_samples)
     
     builder = AutoTriggerDatasetBuilder(config)
-    dataset = builder.build_comprehensive_dataset()
+    dataset = builder.build_comprehensive_dataset(cache_dir=Path(cache_dir) if cache_dir else None)
     
     output_path = Path(output_dir)
     builder.save_dataset(dataset, output_path)
@@ -6,6 +6,7 @@ Generates training data and trains initial models
 
 import json
 import random
+from collections import Counter
 import numpy as np
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
@@ -543,12 +544,13 @@ class MLTrainingPipeline:
         with open(evaluation_file, 'w') as f:
             json.dump(evaluation, f, indent=2)
         
-        # Save training data summary
+        # Save training data summary (action counts gathered in one pass)
+        action_counts = Counter(action for _, action in training_samples)
         data_summary = {
             'total_samples': len(training_samples),
-            'save_samples': sum(1 for _, action in training_samples if action == ActionType.SAVE_MEMORY),
-            'search_samples': sum(1 for _, action in training_samples if action == ActionType.SEARCH_MEMORY),
-            'no_action_samples': sum(1 for _, action in training_samples if action == ActionType.NO_ACTION),
+            'save_samples': action_counts[ActionType.SAVE_MEMORY],
+            'search_samples': action_counts[ActionType.SEARCH_MEMORY],
+            'no_action_samples': action_counts[ActionType.NO_ACTION],
             'generation_timestamp': datetime.now().isoformat()
         }
         
@@ -0,0 +1,155 @@
+"""
+Unit tests for the Auto-Trigger System
+"""
+
+import pytest
+import sys
+import os
+from unittest.mock import AsyncMock, MagicMock
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+sys.path.insert(0, project_root)
+
+from src.core import auto_trigger_system  # noqa: E402
+from src.core.auto_trigger_system import AutoTriggerSystem, TriggerRule, TriggerType  # noqa: E402
+
+
+def make_system() -> AutoTriggerSystem:
+    """Build a trigger system over stub services"""
+    memory_service = MagicMock()
+    memory_service.search_memories = AsyncMock(return_value=[])
+    return AutoTriggerSystem(memory_service, MagicMock())
+
+
+def keyword_rule(keywords, action: str, priority: int, exclusive: bool = False) -> TriggerRule:
+    """Keyword rule that fires on any of the given keywords"""
+    return TriggerRule(
+        trigger_type=TriggerType.KEYWORD_BASED,
+        condition={"keywords": keywords, "threshold": 1},
+        action=action,
+        priority=priority,
+        exclusive=exclusive
+    )
+
+
+class TestAutoTriggerSystem:
+    """Test cases for AutoTriggerSystem"""
+    
+    @pytest.fixture
+    def trigger_system(self):
+        """Create a trigger system with no rules loaded"""
+        system = make_system()
+        system.trigger_rules = []
+        return system
+    
+    @pytest.mark.asyncio
+    async def test_exclusive_rule_suppresses_lower_priority_rules(self, trigger_system):
+        """Test no rule below a fired exclusive rule is checked"""
+        # Arrange
+        trigger_system.add_trigger_rule(keyword_rule(["deploy"], "get_memory_context", priority=5, exclusive=True))
+        trigger_system.add_trigger_rule(keyword_rule(["deploy"], "search_memories", priority=3))
+        trigger_system.add_trigger_rule(keyword_rule(["deploy"], "save_memory", priority=9))
+        
+        # Act
+        actions = await trigger_system.check_triggers([{"content": "how do we deploy this?"}])
+        
+        # Assert
+        assert [action for action, _ in actions] == ["save_memory", "get_memory_context"]
+        assert "keyword_search_memories" not in trigger_system.last_trigger_times
+    
+    @pytest.mark.asyncio
+    async def test_second_rule_for_same_action_is_dropped(self, trigger_system):
+        """Test only the highest-priority rule for an action fires and starts a cooldown"""
+        # Arrange
+        trigger_system.add_trigger_rule(keyword_rule(["deploy"], "save_memory", priority=4))
+        trigger_system.add_trigger_rule(
+            TriggerRule(
+                trigger_type=TriggerType.PATTERN_RECOGNITION,
+                condition={"patterns": [r"deploy"]},
+                action="save_memory",
+                priority=8
+            )
+        )
+        
+        # Act
+        actions = await trigger_system.check_triggers([{"content": "we deploy on fridays"}])
+        
+        # Assert
+        assert len(actions) == 1
+        action, params = actions[0]
+        assert action == "save_memory"
+        assert params["metadata"]["trigger_type"] == "pattern_recognition"
+        assert list(trigger_system.last_trigger_times) == ["pattern_save_memory"]
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("content", [
+        "Remember to note this: don't forget the reference",
+        "Salva per dopo, è IMPORTANTE",
+        "notebook notes are stored here",
+        "nothing to see"
+    ])
+    async def test_keyword_automaton_matches_substring_fallback(self, monkeypatch, content):
+        """Test the Aho-Corasick scan finds the same keywords as the substring scan"""
+        # Arrange
+        pytest.importorskip("ahocorasick")
+        messages = [{"content": content}]
+        monkeypatch.setattr(auto_trigger_system, "HAS_AHOCORASICK", False)
+        fallback = make_system()
+        monkeypatch.setattr(auto_trigger_system, "HAS_AHOCORASICK", True)
+        automaton = make_system()
+        
+        # Act
+        results = []
+        for system in (fallback, automaton):
+            rule = next(r for r in system.trigger_rules if r.trigger_type == TriggerType.KEYWORD_BASED)
+            analysis = await system.analyze_conversation(messages)
+            results.append((rule._keyword_automaton is not None, system._check_keyword_trigger(rule, analysis, messages, "test")))
+        
+        # Assert
+        assert [uses_automaton for uses_automaton, _ in results] == [False, True]
+        assert results[0][1] == results[1][1]
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("content", [
+        "The ERROR in the parser is now FIXED, here's how",
+        "Bug risolto: ecco la solution step by step",
+        "How to write a class in python",
+        "the error is still there"
+    ])
+    async def test_pattern_set_matches_regex_fallback(self, monkeypatch, content):
+        """Test the RE2 set scan matches the same patterns as the regex scan"""
+        # Arrange
+        pytest.importorskip("re2")
+        messages = [{"content": content}]
+        monkeypatch.setattr(auto_trigger_system, "HAS_RE2", False)
+        fallback = make_system()
+        monkeypatch.setattr(auto_trigger_system, "HAS_RE2", True)
+        pattern_set = make_system()
+        
+        # Act
+        results = []
+        for system in (fallback, pattern_set):
+            rule = next(r for r in system.trigger_rules if r.trigger_type == TriggerType.PATTERN_RECOGNITION)
+            analysis = await system.analyze_conversation(messages)
+            results.append((rule._pattern_set is not None, system._check_pattern_trigger(rule, analysis, messages, "test")))
+        
+        # Assert
+        assert [uses_set for uses_set, _ in results] == [False, True]
+        assert results[0][1] == results[1][1]
+    
+    @pytest.mark.parametrize("priority", [11, 10, 7, 4, 3, 0])
+    def test_add_trigger_rule_keeps_priority_order(self, priority):
+        """Test an added rule lands after existing rules of the same priority"""
+        # Arrange
+        system = make_system()
+        existing = list(system.trigger_rules)
+        rule = keyword_rule(["deploy"], "save_memory", priority=priority)
+        
+        # Act
+        system.add_trigger_rule(rule)
+        
+        # Assert
+        expected = sorted(existing + [rule], key=lambda r: r.priority, reverse=True)
+        assert [id(r) for r in system.trigger_rules] == [id(r) for r in expected]
+        assert rule._key == "keyword_save_memory"
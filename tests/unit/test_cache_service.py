@@ -0,0 +1,42 @@
+"""
+Unit tests for Cache Service
+"""
+
+import json
+import pytest
+import sys
+import os
+from unittest.mock import AsyncMock
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+sys.path.insert(0, project_root)
+
+from src.services.cache_service import CacheService  # noqa: E402
+from src.config.settings import get_settings  # noqa: E402
+
+
+class TestCacheService:
+    """Test cases for CacheService"""
+    
+    @pytest.fixture
+    def cache_service(self):
+        """Create cache service with a stub Redis client"""
+        service = CacheService(get_settings())
+        service.redis_client = AsyncMock()
+        return service
+    
+    @pytest.mark.asyncio
+    async def test_set_writes_non_string_keys_to_redis(self, cache_service):
+        """Test values with int keys reach Redis with their keys stringified"""
+        # Arrange
+        value = {1: "first", "nested": {2: [0.5]}}
+        
+        # Act
+        result = await cache_service.set("counts", value, ttl=60)
+        
+        # Assert
+        assert result is True
+        key, ttl, payload = cache_service.redis_client.setex.call_args.args
+        assert (key, ttl) == ("counts", 60)
+        assert json.loads(payload) == {"1": "first", "nested": {"2": [0.5]}}
@@ -0,0 +1,77 @@
+"""
+Unit tests for the unified MCP server tool handlers
+"""
+
+import json
+import logging
+import pytest
+import sys
+import os
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from datetime import datetime
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+sys.path.insert(0, project_root)
+
+from src.core.server import MCPServer  # noqa: E402
+from src.models.memory import Memory  # noqa: E402
+
+
+def make_memory(content: str) -> Memory:
+    """Build a stored memory for the stub service"""
+    return Memory(
+        id=f"mem_{content}",
+        project="default",
+        content=content,
+        memory_type="conversation",
+        importance=0.5,
+        created_at=datetime.utcnow(),
+        updated_at=datetime.utcnow()
+    )
+
+
+class TestMCPServerTools:
+    """Test cases for MCPServer tool handlers"""
+    
+    @pytest.fixture
+    def server(self):
+        """Handler host with a stub memory service, without building the MCP server"""
+        memory_service = SimpleNamespace(
+            create_memory=AsyncMock(side_effect=lambda **fields: make_memory(fields["content"])),
+            create_memories=AsyncMock(side_effect=lambda items: [make_memory(item["content"]) for item in items])
+        )
+        return SimpleNamespace(
+            memory_service=memory_service,
+            _memory_fields=MCPServer._memory_fields,
+            logger=logging.getLogger(__name__)
+        )
+    
+    @pytest.mark.asyncio
+    async def test_save_memories_stores_items_like_save_memory(self, server):
+        """Test save_memories applies the same SAM context defaults as save_memory"""
+        # Arrange
+        item = {"content": "use uv for installs", "importance": 0.8, "tags": ["tooling"], "context": {"source": "chat"}}
+        
+        # Act
+        await MCPServer._handle_save_memory(server, dict(item))
+        await MCPServer._handle_save_memories(server, {"items": [dict(item)]})
+        
+        # Assert
+        single = server.memory_service.create_memory.call_args.kwargs
+        batched = server.memory_service.create_memories.call_args.args[0][0]
+        assert batched == single
+        assert single["context"] == {
+            "source": "chat", "category": "conversation", "importance": 0.8, "tags": ["tooling"]
+        }
+    
+    @pytest.mark.asyncio
+    async def test_save_memories_requires_content(self, server):
+        """Test an item without content fails the whole call before anything is stored"""
+        # Act
+        result = json.loads(await MCPServer._handle_save_memories(server, {"items": [{"content": "ok"}, {}]}))
+        
+        # Assert
+        assert result["success"] is False
+        server.memory_service.create_memories.assert_not_called()
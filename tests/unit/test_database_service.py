@@ -15,7 +15,7 @@ sys.path.insert(0, project_root)
 
 from src.services.database_service import DatabaseService  # noqa: E402
 from src.config.settings import get_settings  # noqa: E402
-from src.models.memory import Memory, MemoryType  # noqa: E402
+from src.models.memory import Memory, MemoryCreate, MemoryType  # noqa: E402
 
 
 class TestDatabaseService:
@@ -100,6 +100,27 @@ class TestDatabaseService:
         with pytest.raises(Exception):
             await database_service.create_memory(mock_memory)
     
+    @pytest.mark.asyncio
+    async def test_create_memories_single_insert(self, database_service):
+        """Test bulk memory creation uses one insert round-trip"""
+        # Arrange
+        database_service._initialized = True
+        database_service.collection = AsyncMock()
+        inserted_ids = [ObjectId(), ObjectId()]
+        database_service.collection.insert_many.return_value = Mock(inserted_ids=inserted_ids)
+        memory_creates = [
+            MemoryCreate(project="test_project", content="First memory", embedding=[0.1, 0.2]),
+            MemoryCreate(project="test_project", content="Second memory", embedding=[0.3, 0.4])
+        ]
+        
+        # Act
+        result = await database_service.create_memories(memory_creates)
+        
+        # Assert
+        database_service.collection.insert_many.assert_called_once()
+        assert [memory.id for memory in result] == [str(i) for i in inserted_ids]
+        assert [memory.content for memory in result] == ["First memory", "Second memory"]
+    
     @pytest.mark.asyncio
     async def test_get_memory_success(self, database_service):
         """Test successful memory retrieval"""
@@ -5,7 +5,7 @@ Unit tests for Embedding Service
 import pytest
 import sys
 import os
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 import numpy as np
 
 # Add project root to path
@@ -218,6 +218,46 @@ class TestEmbeddingService:
         # Assert
         assert abs(result) < 1e-6  # Should be very close to 0.0
     
+    @pytest.mark.parametrize("backend", ["simsimd", "numba", "numpy"])
+    def test_calculate_similarity_matrix_zero_vectors(self, backend):
+        """Test every similarity backend scores zero vectors 0"""
+        # Arrange
+        module = sys.modules[EmbeddingService.__module__]
+        if not getattr(module, f"HAS_{backend.upper()}", True):
+            pytest.skip(f"{backend} is not installed")
+        service = EmbeddingService(get_settings().embedding)
+        queries = [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0]]
+        embeddings = [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 2.0, 0.0]]
+        
+        # Act
+        with patch.object(module, "HAS_SIMSIMD", backend == "simsimd"), \
+                patch.object(module, "HAS_NUMBA", backend == "numba"):
+            result = service.calculate_similarity_matrix(queries, embeddings)
+        
+        # Assert
+        np.testing.assert_allclose(result, [[0.0, 0.0, 0.0], [0.0, 1.0, 0.0]], atol=1e-6)
+    
+    @pytest.mark.asyncio
+    async def test_initialize_compiles_numba_kernel(self, tmp_path):
+        """Test initialize runs the numba kernel once so the first search does not compile it"""
+        # Arrange
+        module = sys.modules[EmbeddingService.__module__]
+        if not module.HAS_NUMBA:
+            pytest.skip("numba is not installed")
+        settings = get_settings().embedding.model_copy(update={"model_cache_dir": str(tmp_path)})
+        service = EmbeddingService(settings)
+        kernel = Mock(wraps=module._cosine_scores)
+        
+        # Act
+        with patch.object(service, "_load_sentence_transformer", AsyncMock()), \
+                patch.object(module, "HAS_SIMSIMD", False), \
+                patch.object(module, "_cosine_scores", kernel):
+            await service.initialize()
+        
+        # Assert
+        assert service._initialized is True
+        kernel.assert_called_once()
+    
     @pytest.mark.asyncio
     async def test_cache_embedding_success(self, embedding_service, mock_texts, mock_embeddings):
         """Test successful embedding caching"""
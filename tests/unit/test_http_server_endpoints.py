@@ -0,0 +1,152 @@
+"""
+Unit tests for the HTTP server endpoints
+"""
+
+import pytest
+import sys
+import os
+from datetime import datetime
+from fastapi.testclient import TestClient
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+sys.path.insert(0, project_root)
+
+import servers.http_server as http_server  # noqa: E402
+from src.models.memory import Memory  # noqa: E402
+
+
+def make_memory(content: str, project: str = "default", tags=None) -> Memory:
+    """Build a stored memory for the stub service"""
+    return Memory(
+        id=f"mem_{content}",
+        project=project,
+        content=content,
+        memory_type="note",
+        importance=0.5,
+        tags=tags or [],
+        created_at=datetime.utcnow(),
+        updated_at=datetime.utcnow()
+    )
+
+
+class StubMemoryService:
+    """MemoryService stand-in recording the calls the endpoints make"""
+    
+    def __init__(self, settings):
+        self.search_cache_generation = 0
+        self.search_calls = []
+        self.batch_calls = []
+    
+    async def initialize(self):
+        pass
+    
+    async def create_memory(self, **kwargs):
+        if kwargs["content"] == "fail":
+            raise RuntimeError("database unavailable")
+        # Writes invalidate cached searches, as in MemoryService._invalidate_search_cache
+        self.search_cache_generation += 1
+        return make_memory(kwargs["content"], kwargs["project"], kwargs["tags"])
+    
+    async def search_memories(self, **kwargs):
+        self.search_calls.append(kwargs)
+        return [make_memory(f"hit for {kwargs['query']}")]
+    
+    async def search_memories_batch(self, queries, project=None, max_results=None,
+                                    similarity_thresholds=None, tags=None):
+        self.batch_calls.append({"queries": queries, "project": project, "tags": tags})
+        return [[make_memory(f"hit for {query}")] for query in queries]
+
+
+class TestHttpServer:
+    """Test cases for the HTTP server"""
+    
+    @pytest.fixture
+    def client(self, monkeypatch):
+        """TestClient whose lifespan builds the stub memory service"""
+        monkeypatch.setattr(http_server, "MemoryService", StubMemoryService)
+        monkeypatch.setattr(http_server, "HTTP_WORKERS", 1)
+        with TestClient(http_server.app) as client:
+            yield client
+    
+    def test_search_response_cache_hit(self, client):
+        """Test an exact repeat of a search is served from the response cache"""
+        service = client.app.state.memory_service
+        
+        first = client.post("/memory/search", json={"query": "python"})
+        second = client.post("/memory/search", json={"query": "python"})
+        
+        assert first.headers["X-Cache"] == "MISS"
+        assert second.headers["X-Cache"] == "HIT"
+        assert second.json() == first.json()
+        assert len(service.search_calls) == 1
+    
+    def test_search_response_cache_miss_after_write(self, client):
+        """Test POST /memory bumps the generation and stales cached searches"""
+        service = client.app.state.memory_service
+        
+        client.post("/memory/search", json={"query": "python"})
+        assert client.post("/memory", json={"content": "new note"}).status_code == 200
+        after_write = client.post("/memory/search", json={"query": "python"})
+        
+        assert after_write.headers["X-Cache"] == "MISS"
+        assert len(service.search_calls) == 2
+    
+    def test_search_response_cache_ttl_expiry(self, client):
+        """Test cached searches older than the TTL are searched again"""
+        state = client.app.state
+        
+        client.post("/memory/search", json={"query": "python"})
+        # Age every entry past the TTL
+        for key, (generation, timestamp, body) in list(state.search_responses.items()):
+            state.search_responses[key] = (generation, timestamp - state.search_response_ttl - 1, body)
+        expired = client.post("/memory/search", json={"query": "python"})
+        
+        assert expired.headers["X-Cache"] == "MISS"
+        assert len(state.memory_service.search_calls) == 2
+    
+    def test_search_response_cache_disabled_with_workers(self, monkeypatch):
+        """Test the per-process response cache is off when several workers run"""
+        monkeypatch.setattr(http_server, "MemoryService", StubMemoryService)
+        monkeypatch.setattr(http_server, "HTTP_WORKERS", 4)
+        
+        with TestClient(http_server.app) as client:
+            client.post("/memory/search", json={"query": "python"})
+            repeat = client.post("/memory/search", json={"query": "python"})
+            
+            assert repeat.headers["X-Cache"] == "MISS"
+            assert len(client.app.state.search_responses) == 0
+    
+    def test_batch_mixed_items_keep_request_order(self, client):
+        """Test /batch answers saves, searches and invalid items in request order"""
+        service = client.app.state.memory_service
+        items = [
+            {"op": "search", "payload": {"query": "first", "project": "p"}},
+            {"op": "save", "payload": {"content": "note", "project": "p", "tags": ["a"]}},
+            {"op": "search", "payload": {"max_results": 3}},
+            {"op": "save", "payload": {"content": "fail"}},
+            {"op": "search", "payload": {"query": "second", "project": "p"}},
+            {"op": "search", "payload": {"query": "tagged", "project": "p", "tags": ["a"]}},
+        ]
+        
+        response = client.post("/batch", json=items)
+        body = response.json()
+        results = body["results"]
+        
+        assert response.status_code == 200
+        assert body["success"] is False
+        assert body["count"] == len(items)
+        assert results[0]["memories"][0]["content"] == "hit for first"
+        assert results[1]["success"] is True
+        assert results[1]["memory"]["content"] == "note"
+        # A bad payload fails only its own item
+        assert results[2]["success"] is False
+        assert "query" in results[2]["error"]
+        assert results[3] == {"success": False, "error": "Failed to create memory: database unavailable"}
+        assert results[4]["memories"][0]["content"] == "hit for second"
+        assert results[5]["memories"][0]["content"] == "hit for tagged"
+        # Searches sharing project and tags are embedded together
+        assert sorted(call["queries"] for call in service.batch_calls) == [["first", "second"], ["tagged"]]
+        
+        # An unknown op is rejected by the request model before any work runs
+        assert client.post("/batch", json=[{"op": "delete", "payload": {}}]).status_code == 422
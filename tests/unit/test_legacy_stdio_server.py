@@ -0,0 +1,95 @@
+"""
+Unit tests for the legacy stdio MCP server loop
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+SERVER_PATH = os.path.join(project_root, "servers", "legacy", "mcp_memory_server.py")
+
+# Runs the real async_main over the process's stdin/stdout with a stub full server
+# whose searches finish in reverse order and return large payloads
+DRIVER = """
+import asyncio, importlib.util, sys, types
+sys.path.insert(0, sys.argv[1])
+spec = importlib.util.spec_from_file_location("mcp_memory_server", sys.argv[2])
+server = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(server)
+
+class StubFullServer:
+    async def _handle_search_memories(self, arguments):
+        await asyncio.sleep(arguments["delay"])
+        return [types.SimpleNamespace(text=arguments["query"] * 100000)]
+
+async def initialize():
+    pass
+
+try:
+    from src.services.memory_service import memory_service
+    memory_service.initialize = initialize
+except ImportError:
+    pass
+server.initialize_full_memory_server = lambda: (StubFullServer(), True)
+server.main()
+"""
+
+
+def search_request(request_id: int, delay: float) -> bytes:
+    """Encode a search_memories tool call for the stdin pipe"""
+    return (json.dumps({
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "method": "tools/call",
+        "params": {
+            "name": "search_memories",
+            "arguments": {"query": f"q{request_id}", "delay": delay}
+        }
+    }) + "\n").encode("utf-8")
+
+
+class TestLegacyStdioServer:
+    """Test cases for the legacy server's stdin loop"""
+    
+    @pytest.mark.parametrize("stdin_kind", ["pipe", "file"])
+    def test_concurrent_requests_get_one_whole_response_each(self, tmp_path, stdin_kind):
+        """Test piped or redirected requests each get one complete response, including those pending at EOF"""
+        count = 6
+        # Later requests finish first; the 2 KiB line limit makes the garbage line oversized
+        stdin = b"".join(search_request(i, 0.05 * (count - i)) for i in range(1, count + 1))
+        stdin += b"x" * 5000 + b"\n"
+        env = dict(os.environ, STDIN_LINE_LIMIT="2048", MAX_CONCURRENT_REQUESTS="8")
+        
+        # Redirected from a file, stdin cannot be an asyncio pipe transport
+        requests_file = tmp_path / "requests.jsonl"
+        requests_file.write_bytes(stdin)
+        with requests_file.open("rb") as stdin_file:
+            stdin_args = {"stdin": stdin_file} if stdin_kind == "file" else {"input": stdin}
+            completed = subprocess.run(
+                [sys.executable, "-c", DRIVER, project_root, SERVER_PATH],
+                **stdin_args,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                cwd=str(tmp_path),
+                env=env,
+                timeout=60
+            )
+        
+        lines = completed.stdout.splitlines()
+        responses = [json.loads(line) for line in lines]
+        results = {r["id"]: r for r in responses if r["id"] is not None}
+        errors = [r for r in responses if r["id"] is None]
+        
+        assert completed.returncode == 0, completed.stderr.decode("utf-8", "replace")
+        assert len(responses) == count + 1
+        assert sorted(results) == list(range(1, count + 1))
+        for request_id, response in results.items():
+            assert response["result"]["content"][0]["text"] == f"q{request_id}" * 100000
+        # Requests overlapped: the slowest (first) request answered last
+        assert [r["id"] for r in responses if r["id"] is not None][-1] == 1
+        assert [e["error"]["code"] for e in errors] == [-32700]
@@ -2,11 +2,13 @@
 Unit tests for Memory Service
 """
 
+import asyncio
 import pytest
 import sys
 import os
 from unittest.mock import AsyncMock
 from datetime import datetime
+import numpy as np
 
 # Add project root to path
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
@@ -15,6 +17,7 @@ sys.path.insert(0, project_root)
 from src.services.memory_service import MemoryService  # noqa: E402
 from src.config.settings import get_settings  # noqa: E402
 from src.models.memory import Memory, MemoryCreate, MemoryUpdate  # noqa: E402
+from src.utils.exceptions import MemoryServiceError  # noqa: E402
 
 
 class TestMemoryService:
@@ -298,6 +301,226 @@ class TestMemoryService:
         assert result["database_connected"] is True
         assert result["embedding_service_ready"] is True
 
+    
+    @pytest.mark.asyncio
+    async def test_search_memories_cache_exact_repeats(self, mock_memory):
+        """Test only exact repeats of a query are served from the search cache by default"""
+        # Arrange
+        service = MemoryService(get_settings())
+        service._initialized = True
+        service.embedding_service.generate_embedding = AsyncMock(
+            side_effect=[[1.0, 0.0, 0.0], [0.99, 0.05, 0.0]]
+        )
+        service.embedding_service.calculate_similarities = lambda query, embeddings: np.full(len(embeddings), 0.9)
+        service.database_service.search_memories = AsyncMock(return_value=[mock_memory])
+        
+        # Act
+        first = await service.search_memories(query="install redis", project="test_project")
+        repeat = await service.search_memories(query="install redis", project="test_project")
+        await service.search_memories(query="uninstall redis", project="test_project")
+        
+        # Assert - the repeat skips embedding and lookup, the similar query does not reuse results
+        assert [m.id for m in repeat] == [m.id for m in first]
+        assert service.embedding_service.generate_embedding.await_count == 2
+        assert service.database_service.search_memories.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_search_memories_cache_ttl(self, mock_memory, monkeypatch):
+        """Test cached searches expire after memory.search_cache_ttl, not the Redis search TTL"""
+        # Arrange
+        settings = get_settings()
+        monkeypatch.setattr(settings.memory, "search_cache_ttl", 0.0)
+        service = MemoryService(settings)
+        service._initialized = True
+        service.embedding_service.generate_embedding = AsyncMock(return_value=[1.0, 0.0, 0.0])
+        service.embedding_service.calculate_similarities = lambda query, embeddings: np.full(len(embeddings), 0.9)
+        service.database_service.search_memories = AsyncMock(return_value=[mock_memory])
+        
+        # Act
+        await service.search_memories(query="test query", project="test_project")
+        await service.search_memories(query="test query", project="test_project")
+        
+        # Assert
+        assert service.database_service.search_memories.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_search_memories_semantic_cache(self, mock_memory, monkeypatch):
+        """Test near-duplicate queries are served from the search cache when enabled"""
+        # Arrange
+        settings = get_settings()
+        monkeypatch.setattr(settings.memory, "search_cache_similarity", 0.87)
+        service = MemoryService(settings)
+        service._initialized = True
+        service.embedding_service.generate_embedding = AsyncMock(
+            side_effect=[[1.0, 0.0, 0.0], [0.99, 0.05, 0.0]]
+        )
+        service.embedding_service.calculate_similarities = lambda query, embeddings: np.full(len(embeddings), 0.9)
+        service.database_service.search_memories = AsyncMock(return_value=[mock_memory])
+        
+        # Act
+        first = await service.search_memories(query="test query", project="test_project")
+        second = await service.search_memories(query="test query?", project="test_project")
+        
+        # Assert
+        assert [m.id for m in second] == [m.id for m in first]
+        service.database_service.search_memories.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_search_memories_not_cached_across_write(self, mock_memory):
+        """Test a search overlapping a write does not cache its pre-write results"""
+        # Arrange
+        service = MemoryService(get_settings())
+        service._initialized = True
+        service.embedding_service.generate_embedding = AsyncMock(return_value=[1.0, 0.0, 0.0])
+        service.embedding_service.calculate_similarities = lambda query, embeddings: np.full(len(embeddings), 0.9)
+        
+        async def search_during_write(**kwargs):
+            service._invalidate_search_cache()
+            return [mock_memory]
+        
+        service.database_service.search_memories = AsyncMock(side_effect=search_during_write)
+        
+        # Act
+        await service.search_memories(query="test query", project="test_project")
+        await service.search_memories(query="test query", project="test_project")
+        
+        # Assert
+        assert service.database_service.search_memories.await_count == 2
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("operation", ["update", "delete"])
+    async def test_search_memories_not_cached_across_update_or_delete(self, mock_memory, operation):
+        """Test a search that reads before an update or delete commits is not served afterwards"""
+        # Arrange
+        service = MemoryService(get_settings())
+        service._initialized = True
+        service.embedding_service.generate_embedding = AsyncMock(return_value=[1.0, 0.0, 0.0])
+        service.embedding_service.calculate_similarities = lambda query, embeddings: np.full(len(embeddings), 0.9)
+        service.database_service.search_memories = AsyncMock(return_value=[mock_memory])
+        
+        async def write_overlapping_search(*args):
+            # The search reads the pre-write state while the write is still in flight
+            await service.search_memories(query="test query", project="test_project")
+            return mock_memory if operation == "update" else True
+        
+        setattr(service.database_service, f"{operation}_memory", AsyncMock(side_effect=write_overlapping_search))
+        
+        # Act
+        if operation == "update":
+            await service.update_memory(mock_memory.id, MemoryUpdate(importance=0.9))
+        else:
+            await service.delete_memory(mock_memory.id)
+        await service.search_memories(query="test query", project="test_project")
+        
+        # Assert
+        assert service.database_service.search_memories.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_search_memories_after_write_does_not_join_older_search(self, mock_memory):
+        """Test a search issued after a write does not share a search started before it"""
+        # Arrange
+        service = MemoryService(get_settings())
+        service._initialized = True
+        service.embedding_service.generate_embedding = AsyncMock(return_value=[1.0, 0.0, 0.0])
+        service.embedding_service.calculate_similarities = lambda query, embeddings: np.full(len(embeddings), 0.9)
+        release = asyncio.Event()
+        
+        async def slow_search(**kwargs):
+            await release.wait()
+            return [mock_memory]
+        
+        service.database_service.search_memories = AsyncMock(side_effect=slow_search)
+        
+        # Act
+        before = asyncio.create_task(service.search_memories(query="test query"))
+        joined = asyncio.create_task(service.search_memories(query="test query"))
+        await asyncio.sleep(0)
+        service._invalidate_search_cache()  # a write commits while the first search runs
+        after = asyncio.create_task(service.search_memories(query="test query"))
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(before, joined, after)
+        
+        # Assert - the concurrent caller joined, the post-write caller searched again
+        assert service.database_service.search_memories.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_create_memories_failure_invalidates_search_cache(self):
+        """Test a failed batched insert still invalidates cached searches"""
+        # Arrange
+        service = MemoryService(get_settings())
+        service._initialized = True
+        service.embedding_service.generate_embeddings_batch = AsyncMock(return_value=[[1.0, 0.0, 0.0]] * 2)
+        service.database_service.create_memories = AsyncMock(side_effect=RuntimeError("duplicate key"))
+        generation = service.search_cache_generation
+        
+        # Act
+        with pytest.raises(MemoryServiceError):
+            await service.create_memories([{"content": "first"}, {"content": "second"}])
+        
+        # Assert
+        assert service.search_cache_generation == generation + 1
+    
+    @pytest.mark.asyncio
+    async def test_search_memories_batch_matches_single_searches(self, monkeypatch):
+        """Test batched searches dedupe queries and match individual searches"""
+        # Arrange
+        settings = get_settings()
+        monkeypatch.setattr(settings.memory, "search_cache_size", 0)
+        service = MemoryService(settings)
+        service._initialized = True
+        
+        memories = [
+            Memory(
+                id=f"memory_{index}",
+                project="test_project",
+                content=f"Memory {index}",
+                memory_type="note",
+                importance=0.5,
+                embedding=embedding
+            )
+            for index, embedding in enumerate([
+                [1.0, 0.0, 0.0], [0.8, 0.6, 0.0], [0.6, 0.8, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]
+            ])
+        ]
+        query_vectors = {"alpha": [1.0, 0.0, 0.0], "beta": [0.0, 1.0, 0.0]}
+        service.embedding_service.generate_embeddings_batch = AsyncMock(
+            side_effect=lambda texts: [query_vectors[text] for text in texts]
+        )
+        service.embedding_service.generate_embedding = AsyncMock(side_effect=lambda text: query_vectors[text])
+        service.database_service.search_memories = AsyncMock(return_value=memories)
+        
+        queries = ["alpha", "beta", "alpha"]
+        limits = [3, 2, 1]
+        thresholds = [0.1, 0.7, 0.1]
+        
+        # Act
+        batch = await service.search_memories_batch(
+            queries, project="test_project", max_results=limits, similarity_thresholds=thresholds
+        )
+        
+        # Assert - duplicate queries share one embedding and one lookup sized for the largest limit
+        service.embedding_service.generate_embeddings_batch.assert_called_once_with(["alpha", "beta"])
+        lookups = {
+            call.kwargs["text_query"]: call.kwargs["limit"]
+            for call in service.database_service.search_memories.call_args_list
+        }
+        assert lookups == {"alpha": 6, "beta": 4}
+        
+        # Per-query limits and thresholds
+        assert [m.id for m in batch[0]] == ["memory_0", "memory_1", "memory_2"]
+        assert [m.id for m in batch[1]] == ["memory_3", "memory_2"]
+        assert [m.id for m in batch[2]] == ["memory_0"]
+        
+        # Same results as one search_memories call per query
+        for query, limit, threshold, results in zip(queries, limits, thresholds, batch):
+            single = await service.search_memories(
+                query=query, project="test_project", max_results=limit, similarity_threshold=threshold
+            )
+            assert [m.id for m in results] == [m.id for m in single]
+            assert [m.similarity_score for m in results] == pytest.approx([m.similarity_score for m in single])
+        assert await service.search_memories_batch([]) == []
+
 
 if __name__ == "__main__":
     pytest.main([__file__]) 
\ No newline at end of file